@@ -8,3 +8,8 @@ class ApiConfig(AppConfig):
 
     def ready(self):
         import api.services.signals  # noqa: F401
+        from prometheus_client import REGISTRY
+
+        from .collectors import register_collectors
+
+        register_collectors(REGISTRY)
@@ -0,0 +1,279 @@
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.translation import gettext as _
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.request import Request
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import (
+    AuthenticationFailed,
+    InvalidToken,
+    TokenError,
+)
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken, Token
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from .roles import role_claims, role_related, roles_from_claims
+from .services.token_blacklist import token_blacklist
+from .utils.lazy import LazyInstance
+
+logger = logging.getLogger(__name__)
+
+# Claim holding when the role claims were read, in milliseconds
+ROLES_AT_CLAIM = "roles_at"
+
+
+def _now_ms() -> int:
+    return time.time_ns() // 1_000_000
+
+
+class BlacklistRefreshToken(RefreshToken):
+    """
+    Refresh token blacklisted in the shared cache instead of the
+    token_blacklist tables.
+
+    No outstanding token rows are written. Until ``purge_token_blacklist``
+    has moved the existing rows to the cache, ``JWT_BLACKLIST_DB_FALLBACK``
+    keeps rejecting tokens blacklisted in the database.
+    """
+
+    def verify(self, *args, **kwargs) -> None:
+        self.check_blacklist()
+        # Skip the database lookup of BlacklistMixin.verify
+        Token.verify(self, *args, **kwargs)
+
+    def check_blacklist(self) -> None:
+        jti = self.payload[api_settings.JTI_CLAIM]
+        if token_blacklist.contains(jti) or self._blacklisted_in_db(jti):
+            raise TokenError(_("Token is blacklisted"))
+
+    # No BlacklistedToken row exists to return
+    def blacklist(self) -> None:  # type: ignore[override]
+        token_blacklist.add(self.payload[api_settings.JTI_CLAIM], self.payload["exp"])
+
+    def outstand(self) -> None:
+        return None
+
+    @classmethod
+    def for_user(cls, user: Any) -> "BlacklistRefreshToken":
+        # Token.for_user, without the outstanding token row
+        for_user = Token.for_user.__func__  # type: ignore[attr-defined]
+        token: BlacklistRefreshToken = for_user(cls, user)
+        return token
+
+    @staticmethod
+    def _blacklisted_in_db(jti: str) -> bool:
+        if not (
+            settings.JWT_BLACKLIST_DB_FALLBACK
+            and apps.is_installed("rest_framework_simplejwt.token_blacklist")
+        ):
+            return False
+
+        from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+        return BlacklistedToken.objects.filter(token__jti=jti).exists()
+
+
+def add_role_claims(access: AccessToken, user: Any) -> AccessToken:
+    """Store the current roles of ``user`` in an access token"""
+    access[ROLES_AT_CLAIM] = _now_ms()
+    for claim, value in role_claims(user).items():
+        access[claim] = value
+    # Most tokens are checked soon after they are issued, see claims_are_current
+    _cache_roles_changed(user.pk, _to_ms(user.roles_changed_at), add=True)
+    return access
+
+
+def access_token_for(refresh: RefreshToken, user: Any) -> AccessToken:
+    """Access token for ``refresh`` carrying the current roles of ``user``"""
+    return add_role_claims(refresh.access_token, user)
+
+
+def _roles_changed_key(user_id: Any) -> str:
+    return f"auth:roles-changed:{user_id}"
+
+
+def _to_ms(value: Optional[datetime]) -> int:
+    """Milliseconds of ``User.roles_changed_at``, 0 when never changed"""
+    return 0 if value is None else round(value.timestamp() * 1000)
+
+
+def _cache_roles_changed(user_id: Any, changed_at: int, add: bool = False) -> None:
+    lifetime = int(api_settings.ACCESS_TOKEN_LIFETIME.total_seconds())
+    key = _roles_changed_key(user_id)
+    try:
+        if add:
+            cache.add(key, changed_at, lifetime)
+        else:
+            cache.set(key, changed_at, lifetime)
+    except Exception as exc:
+        logger.warning("Failed to cache role change of %s: %s", user_id, exc)
+
+
+def _mark(user_id: Any) -> None:
+    changed_at = _now_ms()
+    get_user_model().objects.filter(pk=user_id).update(
+        roles_changed_at=datetime.fromtimestamp(changed_at / 1000, tz=timezone.utc)
+    )
+    _cache_roles_changed(user_id, changed_at)
+
+
+def mark_roles_changed(user_id: Any) -> None:
+    """
+    Stop trusting the role claims of access tokens issued to a user so far.
+
+    The time is stored in ``User.roles_changed_at`` and copied to the shared
+    cache, so losing the cache entry never makes old claims current again.
+    Requests with such tokens authenticate against the database until the
+    tokens expire. Also runs again on commit, so a token issued from the
+    uncommitted roles in between is not trusted either.
+    """
+    _mark(user_id)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: _mark(user_id))
+
+
+def _roles_changed_at(user_id: Any) -> Optional[int]:
+    """
+    When the roles of the user last changed, from the shared cache, or from
+    the user row when the entry is missing or was evicted. None when the
+    user no longer exists.
+    """
+    changed_at: Optional[int] = cache.get(_roles_changed_key(user_id))
+    if changed_at is not None:
+        return changed_at
+    row = get_user_model().objects.filter(pk=user_id).values("roles_changed_at")
+    stored = row.first()
+    if stored is None:
+        return None
+    changed_at = _to_ms(stored["roles_changed_at"])
+    # add, so a concurrent mark_roles_changed() is not overwritten
+    _cache_roles_changed(user_id, changed_at, add=True)
+    return changed_at
+
+
+def claims_are_current(validated_token: Token) -> bool:
+    """Whether the role claims of a token were read after the last role change"""
+    roles_at = validated_token.get(ROLES_AT_CLAIM)
+    if roles_at is None:
+        return False
+    try:
+        changed_at = _roles_changed_at(validated_token[api_settings.USER_ID_CLAIM])
+    except Exception as exc:
+        logger.warning("Failed to read role changes: %s", exc)
+        return False
+    return changed_at is not None and roles_at > changed_at
+
+
+class ClaimsUser(LazyInstance):
+    """
+    User authenticated from token claims.
+
+    The primary key, staff flags and roles come from the token. The user
+    row, with its role profiles, is only loaded when another attribute is
+    touched.
+    """
+
+    def __init__(self, validated_token: Token) -> None:
+        User = get_user_model()
+        user_id = User._meta.pk.to_python(validated_token[api_settings.USER_ID_CLAIM])
+        super().__init__(
+            User,
+            user_id,
+            {
+                "is_authenticated": True,
+                "is_anonymous": False,
+                # Deactivation marks the roles changed, see mark_roles_changed
+                "is_active": True,
+                "is_staff": validated_token.get("is_staff", False),
+                "is_superuser": validated_token.get("is_superuser", False),
+            },
+            loader=lambda: self._load(user_id),
+        )
+        self.set_known(
+            "claimed_roles", roles_from_claims(self, validated_token.payload)
+        )
+
+    @staticmethod
+    def _load(user_id: Any) -> Any:
+        User = get_user_model()
+        try:
+            user = User.objects.select_related(*role_related()).get(pk=user_id)
+        except User.DoesNotExist as e:
+            raise AuthenticationFailed(
+                _("User not found"), code="user_not_found"
+            ) from e
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        return user
+
+
+class RoleJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication loading the user and all of its role profiles in one
+    query, so permission checks and ``get_roles`` do not query again.
+
+    With ``JWT_STATELESS_READS`` on, read-only requests whose token carries
+    current role claims authenticate without any query, as a ``ClaimsUser``.
+    """
+
+    def authenticate(self, request: Request) -> Optional[tuple[Any, Token]]:
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        if self.trusts_claims(request, validated_token):
+            return ClaimsUser(validated_token), validated_token
+        return self.get_user(validated_token), validated_token
+
+    def trusts_claims(self, request: Request, validated_token: Token) -> bool:
+        return (
+            settings.JWT_STATELESS_READS
+            and request.method in SAFE_METHODS
+            # Revocation on password change needs the user row
+            and not api_settings.CHECK_REVOKE_TOKEN
+            and claims_are_current(validated_token)
+        )
+
+    def get_user(self, validated_token: Token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(
+                _("Token contained no recognizable user identification")
+            ) from e
+
+        try:
+            user = self.user_model.objects.select_related(*role_related()).get(
+                **{api_settings.USER_ID_FIELD: user_id}
+            )
+        except self.user_model.DoesNotExist as e:
+            raise AuthenticationFailed(
+                _("User not found"), code="user_not_found"
+            ) from e
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(
+                api_settings.REVOKE_TOKEN_CLAIM
+            ) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(
+                    _("The user's password has been changed."), code="password_changed"
+                )
+
+        return user
@@ -0,0 +1,341 @@
+import logging
+import threading
+import time
+from datetime import timedelta
+from typing import Iterable, Optional
+
+from django.conf import settings
+from django.db import DatabaseError, connection, transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import CollectorRegistry
+
+from .models import Appointment, Hospital, Slot
+from .services.mail import oldest_pending_age, queue_depth
+
+logger = logging.getLogger(__name__)
+
+# Label value used for everything outside of the top-K
+OTHER = "other"
+
+
+class CachedCollector:
+    """
+    Base class for collectors computed from the database at scrape time.
+
+    The metric families are rebuilt at most once per refresh interval and
+    shared by every scrape in between, so Prometheus scrapes never turn into
+    a query per scrape. Each query of a refresh is bounded by
+    METRICS_SCRAPE_BUDGET_MS, and when a refresh fails or runs out of budget
+    the previous families are served again.
+
+    Subclasses implement ``describe`` with empty families (so registering
+    the collector does not query the database) and ``build``.
+    """
+
+    def __init__(self, refresh_interval: Optional[float] = None) -> None:
+        self._refresh_interval = refresh_interval
+        self._lock = threading.Lock()
+        self._families: Optional[list[GaugeMetricFamily]] = None
+        self._refreshed_at = 0.0
+
+    @property
+    def refresh_interval(self) -> float:
+        if self._refresh_interval is not None:
+            return self._refresh_interval
+        return float(settings.METRICS_REFRESH_SECONDS)
+
+    def describe(self) -> Iterable[GaugeMetricFamily]:
+        raise NotImplementedError
+
+    def build(self) -> Iterable[GaugeMetricFamily]:
+        raise NotImplementedError
+
+    def is_stale(self) -> bool:
+        return (
+            self._families is None
+            or time.monotonic() - self._refreshed_at >= self.refresh_interval
+        )
+
+    def invalidate(self) -> None:
+        self._families = None
+
+    def collect(self) -> Iterable[GaugeMetricFamily]:
+        if self.is_stale():
+            with self._lock:
+                # Another scrape may have refreshed while we waited
+                if self.is_stale():
+                    self._refresh()
+        return list(self._families or [])
+
+    def _refresh(self) -> None:
+        try:
+            self._families = self._build_within_budget()
+        except DatabaseError:
+            logger.exception("Failed to refresh %s", type(self).__name__)
+            if self._families is None:
+                return
+        self._refreshed_at = time.monotonic()
+
+    def _build_within_budget(self) -> list[GaugeMetricFamily]:
+        budget_ms = settings.METRICS_SCRAPE_BUDGET_MS
+        use_timeout = bool(budget_ms) and connection.vendor == "postgresql"
+        started = time.monotonic()
+
+        with transaction.atomic():
+            if use_timeout:
+                self._set_statement_timeout(str(budget_ms))
+            families = list(self.build())
+            if use_timeout:
+                self._set_statement_timeout("0")
+
+        elapsed_ms = (time.monotonic() - started) * 1000
+        if budget_ms and elapsed_ms > budget_ms:
+            logger.warning(
+                "%s refresh took %.0fms (budget %sms)",
+                type(self).__name__,
+                elapsed_ms,
+                budget_ms,
+            )
+        return families
+
+    @staticmethod
+    def _set_statement_timeout(value: str) -> None:
+        # Scoped to the surrounding transaction
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT set_config('statement_timeout', %s, true)", [value])
+
+
+class ProviderStatsCollector(CachedCollector):
+    """
+    Appointment counts per provider and per hospital.
+
+    Only the top-K providers and hospitals by appointment count get their own
+    series, the rest are summed into a single ``other`` series, so the number
+    of time series stays bounded as providers are added.
+    """
+
+    def __init__(
+        self,
+        refresh_interval: Optional[float] = None,
+        top_k: Optional[int] = None,
+    ) -> None:
+        super().__init__(refresh_interval)
+        self._top_k = top_k
+
+    @property
+    def top_k(self) -> int:
+        if self._top_k is not None:
+            return self._top_k
+        return int(settings.METRICS_PROVIDER_TOP_K)
+
+    def describe(self) -> Iterable[GaugeMetricFamily]:
+        return [self._provider_family(), self._hospital_family()]
+
+    def build(self) -> Iterable[GaugeMetricFamily]:
+        total = Appointment.objects.count()
+
+        providers = self._provider_family()
+        top_providers = (
+            Appointment.objects.values(
+                "healthcare_provider_id", "healthcare_provider__speciality__name"
+            )
+            .annotate(total=Count("id"))
+            .order_by("-total", "healthcare_provider_id")[: self.top_k]
+        )
+        remaining = total
+        for row in top_providers:
+            providers.add_metric(
+                [
+                    str(row["healthcare_provider_id"]),
+                    row["healthcare_provider__speciality__name"] or "",
+                ],
+                row["total"],
+            )
+            remaining -= row["total"]
+        providers.add_metric([OTHER, OTHER], remaining)
+
+        hospitals = self._hospital_family()
+        top_hospitals = (
+            Appointment.objects.values(
+                "location_id", "location__city", "location__state"
+            )
+            .annotate(total=Count("id"))
+            .order_by("-total", "location_id")[: self.top_k]
+        )
+        remaining = total
+        for row in top_hospitals:
+            hospitals.add_metric(
+                [
+                    str(row["location_id"]),
+                    row["location__city"],
+                    row["location__state"],
+                ],
+                row["total"],
+            )
+            remaining -= row["total"]
+        hospitals.add_metric([OTHER, OTHER, OTHER], remaining)
+
+        return [providers, hospitals]
+
+    @staticmethod
+    def _provider_family() -> GaugeMetricFamily:
+        return GaugeMetricFamily(
+            "provider_appointment_count",
+            "Appointments per provider (top-K, rest summed as 'other')",
+            labels=["provider_id", "speciality_name"],
+        )
+
+    @staticmethod
+    def _hospital_family() -> GaugeMetricFamily:
+        return GaugeMetricFamily(
+            "hospital_appointment_count",
+            "Appointments per hospital (top-K, rest summed as 'other')",
+            labels=["hospital_id", "city", "state"],
+        )
+
+
+class BusinessGaugesCollector(CachedCollector):
+    """
+    Current state of the booking pipeline, read from the database.
+
+    Unlike the lifecycle counters these are true gauges, so they survive
+    deploys and worker restarts.
+    """
+
+    window = timedelta(days=7)
+
+    def describe(self) -> Iterable[GaugeMetricFamily]:
+        return [
+            self._open_requested_family(),
+            self._free_slots_family(),
+            self._utilization_family(),
+        ]
+
+    def build(self) -> Iterable[GaugeMetricFamily]:
+        now = timezone.now()
+        upcoming = Slot.objects.filter(start__gte=now, start__lt=now + self.window)
+
+        open_requested = self._open_requested_family()
+        open_requested.add_metric(
+            [],
+            Appointment.objects.filter(
+                status=Appointment.Status.REQUESTED, cancelled_at__isnull=True
+            ).count(),
+        )
+
+        # Every hospital gets a series, so one without free slots reports 0
+        # instead of disappearing
+        free_slots = self._free_slots_family()
+        for hospital_id, free in (
+            Hospital.objects.filter(is_removed=False)
+            .annotate(
+                free=Count(
+                    "slots",
+                    filter=Q(
+                        slots__status=Slot.Status.FREE,
+                        slots__start__gte=now,
+                        slots__start__lt=now + self.window,
+                    ),
+                )
+            )
+            .order_by("id")
+            .values_list("id", "free")
+        ):
+            free_slots.add_metric([str(hospital_id)], free)
+
+        utilization = self._utilization_family()
+        for row in (
+            upcoming.values("healthcare_provider__speciality__name")
+            .annotate(
+                booked=Count("id", filter=Q(status=Slot.Status.BOOKED)),
+                free=Count("id", filter=Q(status=Slot.Status.FREE)),
+            )
+            .order_by("healthcare_provider__speciality__name")
+        ):
+            bookable = row["booked"] + row["free"]
+            if not bookable:
+                continue
+            utilization.add_metric(
+                [row["healthcare_provider__speciality__name"] or ""],
+                row["booked"] / bookable,
+            )
+
+        return [open_requested, free_slots, utilization]
+
+    @staticmethod
+    def _open_requested_family() -> GaugeMetricFamily:
+        return GaugeMetricFamily(
+            "appointments_open_requested",
+            "Appointments waiting for confirmation",
+        )
+
+    @staticmethod
+    def _free_slots_family() -> GaugeMetricFamily:
+        return GaugeMetricFamily(
+            "slots_free_next_7d",
+            "Free slots starting in the next 7 days per hospital",
+            labels=["hospital_id"],
+        )
+
+    @staticmethod
+    def _utilization_family() -> GaugeMetricFamily:
+        return GaugeMetricFamily(
+            "speciality_utilization_ratio",
+            "Booked share of bookable slots in the next 7 days per speciality",
+            labels=["speciality_name"],
+        )
+
+
+class EmailQueueCollector(CachedCollector):
+    """
+    Depth of the outbound email queue drained by send_queued_email.
+    """
+
+    def describe(self) -> Iterable[GaugeMetricFamily]:
+        return [self._depth_family(), self._oldest_family()]
+
+    def build(self) -> Iterable[GaugeMetricFamily]:
+        depth = self._depth_family()
+        for status, total in queue_depth().items():
+            depth.add_metric([status], total)
+
+        oldest = self._oldest_family()
+        oldest.add_metric([], oldest_pending_age())
+
+        return [depth, oldest]
+
+    @staticmethod
+    def _depth_family() -> GaugeMetricFamily:
+        return GaugeMetricFamily(
+            "email_queue_depth",
+            "Queued emails per status",
+            labels=["status"],
+        )
+
+    @staticmethod
+    def _oldest_family() -> GaugeMetricFamily:
+        return GaugeMetricFamily(
+            "email_queue_oldest_pending_seconds",
+            "Age of the oldest email waiting to be sent",
+        )
+
+
+provider_stats = ProviderStatsCollector()
+business_gauges = BusinessGaugesCollector()
+email_queue = EmailQueueCollector()
+
+SCRAPE_COLLECTORS: list[CachedCollector] = [
+    provider_stats,
+    business_gauges,
+    email_queue,
+]
+
+
+def register_collectors(registry: CollectorRegistry) -> None:
+    """
+    Register the scrape-time collectors on a registry.
+    """
+    for collector in SCRAPE_COLLECTORS:
+        registry.register(collector)
@@ -0,0 +1,22 @@
+from django.db.models import QuerySet
+from rest_framework.filters import SearchFilter
+from rest_framework.request import Request
+
+from .services.search import ranked_search
+
+
+class RankedSearchFilter(SearchFilter):
+    """
+    The ``search`` parameter matched against the view's GIN-indexed
+    ``search_vector_field`` rather than ``icontains`` over ``search_fields``.
+
+    Matches are annotated with ``search_rank``; KeysetPagination then pages
+    them best first instead of in its usual order.
+    """
+
+    def filter_queryset(self, request: Request, queryset: QuerySet, view) -> QuerySet:
+        terms = self.get_search_terms(request)
+        if not terms:
+            return queryset
+        field = getattr(view, "search_vector_field", "search_vector")
+        return ranked_search(queryset, terms, field=field)
@@ -0,0 +1,67 @@
+from django.core.management.base import BaseCommand, CommandParser
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+from rest_framework_simplejwt.utils import aware_utcnow, datetime_to_epoch
+
+from api.services.token_blacklist import token_blacklist
+
+
+class Command(BaseCommand):
+    help = (
+        "Move still valid blacklisted refresh tokens to the cache blacklist and "
+        "empty the token_blacklist tables"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Rows deleted per statement (default: 5000)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report what would be copied and deleted",
+        )
+
+    def handle(self, *args, **options):
+        now = aware_utcnow()
+        valid = BlacklistedToken.objects.filter(token__expires_at__gt=now).values_list(
+            "token__jti", "token__expires_at"
+        )
+
+        if options["dry_run"]:
+            self.stdout.write(
+                f"Would copy {valid.count()} blacklisted tokens and delete "
+                f"{OutstandingToken.objects.count()} outstanding tokens"
+            )
+            return
+
+        copied = token_blacklist.add_many(
+            (jti, datetime_to_epoch(expires_at)) for jti, expires_at in valid.iterator()
+        )
+        deleted = self.delete_outstanding(options["batch_size"])
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Copied {copied} blacklisted tokens to the cache, "
+                f"deleted {deleted} outstanding tokens"
+            )
+        )
+
+    @staticmethod
+    def delete_outstanding(batch_size: int) -> int:
+        """Delete outstanding tokens, and their blacklist rows, in batches"""
+        deleted = 0
+        while True:
+            ids = list(
+                OutstandingToken.objects.values_list("id", flat=True)[:batch_size]
+            )
+            if not ids:
+                return deleted
+            BlacklistedToken.objects.filter(token_id__in=ids).delete()
+            OutstandingToken.objects.filter(id__in=ids).delete()
+            deleted += len(ids)
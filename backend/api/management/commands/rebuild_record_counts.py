@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from api.services.record_counts import rebuild_counts
+
+
+class Command(BaseCommand):
+    help = (
+        "Recount the per-patient and per-provider medical record counts, e.g. "
+        "after running with MEDICAL_RECORD_COUNTERS off"
+    )
+
+    def handle(self, *args, **options):
+        rows = rebuild_counts()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} medical record counts"))
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from api.services.record_detail import refresh_stale_details
+
+
+class Command(BaseCommand):
+    help = (
+        "Store the detail payload of medical records that have none, e.g. "
+        "after a change shared by more than MEDICAL_RECORD_DETAIL_REFRESH_LIMIT "
+        "records"
+    )
+
+    def handle(self, *args, **options):
+        rows = refresh_stale_details()
+        self.stdout.write(
+            self.style.SUCCESS(f"Refreshed {rows} medical record details")
+        )
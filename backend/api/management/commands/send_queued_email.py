@@ -0,0 +1,59 @@
+import logging
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import DatabaseError, connection
+
+from api.services.mail import EmailQueueWorker
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Send queued emails over a reused SMTP connection"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.EMAIL_QUEUE_BATCH_SIZE,
+            help="Emails claimed per transaction "
+            f"(default: {settings.EMAIL_QUEUE_BATCH_SIZE})",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Send every due email and exit instead of polling",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=settings.EMAIL_QUEUE_POLL_SECONDS,
+            help="Seconds to wait when the queue is empty "
+            f"(default: {settings.EMAIL_QUEUE_POLL_SECONDS})",
+        )
+
+    def handle(self, *args, **options):
+        with EmailQueueWorker(batch_size=options["batch_size"]) as worker:
+            if options["once"]:
+                sent = worker.drain()
+                self.stdout.write(self.style.SUCCESS(f"Processed {sent} emails"))
+                return
+
+            self.stdout.write("Waiting for queued emails")
+            try:
+                while True:
+                    try:
+                        processed = worker.drain()
+                    except DatabaseError:
+                        # Keep polling through database restarts
+                        logger.exception("Failed to read the email queue")
+                        connection.close()
+                        processed = 0
+                    if not processed:
+                        # Idle servers drop connections, reopen on demand
+                        worker.close()
+                        time.sleep(options["interval"])
+            except KeyboardInterrupt:
+                pass
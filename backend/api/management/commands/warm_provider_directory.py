@@ -0,0 +1,42 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+
+from api.services.provider_directory import warm_directory
+
+
+class Command(BaseCommand):
+    help = "Render the cached provider directory pages, e.g. after a deploy"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--host",
+            default=None,
+            help="Public host of the API used in image URLs "
+            "(default: first entry of ALLOWED_HOSTS, or localhost:8000)",
+        )
+        parser.add_argument(
+            "--insecure",
+            action="store_true",
+            help="Render http instead of https URLs",
+        )
+        parser.add_argument(
+            "--specialities",
+            type=int,
+            default=settings.PROVIDER_DIRECTORY_WARM_SPECIALITIES,
+            help="Number of top specialities to warm "
+            f"(default: {settings.PROVIDER_DIRECTORY_WARM_SPECIALITIES})",
+        )
+
+    def handle(self, *args, **options):
+        host = options["host"] or self.default_host()
+        pages = warm_directory(
+            host, secure=not options["insecure"], limit=options["specialities"]
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"Warmed {pages} provider directory pages for {host}")
+        )
+
+    @staticmethod
+    def default_host() -> str:
+        hosts = [host for host in settings.ALLOWED_HOSTS if host not in ("*", "")]
+        return hosts[0].lstrip(".") if hosts else "localhost:8000"
@@ -1,4 +1,6 @@
-from prometheus_client import Counter, Histogram
+import os
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, Histogram
+from prometheus_client import multiprocess
 
 # =============================================================================
 # APPOINTMENT METRICS
@@ -65,7 +67,9 @@ slots_generated_total = Counter(
 # PROVIDER METRICS
 # =============================================================================
 
-# Provider performance
+# Provider performance. Labelled per provider, so it is only incremented when
+# METRICS_RAW_PROVIDER_COUNTERS is enabled. The bounded
+# provider_appointment_count gauge from api.collectors replaces it.
 provider_appointments_total = Counter(
     "provider_appointments_total",
     "Total appointments per provider",
@@ -87,6 +91,8 @@ patients_registered_total = Counter(
 # HOSPITAL METRICS
 # =============================================================================
 
+# Only incremented when METRICS_RAW_PROVIDER_COUNTERS is enabled, see
+# hospital_appointment_count in api.collectors
 hospital_appointments_total = Counter(
     "hospital_appointments_total",
     "Total appointments per hospital",
@@ -111,6 +117,128 @@ cancellation_lead_time_hours = Histogram(
 )
 
 
+# =============================================================================
+# REQUEST PROFILING METRICS
+# =============================================================================
+
+# Recorded by api.middleware.RequestProfilingMiddleware per resolved route and
+# viewset action
+request_db_queries = Histogram(
+    "request_db_queries",
+    "Number of SQL queries per request",
+    ["view", "action"],
+    buckets=[0, 1, 2, 5, 10, 20, 50, 100, 200],
+)
+
+request_db_seconds = Histogram(
+    "request_db_seconds",
+    "Time spent in SQL queries per request",
+    ["view", "action"],
+    buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5],
+)
+
+request_serializer_seconds = Histogram(
+    "request_serializer_seconds",
+    "Time spent in serializer to_representation per request",
+    ["view", "action"],
+    buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5],
+)
+
+request_case_conversion_seconds = Histogram(
+    "request_case_conversion_seconds",
+    "Time spent converting between snake_case and camelCase per request",
+    ["view", "action"],
+    buckets=[0.0001, 0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25],
+)
+
+
+# =============================================================================
+# CACHE METRICS
+# =============================================================================
+
+# Recorded by api.utils.cache.TieredCache, labelled by cache namespace
+cache_requests_total = Counter(
+    "cache_requests_total",
+    "Cache lookups per tier and result",
+    ["cache", "tier", "result"],
+)
+
+cache_load_seconds = Histogram(
+    "cache_load_seconds",
+    "Time spent computing values on a cache miss",
+    ["cache"],
+    buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5],
+)
+
+cache_shared_seconds = Histogram(
+    "cache_shared_seconds",
+    "Round trip time of shared cache (Redis) operations",
+    ["cache", "operation"],
+    buckets=[0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1],
+)
+
+
+# =============================================================================
+# AUTH METRICS
+# =============================================================================
+
+# Login outcomes: success, invalid, inactive or throttled
+login_attempts_total = Counter(
+    "login_attempts_total",
+    "Login attempts by outcome",
+    ["result"],
+)
+
+
+# =============================================================================
+# EMAIL METRICS
+# =============================================================================
+
+# Delivery attempts by the send_queued_email worker: sent, retry or failed.
+# Queue depth is exported at scrape time by api.collectors.EmailQueueCollector
+emails_sent_total = Counter(
+    "emails_sent_total",
+    "Queued email delivery attempts by outcome",
+    ["result"],
+)
+
+
+# =============================================================================
+# REGISTRY
+# =============================================================================
+
+
+def multiprocess_dir() -> str | None:
+    """
+    Directory shared by gunicorn workers for their mmap metric files, or None
+    when running in a single process.
+    """
+    return os.environ.get("PROMETHEUS_MULTIPROC_DIR") or os.environ.get(
+        "prometheus_multiproc_dir"
+    )
+
+
+def get_registry() -> CollectorRegistry:
+    """
+    Registry to expose on /metrics.
+
+    With several gunicorn workers each one writes its samples to the shared
+    multiprocess directory, and a fresh registry aggregates all of them on
+    every scrape. Otherwise the default in-process registry is used.
+    """
+    if not multiprocess_dir():
+        return REGISTRY
+
+    # Scrape-time collectors read the database, so they are added once here
+    # instead of being summed over workers
+    from .collectors import register_collectors
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    register_collectors(registry)
+    return registry
+
+
 # =============================================================================
 # HEALTHCARE-SPECIFIC ALERTS (for Prometheus AlertManager)
 # =============================================================================
@@ -124,9 +252,27 @@ ALERTS = {
         "description": "Cancellation rate >20% in the last hour",
     },
     "AppointmentBacklog": {
-        "expr": "appointments_created_total - appointments_completed_total > 100",
+        "expr": "appointments_open_requested > 100",
         "for": "6h",
         "severity": "warning",
         "description": "More than 100 pending appointments",
     },
+    "LoginThrottling": {
+        "expr": 'rate(login_attempts_total{result="throttled"}[5m]) > 1',
+        "for": "10m",
+        "severity": "warning",
+        "description": "Sustained throttled logins, possible credential stuffing",
+    },
+    "EmailQueueStuck": {
+        "expr": "email_queue_oldest_pending_seconds > 900",
+        "for": "10m",
+        "severity": "warning",
+        "description": "Queued emails waiting for more than 15 minutes",
+    },
+    "LowFreeCapacity": {
+        "expr": "slots_free_next_7d < 10",
+        "for": "6h",
+        "severity": "warning",
+        "description": "Fewer than 10 free slots left in the next 7 days at a hospital",
+    },
 }
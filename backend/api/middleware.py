@@ -0,0 +1,96 @@
+import logging
+from contextlib import ExitStack
+from typing import Callable
+
+from django.conf import settings
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+
+from .metrics import (
+    request_case_conversion_seconds,
+    request_db_queries,
+    request_db_seconds,
+    request_serializer_seconds,
+)
+from .utils.profiling import RequestProfile, profile_request
+from .utils.queries import inspect_queries
+
+logger = logging.getLogger(__name__)
+
+UNRESOLVED = "<unresolved>"
+
+
+class RequestProfilingMiddleware:
+    """
+    Record query count, DB time and serialization time per route and action.
+
+    Routes are labelled with their URL name and viewset action (or HTTP method
+    for plain views), so the number of series is bounded by the URL conf.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if not settings.METRICS_REQUEST_PROFILING:
+            return self.get_response(request)
+
+        with profile_request() as profile, ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(profile.record_query))
+            response = self.get_response(request)
+
+        self.observe(request, profile)
+        if settings.METRICS_SERVER_TIMING_HEADER:
+            response["Server-Timing"] = profile.server_timing()
+        return response
+
+    @staticmethod
+    def route_labels(request: HttpRequest) -> dict[str, str]:
+        method = (request.method or "").lower()
+        match = getattr(request, "resolver_match", None)
+        if match is None:
+            return {"view": UNRESOLVED, "action": method}
+
+        # ViewSet.as_view() exposes the method -> action mapping
+        actions = getattr(match.func, "actions", None) or {}
+        return {
+            "view": match.view_name or match.route,
+            "action": actions.get(method, method),
+        }
+
+    def observe(self, request: HttpRequest, profile: RequestProfile) -> None:
+        labels = self.route_labels(request)
+        request_db_queries.labels(**labels).observe(profile.queries)
+        request_db_seconds.labels(**labels).observe(profile.db_time)
+        request_serializer_seconds.labels(**labels).observe(profile.serializer_time)
+        request_case_conversion_seconds.labels(**labels).observe(
+            profile.case_conversion_time
+        )
+
+
+class QueryInspectorMiddleware:
+    """
+    Log repeated query shapes (likely N+1) and slow queries per request.
+
+    Meant for development, enabled with QUERY_INSPECTOR_ENABLED.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if not settings.QUERY_INSPECTOR_ENABLED:
+            return self.get_response(request)
+
+        with inspect_queries() as inspector:
+            response = self.get_response(request)
+
+        if inspector.repeated:
+            logger.warning(
+                "Repeated queries in %s %s:\n%s",
+                request.method,
+                request.path,
+                inspector.report(),
+            )
+        return response
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0002_outbound_email"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="appointment",
+            index=models.Index(
+                fields=["patient", "-appointment_start_datetime_utc", "-id"],
+                name="appointment_patient_page_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="appointment",
+            index=models.Index(
+                fields=[
+                    "healthcare_provider",
+                    "-appointment_start_datetime_utc",
+                    "-id",
+                ],
+                name="appointment_provider_page_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="appointment",
+            index=models.Index(
+                fields=["-appointment_start_datetime_utc", "-id"],
+                name="appointment_page_idx",
+            ),
+        ),
+    ]
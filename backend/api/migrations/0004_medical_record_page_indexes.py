@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0003_appointment_page_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="medicalrecord",
+            index=models.Index(
+                condition=models.Q(("is_removed", False)),
+                fields=["patient", "-created_at", "-id"],
+                name="medicalrecord_patient_page_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="medicalrecord",
+            index=models.Index(
+                condition=models.Q(("is_removed", False)),
+                fields=["healthcare_provider", "-created_at", "-id"],
+                name="medicalrecord_prov_page_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="medicalrecord",
+            index=models.Index(
+                condition=models.Q(("is_removed", False)),
+                fields=["-created_at", "-id"],
+                name="medicalrecord_page_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="medicalrecord",
+            index=models.Index(
+                condition=models.Q(("is_removed", True)),
+                fields=["-created_at", "-id"],
+                name="medicalrecord_removed_page_idx",
+            ),
+        ),
+    ]
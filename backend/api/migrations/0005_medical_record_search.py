@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:58
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_search_vectors(apps, schema_editor):
+    # A frozen copy of api.services.search.medical_record_vector(), so later
+    # changes to the live document don't rewrite this migration
+    MedicalRecord = apps.get_model("api", "MedicalRecord")
+    vector = (
+        SearchVector(
+            "diagnosis",
+            "patient__user__first_name",
+            "patient__user__last_name",
+            "healthcare_provider__user__first_name",
+            "healthcare_provider__user__last_name",
+            weight="A",
+            config="english",
+        )
+        + SearchVector("prescriptions", weight="B", config="english")
+        + SearchVector("hospital__name", weight="C", config="english")
+        + SearchVector("notes", weight="D", config="english")
+    )
+    document = (
+        MedicalRecord.objects.filter(pk=OuterRef("pk"))
+        .annotate(document=vector)
+        .values("document")[:1]
+    )
+    MedicalRecord.objects.update(search_vector=Subquery(document))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0004_medical_record_page_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="medicalrecord",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="medicalrecord",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="medicalrecord_search_idx"
+            ),
+        ),
+        migrations.RunPython(backfill_search_vectors, migrations.RunPython.noop),
+    ]
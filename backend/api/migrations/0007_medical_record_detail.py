@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:35
+
+import rest_framework.utils.encoders
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0006_user_name_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="medicalrecord",
+            name="detail",
+            field=models.JSONField(
+                editable=False,
+                encoder=rest_framework.utils.encoders.JSONEncoder,
+                null=True,
+            ),
+        ),
+    ]
@@ -0,0 +1,97 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, DateField
+from django.db.models.functions import TruncMonth
+
+
+def count_records(apps, schema_editor):
+    MedicalRecord = apps.get_model("api", "MedicalRecord")
+    MedicalRecordCount = apps.get_model("api", "MedicalRecordCount")
+    records = MedicalRecord.objects.filter(is_removed=False).order_by()
+    month = TruncMonth("created_at", output_field=DateField())
+    for owner in ("patient_id", "healthcare_provider_id"):
+        MedicalRecordCount.objects.bulk_create(
+            (
+                MedicalRecordCount(**row)
+                for row in records.values(owner, "hospital_id", month=month).annotate(
+                    records=Count("id")
+                )
+            ),
+            batch_size=1000,
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0007_medical_record_detail"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MedicalRecordCount",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("month", models.DateField()),
+                ("records", models.IntegerField(default=0)),
+                (
+                    "healthcare_provider",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="api.healthcareprovider",
+                    ),
+                ),
+                (
+                    "hospital",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="api.hospital",
+                    ),
+                ),
+                (
+                    "patient",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="api.patient",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.CheckConstraint(
+                        condition=models.Q(
+                            ("patient__isnull", True),
+                            ("healthcare_provider__isnull", True),
+                            _connector="XOR",
+                        ),
+                        name="recordcount_one_owner",
+                    ),
+                    models.UniqueConstraint(
+                        condition=models.Q(("patient__isnull", False)),
+                        fields=("patient", "hospital", "month"),
+                        name="recordcount_patient_unique",
+                    ),
+                    models.UniqueConstraint(
+                        condition=models.Q(("healthcare_provider__isnull", False)),
+                        fields=("healthcare_provider", "hospital", "month"),
+                        name="recordcount_provider_unique",
+                    ),
+                ],
+            },
+        ),
+        migrations.RunPython(count_records, migrations.RunPython.noop),
+    ]
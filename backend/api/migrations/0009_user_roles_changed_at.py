@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0008_medical_record_counts"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="roles_changed_at",
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+    ]
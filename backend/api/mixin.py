@@ -4,7 +4,13 @@ from django.utils import timezone
 from django.conf import settings
 from rest_framework.serializers import BaseSerializer
 
-from .utils.case import to_camelcase_data, to_snake_case_data
+from .utils.case import (
+    camelcase_key,
+    snake_case_key,
+    to_camelcase_data,
+    to_snake_case_data,
+)
+from .utils.profiling import current_profile
 
 
 class TimestampMixin(models.Model):
@@ -31,9 +37,82 @@ class AuditMixin(models.Model):
 
 
 class CamelCaseMixin(BaseSerializer):
+    """
+    Renders field names as camelCase and accepts camelCase input.
+
+    The converted names of the declared fields are computed once per
+    serializer class. Values of nested CamelCaseMixin serializers are
+    already converted and are not walked again, other values (JSON and
+    method fields) go through the memoized key conversion.
+    """
+
     def to_representation(self, instance: Any) -> Any:
-        representation = super().to_representation(instance)
-        return to_camelcase_data(representation)
+        profile = current_profile()
+        if profile is None:
+            return self._to_camelcase(super().to_representation(instance))
+
+        with profile.serializing():
+            representation = super().to_representation(instance)
+            with profile.converting_case():
+                return self._to_camelcase(representation)
 
     def to_internal_value(self, data: dict[str, Any]) -> Any:
-        return super().to_internal_value(to_snake_case_data(data))
+        profile = current_profile()
+        if profile is None:
+            return super().to_internal_value(self._to_snake_case(data))
+
+        with profile.converting_case():
+            data = self._to_snake_case(data)
+        return super().to_internal_value(data)
+
+    def _to_camelcase(self, representation: Any) -> Any:
+        if not isinstance(representation, dict):
+            return to_camelcase_data(representation)
+
+        keys = self._case_keys()[0]
+        converted = self._camelcase_fields()
+        return {
+            keys.get(k) or camelcase_key(k): (
+                v if k in converted else to_camelcase_data(v)
+            )
+            for k, v in representation.items()
+        }
+
+    def _to_snake_case(self, data: Any) -> Any:
+        return to_snake_case_data(data, self._case_keys()[1])
+
+    def _case_keys(self) -> tuple[dict[str, str], dict[str, str]]:
+        """(snake -> camel, camel -> snake) names of the fields of this class"""
+        keys = _case_keys.get(type(self))
+        if keys is None:
+            camel = {name: camelcase_key(name) for name in self.fields}
+            snake = {
+                key: name
+                for name, key in camel.items()
+                # Only names that round trip, so input is converted exactly
+                # like any other key
+                if snake_case_key(key) == name
+            }
+            keys = _case_keys[type(self)] = (camel, snake)
+        return keys
+
+    def _camelcase_fields(self) -> frozenset[str]:
+        """
+        Fields rendered by CamelCaseMixin serializers. Cached per instance,
+        which is shared by every row of a ``many=True`` list.
+        """
+        try:
+            cached: frozenset[str] = self.__dict__["_camelcase_field_names"]
+            return cached
+        except KeyError:
+            names = frozenset(
+                name
+                for name, field in self.fields.items()
+                if isinstance(getattr(field, "child", field), CamelCaseMixin)
+            )
+            self.__dict__["_camelcase_field_names"] = names
+            return names
+
+
+# Field name conversions per CamelCaseMixin subclass
+_case_keys: dict[type, tuple[dict[str, str], dict[str, str]]] = {}
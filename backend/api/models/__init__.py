@@ -2,8 +2,9 @@
 from .users import User, Patient, HealthcareProvider, AdminStaff, SystemAdmin
 from .hospital import Hospital, ProviderHospitalAssignment
 from .appointment import Appointment, Slot
-from .medical import MedicalRecord
+from .medical import MedicalRecord, MedicalRecordCount
 from .message import Message
+from .email import OutboundEmail
 from .speciality import Speciality
 
 __all__ = [
@@ -17,6 +18,8 @@ __all__ = [
     "Appointment",
     "Slot",
     "MedicalRecord",
+    "MedicalRecordCount",
     "Message",
+    "OutboundEmail",
     "Speciality",
 ]
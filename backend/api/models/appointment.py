@@ -56,6 +56,26 @@ class Appointment(TimestampMixin):
                 ),
             ),
         ]
+        indexes = [
+            # Keyset pagination of the appointment list, newest first, for
+            # patients, providers and staff (see api.pagination)
+            models.Index(
+                fields=["patient", "-appointment_start_datetime_utc", "-id"],
+                name="appointment_patient_page_idx",
+            ),
+            models.Index(
+                fields=[
+                    "healthcare_provider",
+                    "-appointment_start_datetime_utc",
+                    "-id",
+                ],
+                name="appointment_provider_page_idx",
+            ),
+            models.Index(
+                fields=["-appointment_start_datetime_utc", "-id"],
+                name="appointment_page_idx",
+            ),
+        ]
 
     def clean(self):
         super().clean()
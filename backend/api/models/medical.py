@@ -1,5 +1,12 @@
-from django.db import models
+from datetime import date, datetime
+from typing import Optional
+
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models, transaction
 from django.core.exceptions import ValidationError
+from django.utils import timezone
+from rest_framework.utils.encoders import JSONEncoder
 
 from ..mixin import TimestampMixin, AuditMixin
 from .users import Patient, HealthcareProvider, Hospital
@@ -30,8 +37,46 @@ class MedicalRecord(TimestampMixin, AuditMixin):
     is_removed = models.BooleanField(default=False, db_index=True)
     removed_at = models.DateTimeField(null=True, blank=True)
 
+    # Weighted search document, kept current by api.services.signals
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    # Rendered MedicalRecordDetailSerializer payload, so detail reads fetch
+    # a single row. Kept current by api.services.signals, encoded like the
+    # API responses (see api.services.record_detail)
+    detail = models.JSONField(null=True, editable=False, encoder=JSONEncoder)
+
     class Meta(TimestampMixin.Meta, AuditMixin.Meta):
         ordering = ["-created_at"]
+        indexes = [
+            # Keyset pagination of the record lists, newest first (see
+            # api.pagination), for live records by patient, by provider and
+            # overall, and for the removed records
+            models.Index(
+                fields=["patient", "-created_at", "-id"],
+                name="medicalrecord_patient_page_idx",
+                condition=models.Q(is_removed=False),
+            ),
+            models.Index(
+                fields=["healthcare_provider", "-created_at", "-id"],
+                name="medicalrecord_prov_page_idx",
+                condition=models.Q(is_removed=False),
+            ),
+            models.Index(
+                fields=["-created_at", "-id"],
+                name="medicalrecord_page_idx",
+                condition=models.Q(is_removed=False),
+            ),
+            models.Index(
+                fields=["-created_at", "-id"],
+                name="medicalrecord_removed_page_idx",
+                condition=models.Q(is_removed=True),
+            ),
+            GinIndex(fields=["search_vector"], name="medicalrecord_search_idx"),
+        ]
+
+    # The count_key() the record was last counted under, see
+    # api.services.record_counts
+    _counted_key: Optional[tuple]
 
     def clean(self):
         if not self.diagnosis:
@@ -41,7 +86,62 @@ class MedicalRecord(TimestampMixin, AuditMixin):
 
     def save(self, *args, **kwargs):
         self.full_clean()
-        super().save(*args, **kwargs)
+        # The record counts are updated by a post_save signal, in the same
+        # transaction (see api.services.record_counts)
+        with transaction.atomic(using=kwargs.get("using")):
+            super().save(*args, **kwargs)
+
+    def count_key(self) -> Optional[tuple]:
+        """The MedicalRecordCount bucket of the record, None once removed"""
+        if self.is_removed:
+            return None
+        return (
+            self.patient_id,
+            self.healthcare_provider_id,
+            self.hospital_id,
+            record_month(self.created_at),
+        )
 
     def __str__(self):
         return f"Medical Record: {self.patient} - {self.updated_at}"
+
+
+def record_month(created_at: datetime) -> date:
+    return timezone.localdate(created_at).replace(day=1)
+
+
+class MedicalRecordCount(models.Model):
+    """
+    Live medical records of a patient or of a provider, by hospital and
+    month of creation. Maintained by api.services.record_counts when
+    MEDICAL_RECORD_COUNTERS is on.
+    """
+
+    patient = models.ForeignKey(
+        Patient, null=True, on_delete=models.CASCADE, related_name="+"
+    )
+    healthcare_provider = models.ForeignKey(
+        HealthcareProvider, null=True, on_delete=models.CASCADE, related_name="+"
+    )
+    hospital = models.ForeignKey(Hospital, on_delete=models.CASCADE, related_name="+")
+    month = models.DateField()
+    records = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(patient__isnull=True)
+                ^ models.Q(healthcare_provider__isnull=True),
+                name="recordcount_one_owner",
+            ),
+            models.UniqueConstraint(
+                fields=["patient", "hospital", "month"],
+                condition=models.Q(patient__isnull=False),
+                name="recordcount_patient_unique",
+            ),
+            models.UniqueConstraint(
+                fields=["healthcare_provider", "hospital", "month"],
+                condition=models.Q(healthcare_provider__isnull=False),
+                name="recordcount_provider_unique",
+            ),
+        ]
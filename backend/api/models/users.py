@@ -1,7 +1,8 @@
 import uuid
 from django.db import models
 from django.contrib.auth.models import AbstractUser
-from django.db.models.functions import Lower
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db.models.functions import Collate, Concat, Lower, Upper
 from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 from django.core.validators import MinLengthValidator, RegexValidator
@@ -36,6 +37,9 @@ class User(TimestampMixin, AbstractUser):
     zip_code = models.CharField(max_length=5, blank=True)
     image = models.ImageField(upload_to="users_images", blank=True, null=True)
     reset_sent_at = models.DateTimeField(null=True, blank=True)
+    # Last change to the roles or flags in access token claims, see
+    # api.authentication.mark_roles_changed
+    roles_changed_at = models.DateTimeField(null=True, blank=True, editable=False)
 
     # Use email as username for login
     USERNAME_FIELD = "email"
@@ -46,6 +50,38 @@ class User(TimestampMixin, AbstractUser):
         constraints = [
             models.UniqueConstraint(Lower("email"), name="user_email_ci_unique")
         ]
+        # Name search (icontains/istartswith compare UPPER(name)), and the
+        # provider autocomplete's prefix and typo matches
+        indexes = [
+            GinIndex(
+                OpClass(Upper("first_name"), name="gin_trgm_ops"),
+                name="user_first_name_trgm_idx",
+            ),
+            GinIndex(
+                OpClass(Upper("last_name"), name="gin_trgm_ops"),
+                name="user_last_name_trgm_idx",
+            ),
+            models.Index(
+                Collate(Upper("first_name"), "C"), name="user_first_name_prefix_idx"
+            ),
+            models.Index(
+                Collate(Upper("last_name"), "C"), name="user_last_name_prefix_idx"
+            ),
+            GinIndex(
+                OpClass(
+                    Upper(
+                        Concat(
+                            "first_name",
+                            models.Value(" "),
+                            "last_name",
+                            output_field=models.CharField(),
+                        )
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="user_full_name_trgm_idx",
+            ),
+        ]
 
     def save(self, *args, **kwargs):
         self.full_clean()
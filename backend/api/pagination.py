@@ -0,0 +1,203 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from typing import Any, Optional
+
+from django.core.exceptions import ValidationError
+from django.db import NotSupportedError
+from django.db.models import Field, Q, QuerySet
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from .services.search import SEARCH_RANK
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination on a composite key, e.g. ``("-start", "-id")``.
+
+    A page continues strictly after the key of the previous page's last row,
+    so rows inserted or deleted elsewhere never shift or repeat a page, and
+    pages cost the same however deep they are. Totals are never counted.
+
+    The key fields must share one direction and end with a unique field.
+    Rows may be model instances or ``values()`` dicts that contain the key
+    fields.
+
+    A queryset annotated with ``search_rank`` (see RankedSearchFilter) is
+    paged on ``ranked_ordering`` instead, best match first.
+
+    With ``estimate_count`` the response also carries ``estimated_count``,
+    the planner's row estimate for the unpaginated query (exact when the
+    whole list fits on one page), or None where it can't be had.
+    """
+
+    ordering: tuple[str, ...] = ("-created_at", "-id")
+    ranked_ordering: tuple[str, ...] = (f"-{SEARCH_RANK}", "-id")
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
+    cursor_query_param = "cursor"
+    estimate_count = False
+    invalid_cursor_message = _("Invalid cursor")
+
+    def paginate_queryset(
+        self, queryset: QuerySet, request: Request, view: Any = None
+    ) -> list:
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        key = self.get_ordering(queryset)
+        self.fields = [name.lstrip("-") for name in key]
+        self.descending = key[0].startswith("-")
+
+        self.queryset = queryset
+        position, reverse = self.decode_cursor(request, queryset)
+        # Previous pages walk the key the other way and are flipped back
+        backwards = self.descending != reverse
+        ordering = [f"-{name}" if backwards else name for name in self.fields]
+
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(self.after(position, backwards))
+
+        rows = list(queryset[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        if reverse:
+            rows.reverse()
+            self.has_next, self.has_previous = position is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+
+        self.rows = rows
+        return rows
+
+    def get_paginated_response(self, data: Any) -> Response:
+        response = {
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        }
+        if self.estimate_count:
+            response["estimated_count"] = self.get_estimated_count()
+        return Response(response)
+
+    def get_paginated_response_schema(self, schema: dict) -> dict:
+        properties = {
+            "next": {"type": "string", "nullable": True, "format": "uri"},
+            "previous": {"type": "string", "nullable": True, "format": "uri"},
+            "results": schema,
+        }
+        if self.estimate_count:
+            properties["estimated_count"] = {"type": "integer", "nullable": True}
+        return {"type": "object", "required": ["results"], "properties": properties}
+
+    def get_estimated_count(self) -> Optional[int]:
+        if not self.has_next and not self.has_previous:
+            return len(self.rows)
+        try:
+            # EXPLAIN plans the query without running it
+            explained = json.loads(self.queryset.order_by().explain(format="json"))
+        except (ValueError, NotSupportedError):
+            # Backends without JSON plans
+            return None
+        if isinstance(explained, list):
+            explained = explained[0]
+        return int(explained["Plan"]["Plan Rows"])
+
+    def get_ordering(self, queryset: QuerySet) -> tuple[str, ...]:
+        if SEARCH_RANK in queryset.query.annotations:
+            return self.ranked_ordering
+        return self.ordering
+
+    def get_page_size(self, request: Request) -> int:
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(size, 1), self.max_page_size)
+
+    def get_next_link(self) -> Optional[str]:
+        if not self.has_next or not self.rows:
+            return None
+        return self.link(self.rows[-1], reverse=False)
+
+    def get_previous_link(self) -> Optional[str]:
+        if not self.has_previous:
+            return None
+        if not self.rows:
+            first: str = remove_query_param(self.base_url, self.cursor_query_param)
+            return first
+        return self.link(self.rows[0], reverse=True)
+
+    def after(self, position: list, backwards: bool) -> Q:
+        """
+        Rows after ``position`` in key order.
+
+        Written as ``a <= x AND (a < x OR b < y)`` rather than an OR of the
+        full comparisons, so the leading column bounds the index scan.
+        """
+        op = "lt" if backwards else "gt"
+        pairs = list(zip(self.fields, position))
+        # Innermost comparison first: b < y, then a < x OR (a = x AND ...)
+        name, value = pairs[-1]
+        condition = Q(**{f"{name}__{op}": value})
+        for name, value in reversed(pairs[:-1]):
+            condition = Q(**{f"{name}__{op}": value}) | (Q(**{name: value}) & condition)
+        first, value = pairs[0]
+        return Q(**{f"{first}__{op}e": value}) & condition
+
+    def link(self, row: Any, reverse: bool) -> str:
+        position = [self.value(row, name) for name in self.fields]
+        payload = json.dumps([position, reverse], default=str)
+        cursor = urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+        url: str = replace_query_param(self.base_url, self.cursor_query_param, cursor)
+        return url
+
+    def decode_cursor(
+        self, request: Request, queryset: QuerySet
+    ) -> tuple[Optional[list], bool]:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            padded = encoded + "=" * (-len(encoded) % 4)
+            position, reverse = json.loads(urlsafe_b64decode(padded))
+            if len(position) != len(self.fields):
+                raise ValueError
+            position = [
+                self.key_field(queryset, name).to_python(value)
+                for name, value in zip(self.fields, position)
+            ]
+        except (TypeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+        return position, bool(reverse)
+
+    @staticmethod
+    def key_field(queryset: QuerySet, name: str) -> Field:
+        annotation = queryset.query.annotations.get(name)
+        field: Field
+        if annotation is not None:
+            field = annotation.output_field
+        else:
+            field = queryset.model._meta.get_field(name)
+        return field
+
+    @staticmethod
+    def value(row: Any, name: str) -> Any:
+        if isinstance(row, dict):
+            return row[name]
+        return getattr(row, name)
+
+
+class AppointmentPagination(KeysetPagination):
+    ordering = ("-appointment_start_datetime_utc", "-id")
+
+
+class MedicalRecordPagination(KeysetPagination):
+    ordering = ("-created_at", "-id")
+    estimate_count = True
@@ -0,0 +1,45 @@
+import codecs
+import io
+from typing import IO, Any, Optional
+
+import orjson
+from django.conf import settings
+from rest_framework.parsers import JSONParser
+
+from .renderers import FastJSONRenderer, fast_json_enabled
+
+
+class FastJSONParser(JSONParser):
+    """
+    JSON parser backed by orjson, see ``FastJSONRenderer``.
+
+    Bodies orjson rejects are parsed again by ``JSONParser``, so errors and
+    the few inputs only the stdlib accepts (integers wider than 64 bits)
+    behave exactly as before. Charsets other than UTF-8 always use
+    ``JSONParser``.
+    """
+
+    renderer_class = FastJSONRenderer
+
+    def parse(
+        self,
+        stream: IO[bytes],
+        media_type: Optional[str] = None,
+        parser_context: Optional[dict[str, Any]] = None,
+    ) -> Any:
+        if not fast_json_enabled() or not self.is_utf8(parser_context or {}):
+            return super().parse(stream, media_type, parser_context)
+
+        body = stream.read()
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            return super().parse(io.BytesIO(body), media_type, parser_context)
+
+    @staticmethod
+    def is_utf8(parser_context: dict[str, Any]) -> bool:
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        try:
+            return codecs.lookup(encoding).name == "utf-8"
+        except LookupError:
+            return False
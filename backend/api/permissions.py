@@ -1,5 +1,7 @@
 from rest_framework import permissions
 
+from .roles import get_roles
+
 
 # Didn't add type signature due to Pylance Override Error
 class IsPatient(permissions.BasePermission):
@@ -7,7 +9,7 @@ class IsPatient(permissions.BasePermission):
         return (
             request.user
             and request.user.is_authenticated
-            and hasattr(request.user, "patient")
+            and get_roles(request.user).is_patient
         )
 
 
@@ -16,7 +18,7 @@ class IsHealthcareProvider(permissions.BasePermission):
         return (
             request.user
             and request.user.is_authenticated
-            and hasattr(request.user, "provider")
+            and get_roles(request.user).is_provider
         )
 
 
@@ -26,11 +28,8 @@ class IsStaffOrAdmin(permissions.BasePermission):
         if not user or not user.is_authenticated:
             return False
 
-        return (
-            user.is_staff
-            or hasattr(user, "system_admin")
-            or hasattr(user, "admin_staff")
-        )
+        roles = get_roles(user)
+        return user.is_staff or roles.is_system_admin or roles.is_admin_staff
 
 
 class IsPatientOrProvider(permissions.BasePermission):
@@ -39,7 +38,8 @@ class IsPatientOrProvider(permissions.BasePermission):
         if not user or not user.is_authenticated:
             return False
 
-        return user.is_staff or hasattr(user, "patient") or hasattr(user, "provider")
+        roles = get_roles(user)
+        return user.is_staff or roles.is_patient or roles.is_provider
 
 
 class IsRecordOwner(permissions.BasePermission):
@@ -49,8 +49,9 @@ class IsRecordOwner(permissions.BasePermission):
         if not request.user.is_authenticated:
             return False
 
-        if hasattr(request.user, "provider"):
-            return obj.healthcare_provider == request.user.provider
+        roles = get_roles(request.user)
+        if roles.is_provider:
+            return obj.healthcare_provider_id == roles.provider.pk
 
         if request.user.is_staff:
             return True
@@ -0,0 +1,178 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Optional
+
+from django.contrib.auth import get_user_model
+from django.db.models import Exists, OuterRef
+
+from .utils.lazy import LazyInstance
+
+if TYPE_CHECKING:
+    from .models import AdminStaff, HealthcareProvider, Patient, SystemAdmin
+
+# Reverse one-to-one relations from User to its role profiles
+ROLE_RELATIONS = ("patient", "provider", "admin_staff", "system_admin")
+# Roles from most to least privileged
+ROLE_PRECEDENCE = ("system_admin", "admin_staff", "provider", "patient")
+
+
+def role_related(prefix: str = "") -> list[str]:
+    """
+    select_related() paths loading the role profiles of a user.
+
+    Args:
+        prefix (str): path to the user, e.g. "user" for a Patient queryset
+
+    Returns:
+        list[str]: lookups to pass to select_related()
+    """
+    if not prefix:
+        return list(ROLE_RELATIONS)
+    return [f"{prefix}__{name}" for name in ROLE_RELATIONS]
+
+
+@dataclass(frozen=True)
+class UserRoles:
+    """
+    Role profiles of a user, None for the roles the user does not have.
+    """
+
+    patient: Optional["Patient"] = None
+    provider: Optional["HealthcareProvider"] = None
+    admin_staff: Optional["AdminStaff"] = None
+    system_admin: Optional["SystemAdmin"] = None
+
+    @property
+    def is_patient(self) -> bool:
+        return self.patient is not None
+
+    @property
+    def is_provider(self) -> bool:
+        return self.provider is not None
+
+    @property
+    def is_admin_staff(self) -> bool:
+        return self.admin_staff is not None
+
+    @property
+    def is_system_admin(self) -> bool:
+        return self.system_admin is not None
+
+    @property
+    def name(self) -> str:
+        """Most privileged role of the user"""
+        return role_name(self.flags())
+
+    def flags(self) -> dict[str, bool]:
+        return {name: getattr(self, name) is not None for name in ROLE_RELATIONS}
+
+
+def role_name(flags: dict[str, bool]) -> str:
+    """Most privileged role set in ``flags``, keyed by role relation"""
+    for name in ROLE_PRECEDENCE:
+        if flags.get(name):
+            return name
+    return "unassigned"
+
+
+def role_flag_annotations() -> dict[str, Exists]:
+    """
+    ``has_<role>_profile`` annotations for a User queryset, so role flags
+    are read in the same query as the user.
+    """
+    annotations = {}
+    for name in ROLE_RELATIONS:
+        relation = _relation(name)
+        annotations[f"has_{name}_profile"] = Exists(
+            relation.related_model.objects.filter(
+                **{relation.field.attname: OuterRef("pk")}
+            )
+        )
+    return annotations
+
+
+def _relation(name: str) -> Any:
+    return get_user_model()._meta.get_field(name)
+
+
+def get_roles(user: Any) -> UserRoles:
+    """
+    Role profiles of a user.
+
+    Profiles already loaded on the user, e.g. by select_related() in the
+    authentication class, are reused. Otherwise all of them are fetched with
+    a single query and cached on the user, so later ``user.patient`` style
+    lookups do not query either.
+    """
+    if user is None or not user.is_authenticated:
+        return UserRoles()
+
+    # Users authenticated from token claims carry their roles
+    claimed: Optional[UserRoles] = getattr(user, "claimed_roles", None)
+    if claimed is not None:
+        return claimed
+
+    if user._state.adding:
+        # Unsaved users cannot have role profiles
+        return UserRoles()
+
+    relations = [_relation(name) for name in ROLE_RELATIONS]
+    if not all(relation.is_cached(user) for relation in relations):
+        loaded = (
+            get_user_model().objects.select_related(*ROLE_RELATIONS).get(pk=user.pk)
+        )
+        for relation in relations:
+            if relation.is_cached(user):
+                continue
+            profile = relation.get_cached_value(loaded)
+            if profile is not None:
+                relation.field.set_cached_value(profile, user)
+            relation.set_cached_value(user, profile)
+
+    return UserRoles(
+        **{
+            name: relation.get_cached_value(user)
+            for name, relation in zip(ROLE_RELATIONS, relations)
+        }
+    )
+
+
+def role_claims(user: Any) -> dict[str, Any]:
+    """
+    Token claims describing the roles of a user.
+
+    Role profiles share the user's primary key, so only their names are
+    stored, plus the hospital of admin staff.
+    """
+    roles = get_roles(user)
+    claims: dict[str, Any] = {
+        "role": roles.name,
+        "roles": [name for name in ROLE_RELATIONS if getattr(roles, name)],
+        "is_staff": user.is_staff,
+        "is_superuser": user.is_superuser,
+    }
+    if roles.admin_staff is not None:
+        claims["hospital_id"] = roles.admin_staff.hospital_id
+    return claims
+
+
+def roles_from_claims(user: Any, claims: dict[str, Any]) -> UserRoles:
+    """
+    Role profiles named in token claims, as stand-ins loaded on first use.
+
+    Args:
+        user: user the claims belong to
+        claims (dict): claims built by ``role_claims``
+
+    Returns:
+        UserRoles: profiles answering pk, user and hospital_id without a query
+    """
+    profiles: dict[str, Any] = {}
+    for name in claims.get("roles", ()):
+        if name not in ROLE_RELATIONS:
+            continue
+        relation = _relation(name)
+        known = {relation.field.name: user, relation.field.attname: user.pk}
+        if name == "admin_staff":
+            known["hospital_id"] = claims.get("hospital_id")
+        profiles[name] = LazyInstance(relation.related_model, user.pk, known)
+    return UserRoles(**profiles)
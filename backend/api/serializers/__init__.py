@@ -29,6 +29,7 @@ from .auth import ChangePasswordSerializer, LoginSerializer
 from .appointment import (
     SlotSerializer,
     AppointmentListSerializer,
+    AppointmentListValuesSerializer,
     AppointmentDetailSerializer,
     AppointmentCreateSerializer,
 )
@@ -37,6 +38,9 @@ from .medical_record import (
     MedicalRecordCreateSerializer,
     MedicalRecordUpdateSerializer,
     MedicalRecordListSerializer,
+    MedicalRecordListValuesSerializer,
+    MedicalRecordExportSerializer,
+    MedicalRecordExportValuesSerializer,
     MedicalRecordDetailSerializer,
 )
 
@@ -63,11 +67,15 @@ __all__ = [
     "LoginSerializer",
     "SlotSerializer",
     "AppointmentListSerializer",
+    "AppointmentListValuesSerializer",
     "AppointmentDetailSerializer",
     "AppointmentCreateSerializer",
     "MedicalRecordSerializer",
     "MedicalRecordCreateSerializer",
     "MedicalRecordUpdateSerializer",
     "MedicalRecordListSerializer",
+    "MedicalRecordListValuesSerializer",
+    "MedicalRecordExportSerializer",
+    "MedicalRecordExportValuesSerializer",
     "MedicalRecordDetailSerializer",
 ]
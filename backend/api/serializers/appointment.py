@@ -6,19 +6,17 @@ from ..models import (
     Slot,
     Patient,
     HealthcareProvider,
-    Hospital,
-    ProviderHospitalAssignment,
 )
 from .patient import PatientSerializer
 from .healthcare_provider import HealthcareProviderListSerializer
-from .hospital import HospitalTinySerializer
+from .hospital import CachedHospitalField, HospitalTinySerializer
+from .values import ValuesSerializer, full_name
 from ..mixin import CamelCaseMixin
+from ..services.reference import reference_cache
 
 
 class SlotSerializer(CamelCaseMixin, serializers.ModelSerializer):
-    hospital_id = serializers.PrimaryKeyRelatedField(
-        queryset=Hospital.objects.all(), write_only=True, source="hospital"
-    )
+    hospital_id = CachedHospitalField(write_only=True, source="hospital")
     hospital_timezone = serializers.CharField(
         source="hospital.timezone", read_only=True
     )
@@ -96,6 +94,31 @@ class AppointmentListSerializer(CamelCaseMixin, serializers.ModelSerializer):
         ]
 
 
+class AppointmentListValuesSerializer(ValuesSerializer):
+    """AppointmentListSerializer output for list endpoints, from values()"""
+
+    serializer_class = AppointmentListSerializer
+    columns = {
+        "id": "id",
+        "patient_id": "patient_id",
+        "provider_id": "healthcare_provider_id",
+        "patient_name": full_name("patient__user"),
+        "provider_name": full_name("healthcare_provider__user"),
+        "provider_image": "healthcare_provider__user__image",
+        "appointment_start_datetime_utc": "appointment_start_datetime_utc",
+        "appointment_end_datetime_utc": "appointment_end_datetime_utc",
+        "hospital": {
+            "id": "location_id",
+            "name": "location__name",
+            "address_line1": "location__address_line1",
+            "address_line2": "location__address_line2",
+            "timezone": "location__timezone",
+        },
+        "reason": "reason",
+        "status": "status",
+    }
+
+
 class AppointmentDetailSerializer(CamelCaseMixin, serializers.ModelSerializer):
     patient = PatientSerializer(read_only=True)
     provider = HealthcareProviderListSerializer(
@@ -143,9 +166,7 @@ class AppointmentCreateSerializer(CamelCaseMixin, serializers.ModelSerializer):
     provider = serializers.PrimaryKeyRelatedField(
         source="healthcare_provider", queryset=HealthcareProvider.objects.all()
     )
-    location = serializers.PrimaryKeyRelatedField(
-        queryset=Hospital.objects.filter(is_removed=False)
-    )
+    location = CachedHospitalField(active_only=True)
 
     class Meta:
         model = Appointment
@@ -197,14 +218,7 @@ class AppointmentCreateSerializer(CamelCaseMixin, serializers.ModelSerializer):
         hospital = attrs.get("location")
 
         # Check for provider having active assignment for the hospital
-        is_active = ProviderHospitalAssignment.objects.filter(
-            healthcare_provider=provider,
-            hospital=hospital,
-            is_active=True,
-            end_datetime_utc__isnull=True,
-        ).exists()
-
-        if not is_active:
+        if not reference_cache.is_affiliated(provider.pk, hospital.pk):
             raise serializers.ValidationError(
                 {"location": "Provider is not affiliated with the hospital."}
             )
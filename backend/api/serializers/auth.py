@@ -1,9 +1,14 @@
 import logging
 from rest_framework import serializers
-from django.contrib.auth import authenticate
+from django.contrib.auth import authenticate, get_user_model
 from django.contrib.auth.password_validation import validate_password
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken
 
 from ..mixin import CamelCaseMixin
+from ..authentication import BlacklistRefreshToken, add_role_claims
+from ..roles import role_related
 
 logger = logging.getLogger(__name__)
 
@@ -45,3 +50,23 @@ class LoginSerializer(CamelCaseMixin, serializers.Serializer):
 
         attrs["user"] = user
         return attrs
+
+
+class RoleTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Token refresh issuing access tokens with the user's current role claims.
+    """
+
+    token_class = BlacklistRefreshToken
+
+    def validate(self, attrs):
+        data = super().validate(attrs)
+
+        access = AccessToken(data["access"])
+        user = (
+            get_user_model()
+            .objects.select_related(*role_related())
+            .get(**{api_settings.USER_ID_FIELD: access[api_settings.USER_ID_CLAIM]})
+        )
+        data["access"] = str(add_role_claims(access, user))
+        return data
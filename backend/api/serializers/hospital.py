@@ -1,6 +1,40 @@
 from rest_framework import serializers
 from ..models import Hospital
 from ..mixin import CamelCaseMixin
+from ..services.reference import reference_cache
+
+
+class CachedHospitalField(serializers.PrimaryKeyRelatedField):
+    """
+    Hospital primary key field resolved from the reference cache, so
+    validating it does not query the database.
+    """
+
+    def __init__(self, active_only: bool = False, **kwargs):
+        self.active_only = active_only
+        if not kwargs.get("read_only"):
+            kwargs.setdefault(
+                "queryset",
+                Hospital.objects.filter(is_removed=False)
+                if active_only
+                else Hospital.objects.all(),
+            )
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        if self.pk_field is not None:
+            data = self.pk_field.to_internal_value(data)
+        if isinstance(data, bool):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        try:
+            pk = int(data)
+        except (TypeError, ValueError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+
+        hospital = reference_cache.hospital(pk, active_only=self.active_only)
+        if hospital is None:
+            self.fail("does_not_exist", pk_value=data)
+        return hospital
 
 
 class HospitalSerializer(CamelCaseMixin, serializers.ModelSerializer):
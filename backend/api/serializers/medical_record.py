@@ -10,7 +10,9 @@ from ..models import (
     Patient,
     User,
 )
+from .values import ValuesSerializer, full_name
 from ..mixin import CamelCaseMixin
+from ..roles import get_roles
 
 
 class MedicalRecordSerializer(CamelCaseMixin, serializers.ModelSerializer):
@@ -75,8 +77,9 @@ class MedicalRecordSerializer(CamelCaseMixin, serializers.ModelSerializer):
         Raises:
             ValidationError: If appointment does not belong to the provider
         """
-        if user.is_authenticated and hasattr(user, "provider"):
-            if appointment.healthcare_provider != user.provider:
+        provider = get_roles(user).provider
+        if provider is not None:
+            if appointment.healthcare_provider_id != provider.pk:
                 raise serializers.ValidationError(
                     {
                         "appointment_id": "Providers can only link their own appointments."
@@ -158,9 +161,8 @@ class MedicalRecordCreateSerializer(MedicalRecordSerializer):
 
         self.validate_hospital_active(hospital)
 
-        try:
-            provider = request.user.provider
-        except HealthcareProvider.DoesNotExist:
+        provider = get_roles(request.user).provider
+        if provider is None:
             raise serializers.ValidationError(
                 {"detail": "Only healthcare providers can create medical records."}
             )
@@ -194,7 +196,7 @@ class MedicalRecordCreateSerializer(MedicalRecordSerializer):
 
     def create(self, validated_data):
         request = self.context.get("request")
-        validated_data["healthcare_provider"] = request.user.provider
+        validated_data["healthcare_provider"] = get_roles(request.user).provider
         validated_data["created_by"] = request.user
         validated_data["updated_by"] = request.user
 
@@ -239,9 +241,8 @@ class MedicalRecordUpdateSerializer(MedicalRecordSerializer):
         if not request or not request.user.is_authenticated:
             raise serializers.ValidationError({"detail": "Authentication required."})
 
-        try:
-            provider = request.user.provider
-        except HealthcareProvider.DoesNotExist:
+        provider = get_roles(request.user).provider
+        if provider is None:
             raise serializers.ValidationError(
                 {"detail": "Only healthcare providers can update medical records."}
             )
@@ -330,6 +331,56 @@ class MedicalRecordListSerializer(MedicalRecordSerializer):
         read_only_fields = fields
 
 
+class MedicalRecordListValuesSerializer(ValuesSerializer):
+    """MedicalRecordListSerializer output for list endpoints, from values()"""
+
+    serializer_class = MedicalRecordListSerializer
+    columns = {
+        "id": "id",
+        "patient_id": "patient_id",
+        "patient_name": full_name("patient__user"),
+        "provider_id": "healthcare_provider_id",
+        "provider_name": full_name("healthcare_provider__user"),
+        "hospital_id": "hospital_id",
+        "hospital_name": "hospital__name",
+        "appointment_id": "appointment_id",
+        "diagnosis": "diagnosis",
+        "created_at": "created_at",
+        "updated_at": "updated_at",
+    }
+
+
+class MedicalRecordExportSerializer(MedicalRecordListSerializer):
+    class Meta(MedicalRecordListSerializer.Meta):
+        fields = [
+            "id",
+            "patient_id",
+            "patient_name",
+            "provider_id",
+            "provider_name",
+            "hospital_id",
+            "hospital_name",
+            "appointment_id",
+            "diagnosis",
+            "notes",
+            "prescriptions",
+            "created_at",
+            "updated_at",
+        ]
+        read_only_fields = fields
+
+
+class MedicalRecordExportValuesSerializer(ValuesSerializer):
+    """MedicalRecordExportSerializer output for the streamed export, from values()"""
+
+    serializer_class = MedicalRecordExportSerializer
+    columns = {
+        **MedicalRecordListValuesSerializer.columns,
+        "notes": "notes",
+        "prescriptions": "prescriptions",
+    }
+
+
 class MedicalRecordDetailSerializer(MedicalRecordSerializer):
     patient_details = serializers.SerializerMethodField()
     provider_details = serializers.SerializerMethodField()
@@ -385,7 +436,7 @@ class MedicalRecordDetailSerializer(MedicalRecordSerializer):
         image_url = None
         if user.image and hasattr(user.image, "url"):
             try:
-                image_url = user.image
+                image_url = user.image.url
             except ValueError:
                 image_url = None
 
@@ -1,7 +1,10 @@
+from typing import Optional
+
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
 from ..mixin import CamelCaseMixin
+from ..roles import ROLE_RELATIONS, get_roles, role_name
 
 User = get_user_model()
 
@@ -38,27 +41,29 @@ class BaseUserSerializer(CamelCaseMixin, serializers.ModelSerializer):
         read_only_fields = ["id"]
 
     def get_has_patient_profile(self, obj):
-        return hasattr(obj, "patient")
+        return self.role_flags(obj)["patient"]
 
     def get_has_provider_profile(self, obj):
-        return hasattr(obj, "provider")
+        return self.role_flags(obj)["provider"]
 
     def get_has_admin_staff_profile(self, obj):
-        return hasattr(obj, "admin_staff")
+        return self.role_flags(obj)["admin_staff"]
 
     def get_has_system_admin_profile(self, obj):
-        return hasattr(obj, "system_admin")
+        return self.role_flags(obj)["system_admin"]
 
     def get_user_role(self, obj):
-        if hasattr(obj, "system_admin"):
-            return "system_admin"
-        elif hasattr(obj, "admin_staff"):
-            return "admin_staff"
-        elif hasattr(obj, "provider"):
-            return "provider"
-        elif hasattr(obj, "patient"):
-            return "patient"
-        return "unassigned"
+        return role_name(self.role_flags(obj))
+
+    @staticmethod
+    def role_flags(obj) -> dict[str, bool]:
+        """Role flags annotated by role_flag_annotations(), else from get_roles()"""
+        flags: dict[str, Optional[bool]] = {
+            name: getattr(obj, f"has_{name}_profile", None) for name in ROLE_RELATIONS
+        }
+        if None in flags.values():
+            return get_roles(obj).flags()
+        return {name: bool(flag) for name, flag in flags.items()}
 
     def validate(self, attrs):
         email = attrs.get("email")
@@ -0,0 +1,149 @@
+from typing import Any, Callable, Iterable, Optional, Union, cast
+
+from django.db.models import (
+    CharField,
+    Expression,
+    F,
+    FileField,
+    Model,
+    QuerySet,
+    Value,
+)
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.fields.files import FieldFile
+from django.db.models.functions import Concat, Trim
+from rest_framework import serializers
+
+Column = Union[str, Expression]
+Columns = dict[str, Union[Column, "Columns"]]
+
+
+def full_name(user: str) -> Expression:
+    """``User.get_full_name()`` of the user at lookup ``user``, in SQL"""
+    return Trim(
+        Concat(
+            f"{user}__first_name",
+            Value(" "),
+            f"{user}__last_name",
+            output_field=CharField(),
+        )
+    )
+
+
+class ValuesSerializer:
+    """
+    Read-only list rendering from ``queryset.values()`` with the exact output
+    of a CamelCaseMixin ModelSerializer.
+
+    ``columns`` maps the field names of ``serializer_class`` to a lookup or
+    expression, or to a nested mapping for a nested serializer. Rows only
+    fetch those columns, and each value goes through the bound field of a
+    single ``serializer_class`` instance, so datetimes, UUIDs, choices and
+    file URLs render as before without building a model instance or a DRF
+    field per row.
+    """
+
+    serializer_class: type[serializers.Serializer]
+    columns: Columns
+
+    def __init__(
+        self, queryset: QuerySet, context: Optional[dict[str, Any]] = None
+    ) -> None:
+        self.queryset = queryset
+        self.context = context or {}
+        self.serializer = self.serializer_class(context=self.context)
+        self._aliases: dict[str, Column] = {}
+        self._plan = self._build_plan(self.serializer, self.columns, prefix="")
+
+    @property
+    def data(self) -> list[dict[str, Any]]:
+        return self.render(self.rows())
+
+    @property
+    def keys(self) -> list[str]:
+        """The keys of a rendered row, in order"""
+        return [key for key, _, _ in self._plan]
+
+    def rows(self) -> QuerySet:
+        """
+        The ``values()`` rows to render. Columns looked up under their own
+        name keep it, and so do the queryset's annotations, so the rows can
+        be paginated on them.
+        """
+        fields = [alias for alias, column in self._aliases.items() if alias == column]
+        fields += [
+            name for name in self.queryset.query.annotations if name not in fields
+        ]
+        expressions = {
+            alias: self._expression(column)
+            for alias, column in self._aliases.items()
+            if alias != column
+        }
+        return self.queryset.values(*fields, **expressions)
+
+    def render(self, rows: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        return [self.to_representation(row) for row in rows]
+
+    def to_representation(self, row: dict[str, Any]) -> dict[str, Any]:
+        return self._render(self._plan, row)
+
+    def _render(self, plan: list, row: dict[str, Any]) -> dict[str, Any]:
+        result = {}
+        for key, alias, convert in plan:
+            if isinstance(alias, list):
+                # Nested serializer, None when the related row is missing
+                # (its first column is the primary key)
+                nested_pk = row[alias[0][1]]
+                result[key] = None if nested_pk is None else self._render(alias, row)
+                continue
+            value = row[alias]
+            result[key] = None if value is None else convert(value)
+        return result
+
+    def _build_plan(
+        self, serializer: serializers.Serializer, columns: Columns, prefix: str
+    ) -> list:
+        camel = serializer._case_keys()[0]
+        plan = []
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+            column = columns[name]
+            if isinstance(column, dict):
+                nested = self._build_plan(field, column, prefix=f"{prefix}{name}_")
+                plan.append((camel[name], nested, None))
+                continue
+            if not prefix and column == name:
+                alias = name
+            else:
+                alias = f"{prefix}{name}_value"
+            self._aliases[alias] = column
+            plan.append((camel[name], alias, self._converter(field, column)))
+        return plan
+
+    def _converter(self, field: serializers.Field, column: Column):
+        model_field = self._model_field(column) if isinstance(column, str) else None
+        if isinstance(model_field, FileField):
+            # The field renders FieldFile.url, values() returns the name
+            attr_class: Callable[..., FieldFile] = model_field.attr_class  # type: ignore[attr-defined]
+
+            def convert_file(name: str) -> Any:
+                if not name:
+                    return None
+                return field.to_representation(attr_class(None, model_field, name))
+
+            return convert_file
+        return field.to_representation
+
+    def _model_field(self, lookup: str) -> Any:
+        model: type[Model] = self.queryset.model
+        model_field = None
+        for part in lookup.split(LOOKUP_SEP):
+            model_field = model._meta.get_field(part)
+            if model_field.related_model is not None:
+                model = cast(type[Model], model_field.related_model)
+        return model_field
+
+    @staticmethod
+    def _expression(column: Column) -> Union[F, Expression]:
+        return F(column) if isinstance(column, str) else column
@@ -1,10 +1,10 @@
 import logging
 from django.utils import timezone
-from django.core.mail import send_mail
-from django.template.loader import render_to_string
 from django.conf import settings
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
+from ..utils.ratelimit import SlidingWindowLimiter
+from .mail import enqueue_email, render_email
 from ..utils.tokens import build_verification_jwt
 
 if TYPE_CHECKING:
@@ -16,10 +16,22 @@ else:
 
 logger = logging.getLogger(__name__)
 
+# Failed logins per client IP and per email address
+login_ip_limiter = SlidingWindowLimiter(
+    "login-ip",
+    limit=settings.LOGIN_THROTTLE_IP_LIMIT,
+    window=settings.LOGIN_THROTTLE_WINDOW_SECONDS,
+)
+login_email_limiter = SlidingWindowLimiter(
+    "login-email",
+    limit=settings.LOGIN_THROTTLE_EMAIL_LIMIT,
+    window=settings.LOGIN_THROTTLE_WINDOW_SECONDS,
+)
+
 
 def send_verification_email(user: User) -> None:
     """
-    Build and send a one-time verification email to user
+    Build a one-time verification email to user and queue it for sending
     """
     if user.is_active:
         logger.warning(
@@ -33,18 +45,71 @@ def send_verification_email(user: User) -> None:
     token = build_verification_jwt(user)
     link = f"{settings.FRONTEND_URL}/verify-email?token={token}"
 
-    html = render_to_string(
-        "verify.html", {"first_name": user.first_name, "link": link, "expiry": 30}
-    )
-    plain_message = render_to_string(
-        "verify.txt", {"first_name": user.first_name, "link": link, "expiry": 30}
+    plain_message, html = render_email(
+        "verify", {"first_name": user.first_name, "link": link, "expiry": 30}
     )
 
-    send_mail(
+    enqueue_email(
         subject="Confirmation Email",
-        message=plain_message,
-        from_email=settings.DEFAULT_FROM_EMAIL,
-        recipient_list=[user.email],
-        html_message=html,
-        fail_silently=False,
+        body=plain_message,
+        to=[user.email],
+        html_body=html,
     )
+
+
+def check_credentials(email: str, password: str) -> tuple[Optional[User], bool]:
+    """
+    Look up a user by email and verify the password, hashing exactly once.
+
+    Unknown emails still hash the password, so they take as long as a wrong
+    password and do not reveal which addresses have accounts.
+
+    Returns:
+        tuple: the user (None if unknown) and whether the password matched
+    """
+    try:
+        user = User.objects.get(email=email)
+    except User.DoesNotExist:
+        User().set_password(password)
+        return None, False
+    return user, user.check_password(password)
+
+
+class LoginAttempt:
+    """
+    A login attempt, counted against the per-IP and per-email limits before
+    the password is checked.
+
+    Counting up front makes the limit check and the count one step, so
+    parallel attempts cannot all pass the check before any is recorded.
+    Attempts that turn out not to be failures are taken back.
+    """
+
+    def __init__(self, ip: str, email: str) -> None:
+        self.ip = ip
+        self.email = email.strip().lower()
+        self._events: list[tuple[SlidingWindowLimiter, str, str]] = []
+
+    def start(self) -> Optional[int]:
+        """Count the attempt, or return the seconds to wait when throttled"""
+        for limiter, identifier in (
+            (login_ip_limiter, self.ip),
+            (login_email_limiter, self.email),
+        ):
+            event = limiter.acquire(identifier)
+            if event is None:
+                self.cancel()
+                return limiter.retry_after(identifier) or limiter.window
+            self._events.append((limiter, identifier, event))
+        return None
+
+    def cancel(self) -> None:
+        """Take the attempt back, it was not a failed login"""
+        for limiter, identifier, event in self._events:
+            limiter.release(identifier, event)
+        self._events = []
+
+    def succeeded(self) -> None:
+        """Take the attempt back and clear the email's earlier failures"""
+        self.cancel()
+        login_email_limiter.reset(self.email)
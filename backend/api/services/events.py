@@ -0,0 +1,167 @@
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from functools import partial
+from typing import Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from ..models import Appointment
+from ..metrics import (
+    appointments_created_total,
+    appointments_confirmed_total,
+    appointment_duration_minutes,
+    appointment_lead_time_hours,
+    provider_appointments_total,
+    appointments_cancelled_total,
+    appointments_completed_total,
+    appointments_rescheduled_total,
+    hospital_appointments_total,
+    revenue_generated,
+    cancellation_lead_time_hours,
+)
+from .reference import reference_cache
+
+logger = logging.getLogger(__name__)
+
+# Event kind for a new booking, status changes use the Appointment.Status value
+BOOKING_CREATED = "CREATED"
+
+
+@dataclass(frozen=True)
+class BookingEvent:
+    """
+    Snapshot of an appointment lifecycle change.
+
+    Only values already loaded on the appointment are captured, label names
+    are resolved from the reference cache when the event is emitted.
+    """
+
+    kind: str
+    status: str
+    speciality_id: Optional[int]
+    hospital_id: int
+    provider_id: str
+    start: datetime
+    end: datetime
+    created_at: datetime
+    fees: Decimal
+    cancelled_by: Optional[str] = None
+    occurred_at: datetime = field(default_factory=timezone.now)
+
+    @classmethod
+    def capture(
+        cls,
+        kind: str,
+        appointment: Appointment,
+        cancelled_by: Optional[str] = None,
+    ) -> "BookingEvent":
+        provider = appointment.healthcare_provider
+        return cls(
+            kind=kind,
+            status=appointment.status,
+            speciality_id=provider.speciality_id,
+            hospital_id=appointment.location_id,
+            provider_id=str(provider.user_id),
+            start=appointment.appointment_start_datetime_utc,
+            end=appointment.appointment_end_datetime_utc,
+            created_at=appointment.created_at,
+            fees=provider.fees,
+            cancelled_by=cancelled_by,
+        )
+
+
+def record_booking_event(
+    kind: str,
+    appointment: Appointment,
+    cancelled_by: Optional[str] = None,
+) -> BookingEvent:
+    """
+    Record a booking event for the current transaction.
+
+    The event is emitted once the surrounding transaction commits and dropped
+    if it rolls back. Outside of a transaction it is emitted immediately.
+
+    Args:
+        kind (str): BOOKING_CREATED or the new Appointment.Status
+        appointment (Appointment): the appointment the change applies to
+        cancelled_by (Optional[str]): who cancelled the appointment, if cancelled
+
+    Returns:
+        BookingEvent: the captured event
+    """
+    event = BookingEvent.capture(kind, appointment, cancelled_by=cancelled_by)
+    transaction.on_commit(partial(emit_booking_event, event))
+    return event
+
+
+def emit_booking_event(event: BookingEvent) -> None:
+    """
+    Translate a committed booking event into Prometheus metrics.
+    """
+    try:
+        _emit(event)
+    except Exception:
+        # Metrics must never break a request that already committed
+        logger.exception("Failed to emit booking event %s", event.kind)
+
+
+def _emit(event: BookingEvent) -> None:
+    speciality = reference_cache.speciality(event.speciality_id)
+    speciality_id = str(event.speciality_id)
+    speciality_name = speciality.name if speciality else ""
+    hospital_id = str(event.hospital_id)
+
+    if event.kind == BOOKING_CREATED:
+        appointments_created_total.labels(
+            status=event.status,
+            speciality_id=speciality_id,
+            hospital_id=hospital_id,
+        ).inc()
+
+        duration_minutes = (event.end - event.start).total_seconds() / 60
+        appointment_duration_minutes.labels(speciality_name=speciality_name).observe(
+            duration_minutes
+        )
+
+        lead_time = (event.start - event.created_at).total_seconds() / 3600
+        appointment_lead_time_hours.labels(status=event.status).observe(lead_time)
+
+        if settings.METRICS_RAW_PROVIDER_COUNTERS:
+            provider_appointments_total.labels(
+                provider_id=event.provider_id,
+                speciality_name=speciality_name,
+                hospital_id=hospital_id,
+            ).inc()
+
+            hospital = reference_cache.hospital(event.hospital_id)
+            hospital_appointments_total.labels(
+                hospital_id=hospital_id,
+                city=hospital.city if hospital else "",
+                state=hospital.state if hospital else "",
+            ).inc()
+    elif event.kind == Appointment.Status.CANCELLED:
+        appointments_cancelled_total.labels(
+            cancellation_person=event.cancelled_by or "unknown",
+            speciality_id=speciality_id,
+        ).inc()
+
+        lead_time = (event.start - event.occurred_at).total_seconds() / 3600
+        cancellation_lead_time_hours.observe(lead_time)
+    elif event.kind == Appointment.Status.CONFIRMED:
+        appointments_confirmed_total.labels(
+            speciality_id=speciality_id, hospital_id=hospital_id
+        ).inc()
+    elif event.kind == Appointment.Status.COMPLETED:
+        appointments_completed_total.labels(
+            speciality_id=speciality_id, hospital_id=hospital_id
+        ).inc()
+
+        revenue_generated.labels(
+            speciality_name=speciality_name, hospital_id=hospital_id
+        ).inc(float(event.fees))
+    elif event.kind == Appointment.Status.RESCHEDULED:
+        appointments_rescheduled_total.labels(speciality_id=speciality_id).inc()
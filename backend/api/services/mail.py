@@ -0,0 +1,212 @@
+import logging
+import smtplib
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.db.models import Count, Min
+from django.template.loader import get_template
+from django.utils import timezone
+
+from .. import metrics
+from ..models import OutboundEmail
+
+if TYPE_CHECKING:
+    from django.template.backends.base import _EngineTemplate
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=32)
+def compiled_template(name: str) -> "_EngineTemplate":
+    """
+    Load and compile a template once per process.
+
+    The cached template loader is only enabled when DEBUG is off, and the
+    worker renders the same few templates for every email.
+    """
+    return get_template(name)
+
+
+def render_email(name: str, context: dict[str, Any]) -> tuple[str, str]:
+    """Render ``<name>.txt`` and ``<name>.html``, returning (text, html)"""
+    return (
+        compiled_template(f"{name}.txt").render(context),
+        compiled_template(f"{name}.html").render(context),
+    )
+
+
+def enqueue_email(
+    subject: str,
+    body: str,
+    to: Iterable[str],
+    html_body: str = "",
+    from_email: Optional[str] = None,
+) -> OutboundEmail:
+    """
+    Queue an email for the send_queued_email worker.
+
+    The row is written in the caller's transaction, so an email is only sent
+    when the change that triggered it is committed.
+    """
+    return OutboundEmail.objects.create(
+        subject=subject,
+        body=body,
+        html_body=html_body,
+        from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+        to=list(to),
+    )
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Exponential backoff after ``attempts`` failed deliveries, capped"""
+    seconds = settings.EMAIL_QUEUE_RETRY_BASE_SECONDS * 2 ** (attempts - 1)
+    return timedelta(seconds=min(seconds, settings.EMAIL_QUEUE_RETRY_MAX_SECONDS))
+
+
+def queue_depth() -> dict[str, int]:
+    """Number of queued emails per status"""
+    depth = {status: 0 for status in OutboundEmail.Status.values}
+    for row in OutboundEmail.objects.values("status").annotate(total=Count("id")):
+        depth[row["status"]] = row["total"]
+    return depth
+
+
+def oldest_pending_age() -> float:
+    """Seconds the oldest pending email has been waiting, 0 if none"""
+    oldest: Optional[datetime] = OutboundEmail.objects.filter(
+        status=OutboundEmail.Status.PENDING
+    ).aggregate(oldest=Min("created_at"))["oldest"]
+    if oldest is None:
+        return 0.0
+    return max(0.0, (timezone.now() - oldest).total_seconds())
+
+
+class EmailQueueWorker:
+    """
+    Sends due queued emails in batches over one reused SMTP connection.
+
+    Each batch is claimed with ``SELECT ... FOR UPDATE SKIP LOCKED``, so
+    several workers can drain the queue without sending an email twice. The
+    claim pushes the next attempt EMAIL_QUEUE_CLAIM_SECONDS ahead and is
+    committed before any email is sent, so no rows stay locked while the
+    SMTP server is slow. Emails of a worker that dies mid-batch are due
+    again once the claim runs out. The connection stays open between
+    batches and is only reopened after the server drops it, which avoids a
+    TCP and TLS handshake plus login per email.
+    """
+
+    def __init__(self, batch_size: Optional[int] = None, connection=None) -> None:
+        self.batch_size = batch_size or settings.EMAIL_QUEUE_BATCH_SIZE
+        self.max_attempts = settings.EMAIL_QUEUE_MAX_ATTEMPTS
+        self._connection = connection
+        self._opened = False
+
+    @property
+    def connection(self):
+        if self._connection is None:
+            self._connection = get_connection(fail_silently=False)
+        if not self._opened:
+            self._connection.open()
+            self._opened = True
+        return self._connection
+
+    def close(self) -> None:
+        if self._connection is not None and self._opened:
+            try:
+                self._connection.close()
+            except Exception as exc:
+                logger.warning("Failed to close email connection: %s", exc)
+        self._opened = False
+
+    def __enter__(self) -> "EmailQueueWorker":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def drain(self) -> int:
+        """Send batches until no email is due, returning the number processed"""
+        processed = 0
+        while True:
+            count = self.send_batch()
+            if not count:
+                return processed
+            processed += count
+
+    def send_batch(self) -> int:
+        """Claim and send one batch of due emails"""
+        now = timezone.now()
+        with transaction.atomic():
+            batch = list(
+                OutboundEmail.objects.select_for_update(skip_locked=True)
+                .filter(
+                    status=OutboundEmail.Status.PENDING,
+                    next_attempt_at__lte=now,
+                )
+                .order_by("next_attempt_at", "id")[: self.batch_size]
+            )
+            claimed_until = now + timedelta(seconds=settings.EMAIL_QUEUE_CLAIM_SECONDS)
+            OutboundEmail.objects.filter(pk__in=[email.pk for email in batch]).update(
+                next_attempt_at=claimed_until
+            )
+
+        for email in batch:
+            self.deliver(email)
+        return len(batch)
+
+    def deliver(self, email: OutboundEmail) -> None:
+        now = timezone.now()
+        email.attempts += 1
+        try:
+            self.send(email)
+        except Exception as exc:
+            logger.warning("Failed to send email %s: %s", email.pk, exc)
+            email.last_error = str(exc)[:1000]
+            if email.attempts >= self.max_attempts:
+                email.status = OutboundEmail.Status.FAILED
+                metrics.emails_sent_total.labels(result="failed").inc()
+            else:
+                email.next_attempt_at = now + retry_delay(email.attempts)
+                metrics.emails_sent_total.labels(result="retry").inc()
+        else:
+            email.status = OutboundEmail.Status.SENT
+            email.sent_at = now
+            email.last_error = ""
+            metrics.emails_sent_total.labels(result="sent").inc()
+        email.save(
+            update_fields=[
+                "status",
+                "attempts",
+                "next_attempt_at",
+                "last_error",
+                "sent_at",
+                "updated_at",
+            ]
+        )
+
+    def send(self, email: OutboundEmail) -> None:
+        message = self.build_message(email)
+        try:
+            message.connection = self.connection
+            message.send()
+        except (smtplib.SMTPServerDisconnected, ConnectionError):
+            # The server closed an idle connection, retry once on a new one
+            self.close()
+            message.connection = self.connection
+            message.send()
+
+    @staticmethod
+    def build_message(email: OutboundEmail) -> EmailMultiAlternatives:
+        message = EmailMultiAlternatives(
+            subject=email.subject,
+            body=email.body,
+            from_email=email.from_email,
+            to=email.to,
+        )
+        if email.html_body:
+            message.attach_alternative(email.html_body, "text/html")
+        return message
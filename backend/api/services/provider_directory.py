@@ -0,0 +1,191 @@
+from typing import Any, Callable
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.postgres.search import TrigramWordDistance
+from django.db import transaction
+from django.db.models import CharField, Count, F, Q, Value
+from django.db.models.functions import Collate, Concat, Upper
+from rest_framework.request import Request
+
+from ..models import HealthcareProvider, Speciality
+from ..utils.cache import TieredCache
+
+# Query parameters that change the provider list response
+DIRECTORY_PARAMS = ("speciality", "search", "page")
+
+directory_cache = TieredCache(
+    "provider-directory", timeout=settings.PROVIDER_DIRECTORY_CACHE_SECONDS
+)
+autocomplete_cache = TieredCache(
+    "provider-autocomplete", timeout=settings.PROVIDER_AUTOCOMPLETE_CACHE_SECONDS
+)
+
+# Shorter text only matches as a prefix
+FUZZY_MIN_LENGTH = 3
+
+
+def directory_key(request: Request) -> str:
+    """
+    Cache key of a provider list page.
+
+    The origin is part of the key because image URLs are absolute.
+    """
+    params = [(name, request.query_params.get(name, "")) for name in DIRECTORY_PARAMS]
+    return f"{request.build_absolute_uri('/')}?{urlencode(params)}"
+
+
+def get_directory_page(request: Request, render: Callable[[], Any]) -> Any:
+    """
+    Serialized provider list page for the request, rendered on a miss.
+
+    Concurrent misses for the same page are rendered once.
+    """
+    return directory_cache.get_or_set(directory_key(request), render)
+
+
+def invalidate_directory() -> None:
+    """
+    Drop all cached directory pages.
+
+    Also runs again on commit, so a page rendered from uncommitted data in
+    between does not outlive the transaction.
+    """
+    _invalidate_caches()
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(_invalidate_caches)
+
+
+def _invalidate_caches() -> None:
+    directory_cache.invalidate()
+    autocomplete_cache.invalidate()
+
+
+def autocomplete_providers(text: str, limit: int) -> list[dict[str, Any]]:
+    """
+    Listed providers matching ``text`` as typed, best first.
+
+    Names where every word starts the first or last name come first: last
+    name matches by last name, then first name matches by first name. When
+    they don't fill ``limit``, full names containing words trigram-similar
+    to ``text`` (typos) follow, nearest first. Both are looked up in the
+    name indexes on User rather than by scanning it.
+
+    Short prefixes are the most repeated and the least selective, so their
+    results are cached.
+    """
+    text = " ".join(text.split())
+    if not text:
+        return []
+    if len(text) > settings.PROVIDER_AUTOCOMPLETE_CACHED_LENGTH:
+        return _autocomplete(text, limit)
+    key = f"{text.lower()}:{limit}"
+    return autocomplete_cache.get_or_set(key, lambda: _autocomplete(text, limit))
+
+
+def _autocomplete(text: str, limit: int) -> list[dict[str, Any]]:
+    words = text.upper().split()
+    providers = HealthcareProvider.objects.filter(
+        is_removed=False, user__is_active=True
+    ).annotate(
+        name=Concat(
+            "user__first_name", Value(" "), "user__last_name", output_field=CharField()
+        ),
+        speciality_name=F("speciality__name"),
+    )
+
+    # Last name matches, then first name ones, each a range of its prefix
+    # index led by the first word
+    matches_every_word = Q()
+    for word in words:
+        matches_every_word &= Q(first_key__startswith=word) | Q(
+            last_key__startswith=word
+        )
+    rows: list[dict[str, Any]] = []
+    for key, then in (("last_key", "first_key"), ("first_key", "last_key")):
+        if len(rows) == limit:
+            break
+        rows += (
+            providers.alias(
+                first_key=_sort_key("user__first_name"),
+                last_key=_sort_key("user__last_name"),
+            )
+            .filter(matches_every_word, **{f"{key}__startswith": words[0]})
+            .exclude(user_id__in=[row["user_id"] for row in rows])
+            .order_by(key, then, "user_id")
+            .values("user_id", "name", "speciality_name")[: limit - len(rows)]
+        )
+
+    if len(rows) < limit and len(text) >= FUZZY_MIN_LENGTH:
+        rows += (
+            providers.alias(search_name=Upper("name"))
+            .filter(search_name__trigram_word_similar=text.upper())
+            .exclude(user_id__in=[row["user_id"] for row in rows])
+            .order_by(TrigramWordDistance(text.upper(), "search_name"), "user_id")
+            .values("user_id", "name", "speciality_name")[: limit - len(rows)]
+        )
+
+    return [
+        {
+            "id": str(row["user_id"]),
+            "name": row["name"],
+            "speciality": row["speciality_name"],
+        }
+        for row in rows
+    ]
+
+
+def _sort_key(field: str) -> Collate:
+    # The expression of the name prefix indexes on User
+    return Collate(Upper(field), "C")
+
+
+def top_specialities(limit: int) -> list[int]:
+    """Ids of the specialities with the most listed providers"""
+    return list(
+        Speciality.objects.filter(is_removed=False)
+        .annotate(
+            providers=Count(
+                "provider_speciality",
+                filter=Q(
+                    provider_speciality__is_removed=False,
+                    provider_speciality__user__is_active=True,
+                ),
+            )
+        )
+        .order_by("-providers", "name")
+        .values_list("id", flat=True)[:limit]
+    )
+
+
+def warm_directory(host: str, secure: bool = True, limit: int = 10) -> int:
+    """
+    Render the unfiltered directory and the first page of the top specialities.
+
+    Args:
+        host (str): public host of the API, used in absolute image URLs
+        secure (bool): whether the API is served over https
+        limit (int): number of specialities to warm
+
+    Returns:
+        int: number of pages rendered
+    """
+    from django.test import RequestFactory
+    from rest_framework.test import force_authenticate
+
+    from ..views import HealthcareProviderViewSet
+
+    view = HealthcareProviderViewSet.as_view({"get": "list"})
+    factory = RequestFactory()
+    # The listing is the same for every authenticated user
+    user = get_user_model()(is_active=True)
+
+    queries: list[dict[str, Any]] = [{}] + [
+        {"speciality": pk} for pk in top_specialities(limit)
+    ]
+    for query in queries:
+        request = factory.get("/api/provider/", query, HTTP_HOST=host, secure=secure)
+        force_authenticate(request, user=user)
+        view(request)
+    return len(queries)
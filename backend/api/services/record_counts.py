@@ -0,0 +1,145 @@
+from datetime import timedelta
+from typing import Any, Iterable, Mapping, Optional
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Count, DateField, F, Q
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+from ..models import MedicalRecord, MedicalRecordCount
+
+RECENT_DAYS = 30
+
+
+def record_stats(**owner) -> dict[str, Any]:
+    """
+    Live medical records of ``patient=`` or ``healthcare_provider=``: the
+    total, those of the last 30 days, and the total by hospital and by
+    month. Read from the owner's MedicalRecordCount rows when counters are
+    kept, otherwise from a single grouped pass over the records.
+    """
+    records = MedicalRecord.objects.filter(is_removed=False, **owner)
+    since = timezone.now() - timedelta(days=RECENT_DAYS)
+    if not settings.MEDICAL_RECORD_COUNTERS:
+        rows = list(
+            records.values(
+                "hospital_id",
+                "hospital__name",
+                month=TruncMonth("created_at", output_field=DateField()),
+            )
+            .annotate(
+                records=Count("id"), recent=Count("id", filter=Q(created_at__gte=since))
+            )
+            .order_by()
+        )
+        return summarize(rows, recent=sum(row["recent"] for row in rows))
+
+    counts = MedicalRecordCount.objects.filter(records__gt=0, **owner).values(
+        "hospital_id", "hospital__name", "month", "records"
+    )
+    # The window is short, so this is a bounded range of the owner's
+    # (-created_at) page index rather than a scan of all their records
+    return summarize(counts, recent=records.filter(created_at__gte=since).count())
+
+
+def summarize(rows: Iterable[Mapping[str, Any]], recent: int) -> dict[str, Any]:
+    total = 0
+    hospitals: dict[int, dict[str, Any]] = {}
+    months: dict[str, int] = {}
+    for row in rows:
+        total += row["records"]
+        hospital = hospitals.setdefault(
+            row["hospital_id"],
+            {
+                "hospital_id": row["hospital_id"],
+                "hospital_name": row["hospital__name"],
+                "records": 0,
+            },
+        )
+        hospital["records"] += row["records"]
+        month = row["month"].strftime("%Y-%m")
+        months[month] = months.get(month, 0) + row["records"]
+    return {
+        "total_records": total,
+        "recent_records": recent,
+        "by_hospital": sorted(
+            hospitals.values(), key=lambda h: (-h["records"], h["hospital_id"])
+        ),
+        "by_month": [
+            {"month": month, "records": records}
+            for month, records in sorted(months.items(), reverse=True)
+        ],
+    }
+
+
+def remember_count_key(record: MedicalRecord) -> None:
+    """
+    Before saving a record, read the bucket it is stored under, so
+    count_record() knows where it was counted. The row stays locked until
+    the save's transaction ends: a concurrent save of the same record,
+    e.g. a second soft delete, waits and then sees this one's outcome
+    instead of moving the record out of a bucket it already left.
+    """
+    if record._state.adding:
+        return
+    saved = (
+        MedicalRecord.objects.select_for_update()
+        .only("is_removed", "patient", "healthcare_provider", "hospital", "created_at")
+        .filter(pk=record.pk)
+        .first()
+    )
+    record._counted_key = saved.count_key() if saved else None
+
+
+def count_record(record: MedicalRecord, created: bool) -> None:
+    """
+    Move the record between MedicalRecordCount buckets after a save: into
+    its bucket when created or restored, out of it when removed, and
+    across when its owners, hospital or creation month change.
+    """
+    old = None if created else getattr(record, "_counted_key", None)
+    new = record.count_key()
+    if old != new:
+        _add(old, -1)
+        _add(new, 1)
+    record._counted_key = new
+
+
+def uncount_record(record: MedicalRecord) -> None:
+    _add(getattr(record, "_counted_key", record.count_key()), -1)
+
+
+def _add(key: Optional[tuple], delta: int) -> None:
+    if key is None:
+        return
+    patient_id, provider_id, hospital_id, month = key
+    for owner in ({"patient_id": patient_id}, {"healthcare_provider_id": provider_id}):
+        bucket = {**owner, "hospital_id": hospital_id, "month": month}
+        counts = MedicalRecordCount.objects.filter(**bucket)
+        if counts.update(records=F("records") + delta):
+            continue
+        try:
+            with transaction.atomic():
+                MedicalRecordCount.objects.create(**bucket, records=delta)
+        except IntegrityError:
+            # Created concurrently
+            counts.update(records=F("records") + delta)
+
+
+def rebuild_counts() -> int:
+    """Recount every bucket from the records, returns the number of rows"""
+    records = MedicalRecord.objects.filter(is_removed=False).order_by()
+    month = TruncMonth("created_at", output_field=DateField())
+    rows = []
+    for owner in ("patient_id", "healthcare_provider_id"):
+        rows += [
+            MedicalRecordCount(**row)
+            for row in records.values(owner, "hospital_id", month=month).annotate(
+                records=Count("id")
+            )
+        ]
+    with transaction.atomic():
+        MedicalRecordCount.objects.all().delete()
+        MedicalRecordCount.objects.bulk_create(rows, batch_size=1000)
+    return len(rows)
@@ -0,0 +1,105 @@
+from typing import Any, Iterable, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q, QuerySet
+
+from ..models import MedicalRecord
+
+# Rows rendered into MedicalRecord.detail, with everything they read
+DETAIL_RELATED = (
+    "patient__user",
+    "healthcare_provider__user",
+    "healthcare_provider__speciality",
+    "hospital",
+    "appointment",
+    "created_by",
+    "updated_by",
+)
+
+
+def render_detail(record: MedicalRecord) -> dict[str, Any]:
+    from ..serializers import MedicalRecordDetailSerializer
+
+    rendered: dict[str, Any] = MedicalRecordDetailSerializer(record).data
+    return rendered
+
+
+def refresh_details(queryset: QuerySet, batch_size: int = 500) -> int:
+    """
+    Render and store ``detail`` for the records in ``queryset``. Rendering
+    goes through the serializer so the stored payload is exactly what it
+    returns, and is written with bulk_update, which leaves ``updated_at``
+    and the save signals alone.
+    """
+    records = queryset.select_related(*DETAIL_RELATED).order_by()
+    batch: list[MedicalRecord] = []
+    refreshed = 0
+    for record in records.iterator(chunk_size=batch_size):
+        record.detail = render_detail(record)
+        batch.append(record)
+        if len(batch) == batch_size:
+            refreshed += MedicalRecord.objects.bulk_update(batch, ["detail"])
+            batch = []
+    if batch:
+        refreshed += MedicalRecord.objects.bulk_update(batch, ["detail"])
+    return refreshed
+
+
+def records_for_user(user_id) -> QuerySet:
+    """The records naming the user as patient, provider or editor"""
+    return MedicalRecord.objects.filter(
+        Q(patient_id=user_id)
+        | Q(healthcare_provider_id=user_id)
+        | Q(created_by_id=user_id)
+        | Q(updated_by_id=user_id)
+    )
+
+
+def invalidate_details(queryset: QuerySet) -> None:
+    """
+    After a change to a row the records in ``queryset`` render, e.g. their
+    hospital. The stored payloads are cleared in one UPDATE in the caller's
+    transaction, and once it commits at most
+    MEDICAL_RECORD_DETAIL_REFRESH_LIMIT of them are rendered again. The rest
+    are rendered on read until ``manage.py refresh_record_details`` stores
+    them, so a change shared by many records never renders them all in the
+    request.
+    """
+    queryset.filter(detail__isnull=False).update(detail=None)
+    limit = int(settings.MEDICAL_RECORD_DETAIL_REFRESH_LIMIT)
+    transaction.on_commit(lambda: refresh_stale_details(queryset, limit))
+
+
+def refresh_stale_details(
+    queryset: Optional[QuerySet] = None, limit: Optional[int] = None
+) -> int:
+    """Render and store the missing payloads in ``queryset``, up to ``limit``"""
+    if queryset is None:
+        queryset = MedicalRecord.objects.all()
+    stale = queryset.filter(detail__isnull=True).order_by("pk")
+    if limit is not None:
+        stale = MedicalRecord.objects.filter(
+            pk__in=list(stale.values_list("pk", flat=True)[:limit])
+        )
+    return refresh_details(stale)
+
+
+def stored_details(rows: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    The stored payloads of ``rows`` (values() with ``id`` and ``detail``).
+    Records without one, saved before the column existed or past the refresh
+    limit of invalidate_details(), are rendered without being stored, so a
+    read never writes.
+    """
+    rows = list(rows)
+    missing = [row["id"] for row in rows if row["detail"] is None]
+    if missing:
+        records = MedicalRecord.objects.filter(pk__in=missing).select_related(
+            *DETAIL_RELATED
+        )
+        rendered = {record.pk: render_detail(record) for record in records}
+        for row in rows:
+            if row["detail"] is None:
+                row["detail"] = rendered[row["id"]]
+    return [row["detail"] for row in rows]
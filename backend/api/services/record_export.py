@@ -0,0 +1,66 @@
+import csv
+from itertools import chain
+from typing import Any, Iterable, Iterator
+
+from django.conf import settings
+
+from ..renderers import FastJSONRenderer
+from ..serializers.values import ValuesSerializer
+
+# Streamed response bodies are written in pieces of about this many bytes
+WRITE_SIZE = 64 * 1024
+
+# Spreadsheets run a cell starting with one of these as a formula
+FORMULA_PREFIXES = ("=", "+", "-", "@")
+
+
+class Echo:
+    """File-like object whose write returns the line, for csv.writer"""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def export_rows(serializer: ValuesSerializer) -> Iterator[dict[str, Any]]:
+    """
+    The serializer's rows, fetched through a server-side cursor
+    MEDICAL_RECORD_EXPORT_CHUNK_SIZE at a time and rendered one by one, so
+    memory does not grow with the number of rows.
+    """
+    chunk_size = settings.MEDICAL_RECORD_EXPORT_CHUNK_SIZE
+    for row in serializer.rows().iterator(chunk_size=chunk_size):
+        yield serializer.to_representation(row)
+
+
+def csv_lines(rows: Iterable[dict[str, Any]], header: list[str]) -> Iterator[bytes]:
+    writer = csv.writer(Echo())
+    lines = (writer.writerow([_cell(row[key]) for key in header]) for row in rows)
+    return _buffered(chain([writer.writerow(header)], lines))
+
+
+def _cell(value: Any) -> Any:
+    # Free text such as a diagnosis is written as text, never as a formula
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def ndjson_lines(rows: Iterable[dict[str, Any]]) -> Iterator[bytes]:
+    renderer = FastJSONRenderer()
+    return _buffered(renderer.render(row) + b"\n" for row in rows)
+
+
+def _buffered(lines: Iterable[str | bytes]) -> Iterator[bytes]:
+    # One write per line would mean a socket write per record
+    buffer: list[bytes] = []
+    size = 0
+    for line in lines:
+        if isinstance(line, str):
+            line = line.encode()
+        buffer.append(line)
+        size += len(line)
+        if size >= WRITE_SIZE:
+            yield b"".join(buffer)
+            buffer, size = [], 0
+    if buffer:
+        yield b"".join(buffer)
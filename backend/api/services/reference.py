@@ -0,0 +1,201 @@
+import copy
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+
+from ..models import Hospital, ProviderHospitalAssignment, Speciality
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = "reference:version"
+SNAPSHOT_KEY = "reference:snapshot:{version}"
+SNAPSHOT_TIMEOUT = 24 * 60 * 60
+
+
+@dataclass(frozen=True)
+class ReferenceSnapshot:
+    """
+    Contents of the reference tables at one point in time.
+
+    Affiliations are the (provider_id, hospital_id) pairs with an active,
+    open-ended ProviderHospitalAssignment.
+    """
+
+    specialities: dict[int, Speciality]
+    hospitals: dict[int, Hospital]
+    affiliations: frozenset[tuple[Any, int]]
+
+    @classmethod
+    def load(cls) -> "ReferenceSnapshot":
+        return cls(
+            specialities={s.id: s for s in Speciality.objects.all()},
+            hospitals={h.id: h for h in Hospital.objects.all()},
+            affiliations=frozenset(
+                ProviderHospitalAssignment.objects.filter(
+                    is_active=True, end_datetime_utc__isnull=True
+                ).values_list("healthcare_provider_id", "hospital_id")
+            ),
+        )
+
+
+class ReferenceCache:
+    """
+    Versioned read cache for Speciality, Hospital and ProviderHospitalAssignment.
+
+    Each process keeps a snapshot of the three tables. A version number in
+    the shared cache (Redis) is bumped on every write, and a process whose
+    snapshot is older reloads it from the shared cache, or from the database
+    when no other process has stored that version yet. The shared version is
+    checked at most every REFERENCE_CACHE_CHECK_SECONDS.
+
+    The version is bumped both when a row changes and when its transaction
+    commits, so a snapshot built from uncommitted data never outlives the
+    commit. Until then the writing thread reads straight from the database.
+    When the shared cache is unavailable, snapshots are only kept for one
+    check interval.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._snapshot: Optional[ReferenceSnapshot] = None
+        self._version: Optional[int] = None
+        self._checked_at = 0.0
+        self._local = threading.local()
+
+    def speciality(
+        self, speciality_id: Optional[int], active_only: bool = False
+    ) -> Optional[Speciality]:
+        if speciality_id is None:
+            return None
+        speciality = self.snapshot().specialities.get(speciality_id)
+        if speciality is None or (active_only and speciality.is_removed):
+            return None
+        return copy.copy(speciality)
+
+    def specialities(self, active_only: bool = True) -> list[Speciality]:
+        """Specialities ordered by name"""
+        return [
+            copy.copy(speciality)
+            for speciality in sorted(
+                self.snapshot().specialities.values(), key=lambda s: s.name
+            )
+            if not (active_only and speciality.is_removed)
+        ]
+
+    def hospital(
+        self, hospital_id: Optional[int], active_only: bool = False
+    ) -> Optional[Hospital]:
+        if hospital_id is None:
+            return None
+        hospital = self.snapshot().hospitals.get(hospital_id)
+        if hospital is None or (active_only and hospital.is_removed):
+            return None
+        return copy.copy(hospital)
+
+    def is_affiliated(self, provider_id: Any, hospital_id: int) -> bool:
+        """Whether the provider has an active assignment at the hospital"""
+        return (provider_id, hospital_id) in self.snapshot().affiliations
+
+    def snapshot(self) -> ReferenceSnapshot:
+        if self._has_pending_write():
+            return ReferenceSnapshot.load()
+
+        snapshot = self._snapshot
+        if snapshot is not None and not self._check_due():
+            return snapshot
+
+        with self._lock:
+            version = self._shared_version()
+            if self._snapshot is None or version is None or version != self._version:
+                self._snapshot = self._fetch(version)
+                self._version = version
+            self._checked_at = time.monotonic()
+            return self._snapshot
+
+    def invalidate(self) -> None:
+        """
+        Drop cached reference data after a write to one of the tables.
+        """
+        with self._lock:
+            self._snapshot = None
+        self._bump()
+        if connection.in_atomic_block:
+            self._local.pending_write = True
+            transaction.on_commit(self._committed)
+
+    def clear(self) -> None:
+        """Forget all process-local state"""
+        with self._lock:
+            self._snapshot = None
+            self._version = None
+        self._local.pending_write = False
+
+    def _committed(self) -> None:
+        self._local.pending_write = False
+        with self._lock:
+            self._snapshot = None
+        self._bump()
+
+    def _has_pending_write(self) -> bool:
+        if not getattr(self._local, "pending_write", False):
+            return False
+        # Rolled back, on_commit never fired
+        if not connection.in_atomic_block:
+            self._local.pending_write = False
+        return bool(self._local.pending_write)
+
+    def _check_due(self) -> bool:
+        interval = float(settings.REFERENCE_CACHE_CHECK_SECONDS)
+        return time.monotonic() - self._checked_at >= interval
+
+    def _shared_version(self) -> Optional[int]:
+        try:
+            version: Optional[int] = cache.get(VERSION_KEY)
+            if version is None:
+                cache.add(VERSION_KEY, time.time_ns(), timeout=None)
+                version = cache.get(VERSION_KEY)
+            return version
+        except Exception as exc:
+            logger.warning("Reference cache version unavailable: %s", exc)
+            return None
+
+    @staticmethod
+    def _bump() -> None:
+        try:
+            try:
+                cache.incr(VERSION_KEY)
+            except ValueError:
+                # Missing key, start from a value no process has seen
+                cache.set(VERSION_KEY, time.time_ns(), timeout=None)
+        except Exception as exc:
+            logger.warning("Failed to bump reference cache version: %s", exc)
+
+    @staticmethod
+    def _fetch(version: Optional[int]) -> ReferenceSnapshot:
+        if version is None:
+            return ReferenceSnapshot.load()
+
+        key = SNAPSHOT_KEY.format(version=version)
+        try:
+            snapshot: Optional[ReferenceSnapshot] = cache.get(key)
+        except Exception as exc:
+            logger.warning("Reference snapshot unavailable: %s", exc)
+            return ReferenceSnapshot.load()
+        if snapshot is not None:
+            return snapshot
+
+        snapshot = ReferenceSnapshot.load()
+        try:
+            cache.set(key, snapshot, timeout=SNAPSHOT_TIMEOUT)
+        except Exception as exc:
+            logger.warning("Failed to store reference snapshot: %s", exc)
+        return snapshot
+
+
+reference_cache = ReferenceCache()
@@ -0,0 +1,89 @@
+import re
+from typing import Iterable, Optional
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db.models import F, FloatField, OuterRef, Q, QuerySet, Subquery
+from django.db.models.expressions import CombinedExpression
+from django.db.models.functions import Cast
+
+SEARCH_CONFIG = "english"
+SEARCH_RANK = "search_rank"
+
+WORD = re.compile(r"\w+")
+
+
+def medical_record_vector() -> CombinedExpression:
+    """
+    The weighted search document of a medical record: diagnosis and the
+    patient and provider names first, then prescriptions, hospital, notes.
+    """
+    return (
+        SearchVector(
+            "diagnosis",
+            "patient__user__first_name",
+            "patient__user__last_name",
+            "healthcare_provider__user__first_name",
+            "healthcare_provider__user__last_name",
+            weight="A",
+            config=SEARCH_CONFIG,
+        )
+        + SearchVector("prescriptions", weight="B", config=SEARCH_CONFIG)
+        + SearchVector("hospital__name", weight="C", config=SEARCH_CONFIG)
+        + SearchVector("notes", weight="D", config=SEARCH_CONFIG)
+    )
+
+
+def refresh_search_vectors(queryset: QuerySet) -> int:
+    """
+    Recompute ``search_vector`` for the records in ``queryset`` in one
+    UPDATE. The document joins the names from other tables, which an UPDATE
+    can't, so each row reads its own from a correlated subquery.
+    """
+    document = (
+        queryset.model.objects.filter(pk=OuterRef("pk"))
+        .annotate(document=medical_record_vector())
+        .values("document")[:1]
+    )
+    return queryset.update(search_vector=Subquery(document))
+
+
+def refresh_for_user(user_id) -> int:
+    """After a rename, the records where the user is patient or provider"""
+    from ..models import MedicalRecord
+
+    return refresh_search_vectors(
+        MedicalRecord.objects.filter(
+            Q(patient_id=user_id) | Q(healthcare_provider_id=user_id)
+        )
+    )
+
+
+def search_query(terms: Iterable[str]) -> Optional[SearchQuery]:
+    """
+    Every word of ``terms`` as a prefix, so partial words still match the
+    way the ``icontains`` search did. None when there is no word to search.
+    """
+    words = WORD.findall(" ".join(terms))
+    if not words:
+        return None
+    return SearchQuery(
+        " & ".join(f"{word}:*" for word in words),
+        search_type="raw",
+        config=SEARCH_CONFIG,
+    )
+
+
+def ranked_search(
+    queryset: QuerySet, terms: Iterable[str], field: str = "search_vector"
+) -> QuerySet:
+    """
+    Rows whose ``field`` matches ``terms``, annotated with their rank. The
+    rank is cast from real to double precision so it reads back exactly and
+    can be compared against in a pagination cursor.
+    """
+    query = search_query(terms)
+    if query is None:
+        return queryset
+    rank = Cast(SearchRank(F(field), query), FloatField())
+    ranked: QuerySet = queryset.filter(**{field: query}).annotate(**{SEARCH_RANK: rank})
+    return ranked
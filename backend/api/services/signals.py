@@ -1,6 +1,25 @@
-from django.db.models.signals import post_save
+from django.conf import settings
+from django.db.models.signals import post_save, post_delete, pre_save, m2m_changed
 from django.dispatch import receiver
-from ..models import MedicalRecord, Appointment
+from ..authentication import mark_roles_changed
+from ..models import (
+    User,
+    Patient,
+    MedicalRecord,
+    Appointment,
+    Speciality,
+    Hospital,
+    HealthcareProvider,
+    AdminStaff,
+    SystemAdmin,
+    ProviderHospitalAssignment,
+)
+from .provider_directory import invalidate_directory
+from .record_counts import count_record, remember_count_key, uncount_record
+from .record_detail import invalidate_details, records_for_user, refresh_details
+from .reference import reference_cache
+from .search import refresh_for_user, refresh_search_vectors
+from .user_profile import invalidate_profile
 
 
 @receiver(post_save, sender=MedicalRecord)
@@ -13,3 +32,168 @@ def update_appointment_status(sender, instance, created, **kwargs):
             appointment.save()
         except Appointment.DoesNotExist:
             pass
+
+
+@receiver(post_save, sender=MedicalRecord)
+def update_search_vector(sender, instance, **kwargs):
+    refresh_search_vectors(MedicalRecord.objects.filter(pk=instance.pk))
+
+
+@receiver(post_save, sender=User)
+def update_search_vector_on_user(sender, instance, created, **kwargs):
+    """Records carry the patient and provider names"""
+    update_fields = kwargs.get("update_fields")
+    names = {"first_name", "last_name"}
+    if created or (update_fields and not names & set(update_fields)):
+        return
+    refresh_for_user(instance.pk)
+
+
+@receiver(post_save, sender=Hospital)
+def update_search_vector_on_hospital(sender, instance, created, **kwargs):
+    if not created:
+        refresh_search_vectors(MedicalRecord.objects.filter(hospital=instance))
+
+
+@receiver(pre_save, sender=MedicalRecord)
+def remember_record_count(sender, instance, **kwargs):
+    if settings.MEDICAL_RECORD_COUNTERS:
+        remember_count_key(instance)
+
+
+@receiver(post_save, sender=MedicalRecord)
+def update_record_counts(sender, instance, created, **kwargs):
+    """Counted on create, soft delete and restore, inside the save's transaction"""
+    if settings.MEDICAL_RECORD_COUNTERS:
+        count_record(instance, created)
+
+
+@receiver(post_delete, sender=MedicalRecord)
+def update_record_counts_on_delete(sender, instance, **kwargs):
+    if settings.MEDICAL_RECORD_COUNTERS:
+        uncount_record(instance)
+
+
+@receiver(post_save, sender=MedicalRecord)
+def update_detail(sender, instance, **kwargs):
+    refresh_details(MedicalRecord.objects.filter(pk=instance.pk))
+
+
+@receiver(post_save, sender=User)
+def update_detail_on_user(sender, instance, created, **kwargs):
+    """Records carry the names, birth date and image of the people on them"""
+    update_fields = kwargs.get("update_fields")
+    if created or (update_fields and set(update_fields) <= {"last_login", "password"}):
+        return
+    invalidate_details(records_for_user(instance.pk))
+
+
+@receiver(post_save, sender=Patient)
+@receiver(post_save, sender=HealthcareProvider)
+@receiver(post_save, sender=Speciality)
+@receiver(post_save, sender=Hospital)
+@receiver(post_save, sender=Appointment)
+def update_detail_on_related(sender, instance, created, **kwargs):
+    if created:
+        return
+    lookup = {
+        Patient: "patient",
+        HealthcareProvider: "healthcare_provider",
+        Speciality: "healthcare_provider__speciality",
+        Hospital: "hospital",
+        Appointment: "appointment",
+    }[sender]
+    invalidate_details(MedicalRecord.objects.filter(**{lookup: instance}))
+
+
+@receiver(post_save, sender=Speciality)
+@receiver(post_delete, sender=Speciality)
+@receiver(post_save, sender=Hospital)
+@receiver(post_delete, sender=Hospital)
+@receiver(post_save, sender=ProviderHospitalAssignment)
+@receiver(post_delete, sender=ProviderHospitalAssignment)
+def invalidate_reference_cache(sender, **kwargs):
+    """Drop cached reference data when a speciality, hospital or assignment changes"""
+    reference_cache.invalidate()
+
+
+@receiver(m2m_changed, sender=HealthcareProvider.hospitals.through)
+def invalidate_reference_cache_on_assignment(sender, action, **kwargs):
+    """Assignments changed through HealthcareProvider.hospitals skip post_save"""
+    if action in ("post_add", "post_remove", "post_clear"):
+        reference_cache.invalidate()
+
+
+@receiver(post_save, sender=HealthcareProvider)
+@receiver(post_delete, sender=HealthcareProvider)
+@receiver(post_save, sender=Speciality)
+@receiver(post_delete, sender=Speciality)
+@receiver(post_save, sender=ProviderHospitalAssignment)
+@receiver(post_delete, sender=ProviderHospitalAssignment)
+def invalidate_provider_directory(sender, **kwargs):
+    """Drop cached provider list pages when a listed row changes"""
+    invalidate_directory()
+
+
+@receiver(m2m_changed, sender=HealthcareProvider.hospitals.through)
+def invalidate_provider_directory_on_assignment(sender, action, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear"):
+        invalidate_directory()
+
+
+@receiver(post_save, sender=User)
+def invalidate_provider_directory_on_user(sender, instance, **kwargs):
+    """Provider names, images and activity come from the user row"""
+    update_fields = kwargs.get("update_fields")
+    if update_fields and set(update_fields) <= {"last_login", "password"}:
+        return
+    if HealthcareProvider.objects.filter(user_id=instance.pk).exists():
+        invalidate_directory()
+
+
+@receiver(post_save, sender=Patient)
+@receiver(post_delete, sender=Patient)
+@receiver(post_save, sender=HealthcareProvider)
+@receiver(post_delete, sender=HealthcareProvider)
+@receiver(post_save, sender=AdminStaff)
+@receiver(post_delete, sender=AdminStaff)
+@receiver(post_save, sender=SystemAdmin)
+@receiver(post_delete, sender=SystemAdmin)
+def invalidate_role_claims(sender, instance, **kwargs):
+    """Access tokens carry the user's roles, and the hospital of admin staff"""
+    if kwargs.get("created") is False and sender is not AdminStaff:
+        return
+    mark_roles_changed(instance.user_id)
+
+
+@receiver(post_save, sender=Patient)
+@receiver(post_delete, sender=Patient)
+@receiver(post_save, sender=HealthcareProvider)
+@receiver(post_delete, sender=HealthcareProvider)
+@receiver(post_save, sender=AdminStaff)
+@receiver(post_delete, sender=AdminStaff)
+@receiver(post_save, sender=SystemAdmin)
+@receiver(post_delete, sender=SystemAdmin)
+def invalidate_profile_on_role(sender, instance, **kwargs):
+    """The cached user payload has a flag per role"""
+    if kwargs.get("created") is False:
+        return
+    invalidate_profile(instance.user_id)
+
+
+@receiver(post_save, sender=User)
+def invalidate_role_claims_on_user(sender, instance, created, **kwargs):
+    """Access tokens carry the user's active and staff flags"""
+    update_fields = kwargs.get("update_fields")
+    if created or (update_fields and set(update_fields) <= {"last_login"}):
+        return
+    mark_roles_changed(instance.pk)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_profile_on_user(sender, instance, **kwargs):
+    update_fields = kwargs.get("update_fields")
+    if update_fields and set(update_fields) <= {"last_login"}:
+        return
+    invalidate_profile(instance.pk)
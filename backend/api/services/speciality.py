@@ -1,16 +1,16 @@
 from typing import Optional
 from django.core.exceptions import ValidationError
 from django.db import transaction
-from django.db.models import QuerySet
 from django.utils import timezone
 from django.core.files.uploadedfile import SimpleUploadedFile
 
 from ..models import Speciality
+from .reference import reference_cache
 
 
 class SpecialityService:
     @staticmethod
-    def get_all_specialities(active_only: bool = True) -> QuerySet[Speciality]:
+    def get_all_specialities(active_only: bool = True) -> list[Speciality]:
         """
         Retrieve all specialities, optionally filtering to active ones only.
 
@@ -19,12 +19,10 @@ class SpecialityService:
                                Defaults to True.
 
         Returns:
-            QuerySet[Speciality]: Ordered queryset of specialities by name.
+            list[Speciality]: Specialities ordered by name, read from the
+                              reference cache.
         """
-        queryset = Speciality.objects.all()
-        if active_only:
-            queryset = queryset.filter(is_removed=False)
-        return queryset.order_by("name")
+        return reference_cache.specialities(active_only=active_only)
 
     @staticmethod
     def get_speciality_by_id(speciality_id: int) -> Optional[Speciality]:
@@ -38,10 +36,7 @@ class SpecialityService:
             Optional[Speciality]: The speciality instance if found and active,
                                   None otherwise.
         """
-        try:
-            return Speciality.objects.get(id=speciality_id, is_removed=False)
-        except Speciality.DoesNotExist:
-            return None
+        return reference_cache.speciality(speciality_id, active_only=True)
 
     @staticmethod
     @transaction.atomic
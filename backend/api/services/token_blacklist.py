@@ -0,0 +1,66 @@
+import logging
+import time
+from typing import Iterable
+
+from django.core.cache import caches
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBlacklist:
+    """
+    Blacklisted refresh token ids in the shared cache.
+
+    Each ``jti`` expires together with its token, so the store only holds
+    tokens that could still be used. Cache errors are raised as
+    ``TokenError``: a blacklist that cannot be read must not let a revoked
+    token through.
+    """
+
+    def __init__(self, prefix: str = "jwt:blacklist", alias: str = "default") -> None:
+        self.prefix = prefix
+        self.alias = alias
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def key(self, jti: str) -> str:
+        return f"{self.prefix}:{jti}"
+
+    def add(self, jti: str, expires_at: int) -> None:
+        """
+        Blacklist a token until it expires.
+
+        Args:
+            jti (str): token id
+            expires_at (int): ``exp`` claim of the token, epoch seconds
+        """
+        self.add_many([(jti, expires_at)])
+
+    def add_many(self, tokens: Iterable[tuple[str, int]]) -> int:
+        """Blacklist (jti, exp) pairs, skipping expired tokens"""
+        now = time.time()
+        added = 0
+        try:
+            for jti, expires_at in tokens:
+                ttl = int(expires_at - now) + 1
+                if ttl > 0:
+                    self.cache.set(self.key(jti), expires_at, ttl)
+                    added += 1
+        except Exception as exc:
+            logger.warning("Failed to blacklist tokens: %s", exc)
+            raise TokenError(_("Token blacklist unavailable")) from exc
+        return added
+
+    def contains(self, jti: str) -> bool:
+        try:
+            return self.cache.get(self.key(jti)) is not None
+        except Exception as exc:
+            logger.warning("Failed to read token blacklist: %s", exc)
+            raise TokenError(_("Token blacklist unavailable")) from exc
+
+
+token_blacklist = TokenBlacklist()
@@ -0,0 +1,58 @@
+from typing import Any, Optional
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import QuerySet
+from rest_framework.request import Request
+
+from ..roles import role_flag_annotations
+from ..utils.cache import TieredCache
+
+# Shared tier only: a profile change must show on the next request in every
+# worker, and deleting a key does not reach other processes' local copies.
+profile_cache = TieredCache(
+    "user-profile",
+    timeout=settings.USER_PROFILE_CACHE_SECONDS,
+    local_max_entries=0,
+)
+
+
+def profile_queryset() -> QuerySet:
+    """Users with their role flags annotated, see role_flag_annotations()"""
+    return get_user_model().objects.annotate(**role_flag_annotations())
+
+
+def render_profile(user_id: Any) -> dict[str, Any]:
+    """Serialize a user and its role flags with a single query"""
+    from ..serializers import UserSerializer
+
+    user = profile_queryset().get(pk=user_id)
+    return dict(UserSerializer(user).data)
+
+
+def get_profile(user_id: Any, request: Optional[Request] = None) -> dict[str, Any]:
+    """
+    Cached UserSerializer payload of a user.
+
+    The payload is cached with a relative image URL. With a request, the
+    URL is made absolute like a serializer with the request in its context
+    would.
+    """
+    profile = profile_cache.get_or_set(str(user_id), lambda: render_profile(user_id))
+    if request is not None and profile.get("image"):
+        profile = {**profile, "image": request.build_absolute_uri(profile["image"])}
+    return profile
+
+
+def invalidate_profile(user_id: Any) -> None:
+    """
+    Drop the cached payload of a user.
+
+    Also runs again on commit, so a payload rendered from uncommitted data in
+    between does not outlive the transaction.
+    """
+    key = str(user_id)
+    profile_cache.delete(key)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: profile_cache.delete(key))
@@ -38,6 +38,7 @@ INSTALLED_APPS = [
     "django.contrib.messages",
     "cloudinary_storage",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "cloudinary",
     "django_rest_passwordreset",
     "django_ratelimit",
@@ -52,6 +53,8 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django_prometheus.middleware.PrometheusBeforeMiddleware",
+    "api.middleware.RequestProfilingMiddleware",
+    "api.middleware.QueryInspectorMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -170,16 +173,29 @@ FIXTURES_DIR = BASE_DIR / "fixtures"
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 AUTH_USER_MODEL = "api.User"
 REST_FRAMEWORK = {
-    "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
-    ),
+    "DEFAULT_AUTHENTICATION_CLASSES": ("api.authentication.RoleJWTAuthentication",),
     "DEFAULT_PERMISSION_CLASSES": ["rest_framework.permissions.IsAuthenticated"],
     "DEFAULT_FILTER_BACKENDS": [
         "django_filters.rest_framework.DjangoFilterBackend",
         "rest_framework.filters.SearchFilter",
         "rest_framework.filters.OrderingFilter",
     ],
+    "DEFAULT_RENDERER_CLASSES": [
+        "api.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "api.parsers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
+    # Proxies appending to X-Forwarded-For in front of the app. Client IPs
+    # (login throttling) come from REMOTE_ADDR when 0, so the header cannot be
+    # spoofed; set to 1 behind a single load balancer such as Render's.
+    "NUM_PROXIES": env.int("NUM_PROXIES", default=0),
 }
+# Render and parse JSON with orjson, see api.renderers
+FAST_JSON = env.bool("FAST_JSON", default=True)
 
 LOGGING = {
     "version": 1,
@@ -203,7 +219,14 @@ SIMPLE_JWT = {
     "ALGORITHM": "HS256",
     "SIGNING_KEY": SECRET_KEY,
     "AUTH_HEADER_TYPES": ("Bearer",),
+    "TOKEN_REFRESH_SERIALIZER": "api.serializers.auth.RoleTokenRefreshSerializer",
 }
+# Authenticate read-only requests from the role claims of the access token,
+# without loading the user, see api.authentication
+JWT_STATELESS_READS = env.bool("JWT_STATELESS_READS", default=True)
+# Refresh tokens are blacklisted in the cache. Also check the legacy
+# token_blacklist tables until `manage.py purge_token_blacklist` has run.
+JWT_BLACKLIST_DB_FALLBACK = env.bool("JWT_BLACKLIST_DB_FALLBACK", default=True)
 
 EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
 DEFAULT_FROM_EMAIL = "noreply@docappoint.com"
@@ -212,6 +235,29 @@ EMAIL_VERIFY_SECRET = env("EMAIL_VERIFY_SECRET", default="email123secret")
 
 # rate-limit
 RATELIMIT_USE_CACHE = "default"
+# Failed logins allowed per client IP and per email within the sliding
+# window, see api.utils.ratelimit
+LOGIN_THROTTLE_WINDOW_SECONDS = env.int("LOGIN_THROTTLE_WINDOW_SECONDS", default=3600)
+LOGIN_THROTTLE_IP_LIMIT = env.int("LOGIN_THROTTLE_IP_LIMIT", default=15)
+LOGIN_THROTTLE_EMAIL_LIMIT = env.int("LOGIN_THROTTLE_EMAIL_LIMIT", default=10)
+
+# N+1 and slow query logging, see api.utils.queries
+QUERY_INSPECTOR_ENABLED = env.bool("QUERY_INSPECTOR_ENABLED", default=False)
+# Flag query shapes executed more than this many times in one request
+QUERY_INSPECTOR_THRESHOLD = env.int("QUERY_INSPECTOR_THRESHOLD", default=5)
+QUERY_INSPECTOR_SLOW_MS = env.int("QUERY_INSPECTOR_SLOW_MS", default=100)
+
+# Prometheus scrape-time collectors
+METRICS_REFRESH_SECONDS = env.int("METRICS_REFRESH_SECONDS", default=60)
+METRICS_PROVIDER_TOP_K = env.int("METRICS_PROVIDER_TOP_K", default=20)
+# Per-query statement timeout while refreshing collectors, 0 disables it
+METRICS_SCRAPE_BUDGET_MS = env.int("METRICS_SCRAPE_BUDGET_MS", default=500)
+# Per-route query count, DB and serialization time histograms
+METRICS_REQUEST_PROFILING = env.bool("METRICS_REQUEST_PROFILING", default=True)
+# Also report the request profile in a Server-Timing response header
+METRICS_SERVER_TIMING_HEADER = env.bool("METRICS_SERVER_TIMING_HEADER", default=False)
+# Per-provider/per-hospital counters grow with the number of providers
+METRICS_RAW_PROVIDER_COUNTERS = env.bool("METRICS_RAW_PROVIDER_COUNTERS", default=False)
 
 # secure cookies
 SECURE_SSL_REDIRECT = False
@@ -225,3 +271,55 @@ CACHES = {
         "OPTIONS": {"CLIENT_CLASS": "django_redis.client.DefaultClient"},
     }
 }
+
+# How often a process compares its reference table snapshot with the shared
+# version in the cache, see api.services.reference
+REFERENCE_CACHE_CHECK_SECONDS = env.int("REFERENCE_CACHE_CHECK_SECONDS", default=5)
+
+# Cached provider list pages, see api.services.provider_directory
+PROVIDER_DIRECTORY_CACHE_SECONDS = env.int(
+    "PROVIDER_DIRECTORY_CACHE_SECONDS", default=300
+)
+# Specialities rendered by the warm_provider_directory command
+PROVIDER_DIRECTORY_WARM_SPECIALITIES = env.int(
+    "PROVIDER_DIRECTORY_WARM_SPECIALITIES", default=10
+)
+# Provider name autocomplete: most matches returned, and prefixes up to this
+# length (which match the most names) are cached
+PROVIDER_AUTOCOMPLETE_MAX_RESULTS = env.int(
+    "PROVIDER_AUTOCOMPLETE_MAX_RESULTS", default=20
+)
+PROVIDER_AUTOCOMPLETE_CACHED_LENGTH = env.int(
+    "PROVIDER_AUTOCOMPLETE_CACHED_LENGTH", default=2
+)
+PROVIDER_AUTOCOMPLETE_CACHE_SECONDS = env.int(
+    "PROVIDER_AUTOCOMPLETE_CACHE_SECONDS", default=300
+)
+
+# Keep per-patient and per-provider medical record counts for the stats
+# endpoint, see api.services.record_counts. When turning it back on, run
+# `manage.py rebuild_record_counts`.
+MEDICAL_RECORD_COUNTERS = env.bool("MEDICAL_RECORD_COUNTERS", default=True)
+# Records re-rendered after a change to a row their stored detail payload
+# shows, see api.services.record_detail. The rest are rendered on read until
+# `manage.py refresh_record_details` stores them.
+MEDICAL_RECORD_DETAIL_REFRESH_LIMIT = env.int(
+    "MEDICAL_RECORD_DETAIL_REFRESH_LIMIT", default=500
+)
+# Rows fetched per round trip by the streamed medical record export
+MEDICAL_RECORD_EXPORT_CHUNK_SIZE = env.int(
+    "MEDICAL_RECORD_EXPORT_CHUNK_SIZE", default=2000
+)
+
+# Cached /users/me and login payloads, see api.services.user_profile
+USER_PROFILE_CACHE_SECONDS = env.int("USER_PROFILE_CACHE_SECONDS", default=600)
+
+# Outbound email queue drained by the send_queued_email worker
+EMAIL_QUEUE_BATCH_SIZE = env.int("EMAIL_QUEUE_BATCH_SIZE", default=50)
+EMAIL_QUEUE_POLL_SECONDS = env.float("EMAIL_QUEUE_POLL_SECONDS", default=2.0)
+EMAIL_QUEUE_MAX_ATTEMPTS = env.int("EMAIL_QUEUE_MAX_ATTEMPTS", default=6)
+# A claimed batch is not picked up by other workers for this long
+EMAIL_QUEUE_CLAIM_SECONDS = env.int("EMAIL_QUEUE_CLAIM_SECONDS", default=300)
+# Retries back off exponentially from the base delay up to the max
+EMAIL_QUEUE_RETRY_BASE_SECONDS = env.int("EMAIL_QUEUE_RETRY_BASE_SECONDS", default=30)
+EMAIL_QUEUE_RETRY_MAX_SECONDS = env.int("EMAIL_QUEUE_RETRY_MAX_SECONDS", default=3600)
@@ -4,3 +4,6 @@ DEBUG = True
 
 # Print email instead of send
 EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
+
+# Log N+1 patterns and slow queries
+QUERY_INSPECTOR_ENABLED = True
@@ -0,0 +1,115 @@
+import pytest
+from datetime import timedelta
+from django.db import transaction
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from api.models import Appointment, Slot
+from api.metrics import appointments_created_total, appointments_cancelled_total
+from api.services.events import (
+    BOOKING_CREATED,
+    emit_booking_event,
+    record_booking_event,
+)
+from api.services.reference import reference_cache
+
+
+pytestmark = pytest.mark.django_db
+
+
+def sample_value(metric, **labels):
+    """Read the current value of a labelled counter sample"""
+    for family in metric.collect():
+        for sample in family.samples:
+            if sample.name.endswith("_total") and sample.labels == labels:
+                return sample.value
+    return 0.0
+
+
+class TestBookingEvents:
+    def test_booking_emits_after_commit(
+        self,
+        authenticated_patient_client,
+        provider_factory,
+        slot_factory,
+        django_capture_on_commit_callbacks,
+    ):
+        client, patient = authenticated_patient_client()
+        provider = provider_factory()
+        hospital = provider.primary_hospital
+        start = timezone.now() + timedelta(days=2)
+        end = start + timedelta(minutes=30)
+        slot_factory(
+            healthcare_provider=provider,
+            hospital=hospital,
+            start=start,
+            end=end,
+            status=Slot.Status.FREE,
+            appointment=None,
+        )
+        labels = {
+            "status": Appointment.Status.REQUESTED,
+            "speciality_id": str(provider.speciality_id),
+            "hospital_id": str(hospital.id),
+        }
+        before = sample_value(appointments_created_total, **labels)
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            response = client.post(
+                reverse("appointment-list"),
+                {
+                    "provider": provider.pk,
+                    "location": hospital.id,
+                    "appointment_start_datetime_utc": start.isoformat(),
+                    "appointment_end_datetime_utc": end.isoformat(),
+                    "reason": "Checkup",
+                },
+                format="json",
+            )
+            assert response.status_code == status.HTTP_201_CREATED
+            # Nothing is emitted while the transaction is still open
+            assert sample_value(appointments_created_total, **labels) == before
+
+        assert len(callbacks) == 1
+        callbacks[0]()
+        assert sample_value(appointments_created_total, **labels) == before + 1
+
+    def test_rolled_back_event_is_dropped(
+        self, appointment_factory, django_capture_on_commit_callbacks
+    ):
+        appointment = appointment_factory()
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            with pytest.raises(RuntimeError):
+                with transaction.atomic():
+                    record_booking_event(BOOKING_CREATED, appointment)
+                    raise RuntimeError("rollback")
+
+        assert callbacks == []
+
+    def test_emit_uses_cached_labels(
+        self,
+        appointment_factory,
+        django_assert_num_queries,
+        django_capture_on_commit_callbacks,
+    ):
+        # Commit the reference rows so the cache may keep them
+        with django_capture_on_commit_callbacks(execute=True):
+            appointment = appointment_factory()
+        provider = appointment.healthcare_provider
+        event = record_booking_event(
+            Appointment.Status.CANCELLED, appointment, cancelled_by="patient"
+        )
+
+        # Warm the cache once, later emissions must not touch the database
+        reference_cache.snapshot()
+
+        labels = {
+            "cancellation_person": "patient",
+            "speciality_id": str(provider.speciality_id),
+        }
+        before = sample_value(appointments_cancelled_total, **labels)
+        with django_assert_num_queries(0):
+            emit_booking_event(event)
+        assert sample_value(appointments_cancelled_total, **labels) == before + 1
@@ -223,6 +223,8 @@ class TestAppointmentWorkflow:
         assert provider_response.status_code == status.HTTP_200_OK
 
         cancelled_appointments = [
-            appt for appt in provider_response.data if appt["id"] == appointment.id
+            appt
+            for appt in provider_response.data["results"]
+            if appt["id"] == appointment.id
         ]
         assert len(cancelled_appointments) == 1
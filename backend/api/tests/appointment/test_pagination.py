@@ -0,0 +1,107 @@
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from ..conftest import walk
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def staff_client(authenticated_admin_client):
+    client, _ = authenticated_admin_client()
+    return client
+
+
+@pytest.fixture
+def make_appointment(appointment_factory, patient_factory):
+    base = timezone.now().replace(microsecond=0) + timedelta(days=1)
+
+    def make(hours: int):
+        # A new patient each time, so several appointments can share a start
+        start = base + timedelta(hours=hours)
+        return appointment_factory(
+            patient=patient_factory(),
+            appointment_start_datetime_utc=start,
+            appointment_end_datetime_utc=start + timedelta(minutes=30),
+        )
+
+    return make
+
+
+class TestAppointmentPagination:
+    def test_pages_are_newest_first_with_ties_on_start(
+        self, staff_client, make_appointment
+    ):
+        appointments = [make_appointment(hours) for hours in (1, 2, 2, 2, 3)]
+        expected = [
+            a.id
+            for a in sorted(
+                appointments,
+                key=lambda a: (a.appointment_start_datetime_utc, a.id),
+                reverse=True,
+            )
+        ]
+
+        pages = walk(staff_client, reverse("appointment-list"), {"page_size": 2})
+
+        assert pages == [expected[0:2], expected[2:4], expected[4:]]
+
+    def test_stable_under_concurrent_inserts(self, staff_client, make_appointment):
+        appointments = [make_appointment(hours) for hours in range(4)]
+        url = reverse("appointment-list")
+
+        first = staff_client.get(url, {"page_size": 2}).data
+        make_appointment(10)
+        second = staff_client.get(first["next"]).data
+
+        seen = [row["id"] for row in first["results"] + second["results"]]
+        assert seen == [a.id for a in reversed(appointments)]
+        assert second["next"] is None
+
+    def test_previous_link(self, staff_client, make_appointment):
+        for hours in range(5):
+            make_appointment(hours)
+        url = reverse("appointment-list")
+
+        first = staff_client.get(url, {"page_size": 2}).data
+        second = staff_client.get(first["next"]).data
+        back = staff_client.get(second["previous"]).data
+
+        assert first["previous"] is None
+        assert [row["id"] for row in back["results"]] == [
+            row["id"] for row in first["results"]
+        ]
+        assert back["previous"] is None
+
+    def test_never_counts(self, staff_client, make_appointment):
+        for hours in range(3):
+            make_appointment(hours)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = staff_client.get(reverse("appointment-list"), {"page_size": 1})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert not any("COUNT(" in query["sql"] for query in queries)
+
+    def test_role_filter_and_page_size_cap(
+        self, authenticated_patient_client, appointment_factory
+    ):
+        client, patient = authenticated_patient_client()
+        appointment_factory(patient=patient)
+        appointment_factory()
+
+        response = client.get(reverse("appointment-list"), {"page_size": 10_000})
+
+        assert len(response.data["results"]) == 1
+        assert response.data["next"] is None
+
+    def test_invalid_cursor(self, staff_client):
+        response = staff_client.get(reverse("appointment-list"), {"cursor": "nope"})
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -1,6 +1,7 @@
 import re
 import jwt
 import pytest
+from django.core.management import call_command
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -43,6 +44,7 @@ class TestAuthenticationFlow:
         assert user.reset_sent_at is not None
 
         # Verify email was printed to console (dev)
+        call_command("send_queued_email", once=True)
         assert len(mailoutbox) == 1
         email = mailoutbox[0]
         assert email.to == ["newuser@example.com"]
@@ -0,0 +1,239 @@
+import pytest
+from django.contrib.auth.hashers import get_hasher
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from api.services.auth import login_email_limiter, login_ip_limiter
+from api.utils.ratelimit import SlidingWindowLimiter
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def hash_calls(monkeypatch):
+    """Number of password hash computations so far"""
+    calls = []
+    hasher_class = type(get_hasher())
+    encode = hasher_class.encode
+
+    def counting_encode(self, *args, **kwargs):
+        calls.append(1)
+        return encode(self, *args, **kwargs)
+
+    monkeypatch.setattr(hasher_class, "encode", counting_encode)
+    return calls
+
+
+@pytest.fixture
+def limits(monkeypatch):
+    monkeypatch.setattr(login_ip_limiter, "limit", 5)
+    monkeypatch.setattr(login_email_limiter, "limit", 3)
+
+
+def login(client, email, password="wrong-password", ip="10.0.0.1", **headers):
+    return client.post(
+        reverse("login"),
+        {"email": email, "password": password},
+        format="json",
+        REMOTE_ADDR=ip,
+        **headers,
+    )
+
+
+class TestLoginHashing:
+    def test_wrong_password_hashes_once(self, user_factory, hash_calls):
+        user = user_factory(is_active=True)
+        hash_calls.clear()
+
+        response = login(APIClient(), user.email)
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert len(hash_calls) == 1
+
+    def test_unknown_email_hashes_once(self, hash_calls):
+        response = login(APIClient(), "nobody@test.com")
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert len(hash_calls) == 1
+
+    def test_inactive_user_hashes_once(self, user_factory, hash_calls):
+        user = user_factory(is_active=False)
+        hash_calls.clear()
+
+        response = login(APIClient(), user.email, password="complex123!")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert len(hash_calls) == 1
+
+
+class TestLoginThrottling:
+    def test_throttled_per_email_before_hashing(self, user_factory, hash_calls, limits):
+        user = user_factory(is_active=True)
+        client = APIClient()
+        for attempt in range(3):
+            login(client, user.email, ip=f"10.0.0.{attempt}")
+        hash_calls.clear()
+
+        response = login(client, user.email.upper(), password="complex123!")
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert int(response["Retry-After"]) > 0
+        assert hash_calls == []
+
+    def test_throttled_per_ip(self, limits):
+        client = APIClient()
+        for attempt in range(5):
+            login(client, f"user{attempt}@test.com")
+
+        assert login(client, "other@test.com").status_code == (
+            status.HTTP_429_TOO_MANY_REQUESTS
+        )
+        assert login(client, "other@test.com", ip="10.0.0.2").status_code == (
+            status.HTTP_401_UNAUTHORIZED
+        )
+
+    def test_spoofed_forwarded_for_is_ignored(self, limits):
+        client = APIClient()
+        for attempt in range(5):
+            login(
+                client,
+                f"user{attempt}@test.com",
+                HTTP_X_FORWARDED_FOR=f"192.168.0.{attempt}",
+            )
+
+        response = login(client, "other@test.com", HTTP_X_FORWARDED_FOR="192.168.0.99")
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+    def test_client_ip_from_trusted_proxy(self, limits, settings):
+        settings.REST_FRAMEWORK = {**settings.REST_FRAMEWORK, "NUM_PROXIES": 1}
+        client = APIClient()
+        for attempt in range(5):
+            # The proxy appends the address it saw to whatever the client sent
+            login(
+                client,
+                f"user{attempt}@test.com",
+                HTTP_X_FORWARDED_FOR=f"192.168.0.{attempt}, 203.0.113.7",
+            )
+
+        throttled = login(client, "other@test.com", HTTP_X_FORWARDED_FOR="203.0.113.7")
+        other_client = login(
+            client, "other@test.com", HTTP_X_FORWARDED_FOR="203.0.113.8"
+        )
+        assert throttled.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert other_client.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_success_clears_email_failures(self, user_factory, limits):
+        user = user_factory(is_active=True)
+        client = APIClient()
+        for _ in range(2):
+            login(client, user.email)
+
+        assert login(client, user.email, password="complex123!").status_code == (
+            status.HTTP_200_OK
+        )
+        assert login_email_limiter.count(user.email) == 0
+
+
+class FakeRedis:
+    """Sorted set commands used by SlidingWindowLimiter"""
+
+    def __init__(self):
+        self.sets = {}
+        self.commands = []
+
+    def pipeline(self):
+        return self
+
+    def execute(self):
+        results = [command() for command in self.commands]
+        self.commands = []
+        return results
+
+    def zremrangebyscore(self, key, low, high):
+        members = self.sets.setdefault(key, {})
+
+        def remove():
+            for member, score in list(members.items()):
+                if low <= score <= high:
+                    del members[member]
+
+        self.commands.append(remove)
+
+    def zadd(self, key, mapping):
+        self.commands.append(lambda: self.sets.setdefault(key, {}).update(mapping))
+
+    def zcard(self, key):
+        self.commands.append(lambda: len(self.sets.get(key, {})))
+
+    def pexpire(self, key, ms):
+        self.commands.append(lambda: True)
+
+    def zrange(self, key, start, end, withscores=False):
+        ordered = sorted(self.sets.get(key, {}).items(), key=lambda item: item[1])
+        return ordered[start : end + 1]
+
+    def zrem(self, key, member):
+        self.sets.get(key, {}).pop(member, None)
+
+    def delete(self, key):
+        self.sets.pop(key, None)
+
+
+class TestSlidingWindowLimiter:
+    @pytest.mark.parametrize("backend", ["cache", "redis"])
+    def test_counts_events_in_window(self, backend, monkeypatch):
+        limiter = SlidingWindowLimiter("test", limit=2, window=60)
+        if backend == "redis":
+            redis = FakeRedis()
+            monkeypatch.setattr(limiter, "_redis", lambda: redis)
+
+        assert limiter.hit("a") == 1
+        assert not limiter.is_limited("a")
+        assert limiter.hit("a") == 2
+        assert limiter.is_limited("a")
+        assert not limiter.is_limited("b")
+        assert 0 < limiter.retry_after("a") <= 61
+
+        limiter.reset("a")
+        assert limiter.count("a") == 0
+
+    @pytest.mark.parametrize("backend", ["cache", "redis"])
+    def test_acquire_checks_and_records(self, backend, monkeypatch):
+        limiter = SlidingWindowLimiter("test", limit=2, window=60)
+        if backend == "redis":
+            redis = FakeRedis()
+            monkeypatch.setattr(limiter, "_redis", lambda: redis)
+
+        first = limiter.acquire("a")
+        assert first is not None
+        assert limiter.acquire("a") is not None
+        assert limiter.acquire("a") is None
+        assert limiter.count("a") == 2
+
+        limiter.release("a", first)
+        assert limiter.count("a") == 1
+        assert limiter.acquire("a") is not None
+
+    def test_old_events_leave_the_window(self, monkeypatch):
+        limiter = SlidingWindowLimiter("test", limit=1, window=60)
+        now = [1_000_000]
+        monkeypatch.setattr("api.utils.ratelimit._now_ms", lambda: now[0])
+
+        limiter.hit("a")
+        now[0] += 59_000
+        assert limiter.is_limited("a")
+        now[0] += 2_000
+        assert not limiter.is_limited("a")
+
+    def test_cache_errors_do_not_limit(self, monkeypatch):
+        limiter = SlidingWindowLimiter("test", limit=1, window=60)
+
+        def unavailable(*args, **kwargs):
+            raise ConnectionError("redis down")
+
+        monkeypatch.setattr(cache, "get", unavailable)
+
+        assert limiter.hit("a") == 0
+        assert not limiter.is_limited("a")
@@ -0,0 +1,98 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework_simplejwt.tokens import AccessToken
+
+from api.authentication import RoleJWTAuthentication
+from api.models import User
+from api.roles import get_roles
+
+pytestmark = pytest.mark.django_db
+
+
+def bearer(user):
+    return {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(user)}"}
+
+
+class TestGetRoles:
+    def test_loads_all_roles_in_one_query(
+        self, provider_factory, django_assert_num_queries
+    ):
+        provider = provider_factory()
+        user = User.objects.get(pk=provider.user_id)
+
+        with django_assert_num_queries(1):
+            roles = get_roles(user)
+            assert user.provider == provider
+
+        assert roles.provider == provider
+        assert roles.patient is None
+        assert roles.name == "provider"
+
+    def test_reuses_cached_roles(self, admin_staff_factory, django_assert_num_queries):
+        admin = admin_staff_factory()
+        user = User.objects.get(pk=admin.user_id)
+        get_roles(user)
+
+        with django_assert_num_queries(0):
+            roles = get_roles(user)
+            assert roles.admin_staff.hospital_id == admin.hospital_id
+
+        assert roles.name == "admin_staff"
+
+    def test_unsaved_user_has_no_roles(self, django_assert_num_queries):
+        with django_assert_num_queries(0):
+            assert get_roles(User(is_active=True)).name == "unassigned"
+
+
+class TestRoleJWTAuthentication:
+    def test_user_and_roles_in_one_query(
+        self, patient_factory, django_assert_num_queries
+    ):
+        patient = patient_factory()
+        request = APIRequestFactory().get("/", **bearer(patient.user))
+
+        with django_assert_num_queries(1):
+            user, _ = RoleJWTAuthentication().authenticate(request)
+            roles = get_roles(user)
+
+        assert roles.patient == patient
+        assert not roles.is_provider
+
+    def test_rejects_inactive_user(self, patient_factory):
+        patient = patient_factory()
+        patient.user.is_active = False
+        patient.user.save()
+
+        client = APIClient()
+        response = client.get(reverse("patient-me"), **bearer(patient.user))
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_permission_checks_do_not_query_roles(
+        self, provider_factory, django_assert_max_num_queries
+    ):
+        provider = provider_factory()
+        client = APIClient()
+
+        # Role lookups are served from the authentication query
+        with django_assert_max_num_queries(1) as captured:
+            response = client.get(reverse("patient-list"), **bearer(provider.user))
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert len(captured.captured_queries) == 1
+
+
+class TestPatientList:
+    def test_no_role_queries_per_patient(
+        self, authenticated_admin_client, patient_factory, assert_no_n_plus_one
+    ):
+        client, _ = authenticated_admin_client()
+        patient_factory.create_batch(5)
+
+        with assert_no_n_plus_one():
+            response = client.get(reverse("patient-list"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data) == 5
@@ -0,0 +1,195 @@
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from api.authentication import ClaimsUser, RoleJWTAuthentication, access_token_for
+from api.models import Appointment, Patient, User
+from api.roles import get_roles
+
+pytestmark = pytest.mark.django_db
+
+
+def token_for(user):
+    return access_token_for(RefreshToken.for_user(user), user)
+
+
+def authenticate(method, token):
+    request = getattr(APIRequestFactory(), method)(
+        "/", HTTP_AUTHORIZATION=f"Bearer {token}"
+    )
+    return RoleJWTAuthentication().authenticate(request)[0]
+
+
+class TestRoleClaims:
+    def test_login_issues_role_claims(self, patient_factory):
+        patient = patient_factory(user__is_active=True)
+
+        response = APIClient().post(
+            reverse("login"),
+            {"email": patient.user.email, "password": "complex123!"},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        access = AccessToken(response.data["access"])
+        assert access["role"] == "patient"
+        assert access["roles"] == ["patient"]
+        assert access["is_staff"] is False
+
+    def test_admin_staff_claims_hospital(self, admin_staff_factory):
+        admin = admin_staff_factory()
+        access = token_for(User.objects.get(pk=admin.user_id))
+
+        assert access["roles"] == ["admin_staff"]
+        assert access["hospital_id"] == admin.hospital_id
+
+    def test_refresh_reissues_current_claims(self, user_factory):
+        user = user_factory(is_active=True)
+        refresh = RefreshToken.for_user(user)
+        Patient.objects.create(user=user)
+
+        response = APIClient().post(
+            reverse("token_refresh"), {"refresh": str(refresh)}, format="json"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert AccessToken(response.data["access"])["roles"] == ["patient"]
+
+
+class TestStatelessReads:
+    def test_safe_request_without_queries(
+        self, patient_factory, django_assert_num_queries
+    ):
+        patient = patient_factory()
+        token = token_for(patient.user)
+
+        with django_assert_num_queries(0):
+            user = authenticate("get", token)
+            roles = get_roles(user)
+            assert isinstance(user, User)
+            assert user.pk == patient.user_id
+            assert roles.is_patient and not roles.is_provider
+            assert roles.patient == patient
+
+    def test_user_loaded_on_first_use(self, patient_factory, django_assert_num_queries):
+        patient = patient_factory()
+        user = authenticate("get", token_for(patient.user))
+
+        with django_assert_num_queries(1):
+            assert user.email == patient.user.email
+            assert user.first_name == patient.user.first_name
+
+    def test_profile_usable_in_lookups(
+        self, patient_factory, appointment_factory, django_assert_num_queries
+    ):
+        patient = patient_factory()
+        appointment_factory(patient=patient)
+        appointment_factory()
+        user = authenticate("get", token_for(patient.user))
+
+        with django_assert_num_queries(1):
+            owned = list(Appointment.objects.filter(patient=get_roles(user).patient))
+
+        assert [a.patient_id for a in owned] == [patient.pk]
+
+    def test_unsafe_request_loads_user(self, patient_factory):
+        patient = patient_factory()
+
+        user = authenticate("post", token_for(patient.user))
+
+        assert not isinstance(user, ClaimsUser)
+        assert get_roles(user).patient == patient
+
+    def test_role_change_invalidates_claims(self, patient_factory, provider_factory):
+        patient = patient_factory()
+        token = token_for(patient.user)
+        provider_factory(user=patient.user)
+
+        user = authenticate("get", token)
+
+        assert not isinstance(user, ClaimsUser)
+        assert get_roles(user).is_provider
+
+    def test_deactivation_invalidates_claims(self, patient_factory):
+        patient = patient_factory()
+        token = token_for(patient.user)
+        patient.user.is_active = False
+        patient.user.save()
+
+        response = APIClient().get(
+            reverse("patient-me"), HTTP_AUTHORIZATION=f"Bearer {token}"
+        )
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_evicted_role_change_is_read_from_the_user(
+        self, patient_factory, provider_factory
+    ):
+        patient = patient_factory()
+        token = token_for(patient.user)
+        provider_factory(user=patient.user)
+        # The shared cache lost the role change marker
+        cache.clear()
+
+        user = authenticate("get", token)
+
+        assert not isinstance(user, ClaimsUser)
+        assert get_roles(user).is_provider
+
+    def test_missing_marker_is_filled_from_the_user(
+        self, patient_factory, django_assert_num_queries
+    ):
+        patient = patient_factory()
+        token = token_for(patient.user)
+        cache.clear()
+
+        with django_assert_num_queries(1):
+            assert isinstance(authenticate("get", token), ClaimsUser)
+        with django_assert_num_queries(0):
+            assert isinstance(authenticate("get", token), ClaimsUser)
+
+    def test_tokens_without_claims_load_user(self, patient_factory):
+        patient = patient_factory()
+
+        user = authenticate("get", RefreshToken.for_user(patient.user).access_token)
+
+        assert not isinstance(user, ClaimsUser)
+
+    def test_disabled(self, patient_factory, settings):
+        settings.JWT_STATELESS_READS = False
+        patient = patient_factory()
+
+        user = authenticate("get", token_for(patient.user))
+
+        assert not isinstance(user, ClaimsUser)
+
+    def test_me_endpoint(self, patient_factory):
+        patient = patient_factory()
+
+        response = APIClient().get(
+            reverse("patient-me"),
+            HTTP_AUTHORIZATION=f"Bearer {token_for(patient.user)}",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["user"]["email"] == patient.user.email
+
+    def test_list_endpoints(
+        self, patient_factory, provider_factory, appointment_factory
+    ):
+        patient = patient_factory()
+        provider = provider_factory()
+        appointment_factory(patient=patient, healthcare_provider=provider)
+        appointment_factory()
+        client = APIClient()
+
+        for user in (patient.user, provider.user):
+            response = client.get(
+                reverse("appointment-list"),
+                HTTP_AUTHORIZATION=f"Bearer {token_for(user)}",
+            )
+            assert response.status_code == status.HTTP_200_OK
+            assert len(response.data["results"]) == 1
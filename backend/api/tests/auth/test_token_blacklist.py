@@ -0,0 +1,114 @@
+from datetime import timedelta
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.utils import aware_utcnow
+
+from api.authentication import BlacklistRefreshToken
+from api.services.token_blacklist import token_blacklist
+
+pytestmark = pytest.mark.django_db
+
+
+def refresh(client, token):
+    return client.post(reverse("token_refresh"), {"refresh": str(token)}, format="json")
+
+
+class TestBlacklistRefreshToken:
+    def test_login_writes_no_outstanding_rows(self, user_factory):
+        user = user_factory(is_active=True)
+
+        response = APIClient().post(
+            reverse("login"),
+            {"email": user.email, "password": "complex123!"},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert not OutstandingToken.objects.exists()
+
+    def test_rotation_blacklists_old_token_in_cache(self, user_factory):
+        client = APIClient()
+        token = BlacklistRefreshToken.for_user(user_factory(is_active=True))
+
+        response = refresh(client, token)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["refresh"] != str(token)
+
+        assert token_blacklist.contains(token["jti"])
+        assert refresh(client, token).status_code == status.HTTP_401_UNAUTHORIZED
+        assert refresh(client, response.data["refresh"]).status_code == (
+            status.HTTP_200_OK
+        )
+        assert not OutstandingToken.objects.exists()
+        assert not BlacklistedToken.objects.exists()
+
+    def test_blacklist_entry_expires_with_token(self):
+        token_blacklist.add("expired", int(aware_utcnow().timestamp()) - 1)
+        assert not token_blacklist.contains("expired")
+
+        token_blacklist.add("valid", int(aware_utcnow().timestamp()) + 60)
+        assert token_blacklist.contains("valid")
+
+    def test_rejects_tokens_blacklisted_in_database(self, user_factory, settings):
+        legacy = RefreshToken.for_user(user_factory(is_active=True))
+        legacy.blacklist()
+
+        with pytest.raises(TokenError):
+            BlacklistRefreshToken(str(legacy))
+
+        settings.JWT_BLACKLIST_DB_FALLBACK = False
+        BlacklistRefreshToken(str(legacy))
+
+    def test_cache_unavailable_rejects_refresh(self, user_factory, monkeypatch):
+        token = BlacklistRefreshToken.for_user(user_factory(is_active=True))
+
+        def unavailable(*args, **kwargs):
+            raise ConnectionError("redis down")
+
+        monkeypatch.setattr(cache, "get", unavailable)
+
+        response = refresh(APIClient(), token)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+class TestPurgeTokenBlacklist:
+    def test_moves_valid_entries_and_empties_tables(self, user_factory, settings):
+        user = user_factory(is_active=True)
+        revoked = RefreshToken.for_user(user)
+        revoked.blacklist()
+        expired = RefreshToken.for_user(user)
+        expired.blacklist()
+        OutstandingToken.objects.filter(jti=expired["jti"]).update(
+            expires_at=aware_utcnow() - timedelta(days=1)
+        )
+        RefreshToken.for_user(user)
+
+        call_command("purge_token_blacklist", batch_size=2)
+
+        assert not OutstandingToken.objects.exists()
+        assert not BlacklistedToken.objects.exists()
+        assert token_blacklist.contains(revoked["jti"])
+        assert not token_blacklist.contains(expired["jti"])
+
+        settings.JWT_BLACKLIST_DB_FALLBACK = False
+        with pytest.raises(TokenError):
+            BlacklistRefreshToken(str(revoked))
+
+    def test_dry_run(self, user_factory, capsys):
+        RefreshToken.for_user(user_factory(is_active=True)).blacklist()
+
+        call_command("purge_token_blacklist", dry_run=True)
+
+        assert "Would copy 1 blacklisted tokens" in capsys.readouterr().out
+        assert OutstandingToken.objects.count() == 1
@@ -0,0 +1,139 @@
+import threading
+import time
+
+import pytest
+from django.core.cache import cache
+
+from api.metrics import cache_requests_total
+from api.utils.cache import MISSING, LocalLRU, TieredCache
+
+
+def requests_count(namespace, tier, result):
+    return cache_requests_total.labels(
+        cache=namespace, tier=tier, result=result
+    )._value.get()
+
+
+@pytest.fixture
+def tiered():
+    return TieredCache("test", check_interval=0, poll_interval=0.01)
+
+
+class TestLocalLRU:
+    def test_evicts_least_recently_used(self):
+        lru = LocalLRU(max_entries=2)
+        lru.set("a", 1, ttl=60)
+        lru.set("b", 2, ttl=60)
+        lru.get("a")
+        lru.set("c", 3, ttl=60)
+
+        assert lru.get("a") == 1
+        assert lru.get("c") == 3
+        assert len(lru) == 2
+
+    def test_expired_entries_are_dropped(self):
+        lru = LocalLRU(max_entries=2)
+        lru.set("a", 1, ttl=0)
+        assert len(lru) == 1
+        assert lru.get("a") is MISSING
+        assert len(lru) == 0
+
+
+class TestTieredCache:
+    def test_local_hit_skips_shared_tier(self, tiered, monkeypatch):
+        tiered.set("key", {"value": 1})
+        hits = requests_count("test", "local", "hit")
+
+        def unexpected(*args, **kwargs):
+            raise AssertionError("shared tier used")
+
+        monkeypatch.setattr(cache, "get", unexpected)
+        tiered.check_interval = 60
+        assert tiered.get("key") == {"value": 1}
+        assert requests_count("test", "local", "hit") == hits + 1
+
+    def test_shared_hit_fills_local_tier(self, tiered):
+        other_worker = TieredCache("test", check_interval=0)
+        other_worker.set("key", "value")
+        hits = requests_count("test", "shared", "hit")
+
+        assert tiered.get("key") == "value"
+        assert requests_count("test", "shared", "hit") == hits + 1
+        assert len(tiered.local) == 1
+
+    def test_invalidate_reaches_other_workers(self, tiered):
+        other_worker = TieredCache("test", check_interval=0)
+        tiered.set("key", "old")
+        assert other_worker.get("key") == "old"
+
+        tiered.invalidate()
+
+        assert other_worker.get("key") is None
+        assert tiered.get("key") is None
+
+    def test_none_is_not_cached(self, tiered):
+        tiered.set("key", "old")
+        tiered.set("key", None)
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return None
+
+        assert tiered.get("key", MISSING) is MISSING
+        assert tiered.get_or_set("key", loader) is None
+        assert tiered.get_or_set("key", loader) is None
+        assert len(calls) == 2
+        assert len(tiered.local) == 0
+
+    def test_get_or_set_loads_once_per_process(self, tiered):
+        calls = []
+
+        def loader():
+            calls.append(1)
+            time.sleep(0.05)
+            return "loaded"
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(tiered.get_or_set("k", loader))
+            )
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == ["loaded"] * 8
+        assert len(calls) == 1
+
+    def test_waits_for_other_worker_loading(self, tiered):
+        # Another worker holds the load lock and stores the value shortly after
+        cache.add(f"{tiered.make_key('k')}:lock", 1)
+        other_worker = TieredCache("test", check_interval=0)
+        timer = threading.Timer(0.05, other_worker.set, args=("k", "from other"))
+        timer.start()
+
+        value = tiered.get_or_set("k", lambda: "from loader")
+
+        timer.join()
+        assert value == "from other"
+
+    def test_loads_itself_when_other_worker_times_out(self, tiered):
+        tiered.lock_timeout = 0.05
+        cache.add(f"{tiered.make_key('k')}:lock", 1)
+
+        assert tiered.get_or_set("k", lambda: "from loader") == "from loader"
+
+    def test_shared_tier_unavailable(self, tiered, monkeypatch):
+        def unavailable(*args, **kwargs):
+            raise ConnectionError("redis down")
+
+        for method in ("get", "set", "add", "delete", "incr"):
+            monkeypatch.setattr(cache, method, unavailable)
+
+        assert tiered.get_or_set("k", lambda: "loaded") == "loaded"
+        tiered.invalidate()
+        assert tiered.get("k") is None
@@ -1,8 +1,17 @@
+import json
+
 import pytest
+from contextlib import contextmanager
+from django.core.cache import cache
 from pytest_factoryboy import register
 from prometheus_client import REGISTRY
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
 from rest_framework.test import APIClient
 
+from api.services.provider_directory import autocomplete_cache, directory_cache
+from api.services.reference import reference_cache
+from api.utils.queries import inspect_queries
 from .factories import (
     UserFactory,
     PatientFactory,
@@ -70,6 +79,13 @@ def authenticated_provider_client(provider_factory):
     return _create_provider_client
 
 
+@pytest.fixture
+def provider_client(authenticated_provider_client):
+    """A client authenticated as a new provider"""
+    client, _ = authenticated_provider_client()
+    return client
+
+
 @pytest.fixture
 def authenticated_admin_client(admin_staff_factory):
     def _create_admin_client(**kwargs):
@@ -92,6 +108,28 @@ def authenticated_system_admin_client(admin_staff_factory):
     return _create_system_admin_client
 
 
+@pytest.fixture(autouse=True)
+def locmem_cache(settings):
+    """Use an isolated in-memory cache instead of Redis"""
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+    cache.clear()
+    reference_cache.clear()
+    directory_cache.clear_local()
+    autocomplete_cache.clear_local()
+    yield
+    reference_cache.clear()
+    directory_cache.clear_local()
+    autocomplete_cache.clear_local()
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    """Write uploaded files to a temporary directory instead of backend/media"""
+    settings.MEDIA_ROOT = tmp_path / "media"
+
+
 @pytest.fixture(autouse=True)
 def reset_metrics():
     """Reset Prometheus metrics before each test."""
@@ -99,3 +137,40 @@ def reset_metrics():
     for collector in collectors:
         REGISTRY.unregister(collector)
     yield
+
+
+@pytest.fixture
+def assert_no_n_plus_one():
+    """
+    Context manager failing the test when one query shape runs more than
+    ``threshold`` times, e.g. a relation loaded once per serialized row.
+    """
+
+    @contextmanager
+    def _assert_no_n_plus_one(threshold=2):
+        with inspect_queries(threshold=threshold, slow_ms=0) as inspector:
+            yield inspector
+        if inspector.repeated:
+            pytest.fail(
+                f"Repeated queries detected:\n{inspector.report()}", pytrace=False
+            )
+
+    return _assert_no_n_plus_one
+
+
+def walk(client, url, params=None):
+    """Every page following the next links, as lists of ids"""
+    pages = []
+    response = client.get(url, params)
+    while True:
+        assert response.status_code == status.HTTP_200_OK
+        pages.append([row["id"] for row in response.data["results"]])
+        if not response.data["next"]:
+            return pages
+        response = client.get(response.data["next"])
+
+
+def rendered(instance, serializer_class):
+    """What the serializer returns for the instance as it is now"""
+    instance = type(instance).objects.get(pk=instance.pk)
+    return json.loads(JSONRenderer().render(serializer_class(instance).data))
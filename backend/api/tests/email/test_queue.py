@@ -0,0 +1,223 @@
+import socket
+import socketserver
+import threading
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.utils import timezone
+
+from api.collectors import EmailQueueCollector
+from api.metrics import emails_sent_total
+from api.models import OutboundEmail
+from api.services.auth import send_verification_email
+from api.services.mail import EmailQueueWorker, enqueue_email, retry_delay
+
+pytestmark = pytest.mark.django_db
+
+
+class SMTPHandler(socketserver.StreamRequestHandler):
+    """Just enough SMTP for smtplib, recording connections and messages"""
+
+    def reply(self, line: str) -> None:
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        server = self.server
+        server.connections += 1
+        self.reply("220 localhost ready")
+        while line := self.rfile.readline():
+            command = line.decode().strip().split(" ", 1)[0].upper()
+            if command in ("EHLO", "HELO"):
+                self.reply("250 localhost")
+            elif command == "MAIL":
+                if server.failures:
+                    server.failures -= 1
+                    self.reply("451 Try again later")
+                else:
+                    self.reply("250 OK")
+            elif command == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                data = b""
+                while (chunk := self.rfile.readline()) not in (b".\r\n", b""):
+                    data += chunk
+                server.messages.append(data.decode())
+                self.reply("250 OK")
+            elif command == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("250 OK")
+
+
+class SMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), SMTPHandler)
+        self.connections = 0
+        self.messages = []
+        self.failures = 0
+
+
+@pytest.fixture
+def smtp_server(settings):
+    server = SMTPServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    settings.EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+    settings.EMAIL_HOST = "127.0.0.1"
+    settings.EMAIL_PORT = server.server_address[1]
+    settings.EMAIL_USE_TLS = False
+    settings.EMAIL_HOST_USER = ""
+    settings.EMAIL_TIMEOUT = 5
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def queue(count=1):
+    return [
+        enqueue_email(f"Subject {i}", f"Body {i}", [f"user{i}@test.com"], "<p>Hi</p>")
+        for i in range(count)
+    ]
+
+
+class TestEnqueue:
+    def test_verification_email_is_queued_not_sent(self, user_factory, mailoutbox):
+        user = user_factory(is_active=False)
+
+        send_verification_email(user)
+
+        email = OutboundEmail.objects.get()
+        assert email.to == [user.email]
+        assert email.status == OutboundEmail.Status.PENDING
+        assert "verify-email?token=" in email.html_body
+        assert mailoutbox == []
+
+        call_command("send_queued_email", once=True)
+
+        assert len(mailoutbox) == 1
+        assert mailoutbox[0].alternatives[0][1] == "text/html"
+        email.refresh_from_db()
+        assert email.status == OutboundEmail.Status.SENT
+        assert email.sent_at is not None
+
+
+class TestEmailQueueWorker:
+    def test_reuses_one_connection_across_batches(self, smtp_server):
+        queue(5)
+
+        with EmailQueueWorker(batch_size=2) as worker:
+            assert worker.drain() == 5
+
+        assert smtp_server.connections == 1
+        assert len(smtp_server.messages) == 5
+        assert not OutboundEmail.objects.exclude(status=OutboundEmail.Status.SENT)
+
+    def test_failure_is_retried_with_backoff(self, smtp_server):
+        (email,) = queue()
+        smtp_server.failures = 1
+        before = emails_sent_total.labels(result="retry")._value.get()
+
+        with EmailQueueWorker() as worker:
+            assert worker.drain() == 1
+
+        email.refresh_from_db()
+        assert email.status == OutboundEmail.Status.PENDING
+        assert email.attempts == 1
+        assert "Try again later" in email.last_error
+        assert email.next_attempt_at > timezone.now()
+        assert emails_sent_total.labels(result="retry")._value.get() == before + 1
+
+        # Not due yet
+        with EmailQueueWorker() as worker:
+            assert worker.drain() == 0
+
+        OutboundEmail.objects.update(next_attempt_at=timezone.now())
+        with EmailQueueWorker() as worker:
+            assert worker.drain() == 1
+
+        email.refresh_from_db()
+        assert email.status == OutboundEmail.Status.SENT
+        assert email.attempts == 2
+        assert len(smtp_server.messages) == 1
+
+    def test_gives_up_after_max_attempts(self, smtp_server, settings):
+        settings.EMAIL_QUEUE_MAX_ATTEMPTS = 2
+        (email,) = queue()
+        smtp_server.failures = 2
+
+        with EmailQueueWorker() as worker:
+            worker.drain()
+            OutboundEmail.objects.update(next_attempt_at=timezone.now())
+            worker.drain()
+
+        email.refresh_from_db()
+        assert email.status == OutboundEmail.Status.FAILED
+        assert email.attempts == 2
+
+    def test_sends_after_committing_the_claim(self, smtp_server, monkeypatch):
+        (email,) = queue()
+        depth = len(connection.atomic_blocks)
+        seen = []
+
+        with EmailQueueWorker() as worker:
+            send = worker.send
+
+            def recording_send(message):
+                claimed = OutboundEmail.objects.get(pk=email.pk)
+                seen.append((len(connection.atomic_blocks), claimed.next_attempt_at))
+                send(message)
+
+            monkeypatch.setattr(worker, "send", recording_send)
+            assert worker.drain() == 1
+
+        [(sending_depth, claimed_until)] = seen
+        assert sending_depth == depth
+        assert claimed_until > timezone.now()
+        email.refresh_from_db()
+        assert email.status == OutboundEmail.Status.SENT
+
+    def test_reconnects_after_server_disconnect(self, smtp_server):
+        queue(2)
+
+        with EmailQueueWorker(batch_size=1) as worker:
+            worker.send_batch()
+            # Simulate the server dropping the idle connection
+            worker.connection.connection.sock.shutdown(socket.SHUT_RDWR)
+            worker.send_batch()
+
+        assert smtp_server.connections == 2
+        assert len(smtp_server.messages) == 2
+
+    def test_retry_delay_is_capped(self, settings):
+        settings.EMAIL_QUEUE_RETRY_BASE_SECONDS = 30
+        settings.EMAIL_QUEUE_RETRY_MAX_SECONDS = 100
+
+        assert retry_delay(1) == timedelta(seconds=30)
+        assert retry_delay(2) == timedelta(seconds=60)
+        assert retry_delay(5) == timedelta(seconds=100)
+
+
+class TestEmailQueueCollector:
+    def test_reports_depth_per_status(self):
+        queue(2)
+        OutboundEmail.objects.filter(pk=queue()[0].pk).update(
+            status=OutboundEmail.Status.FAILED
+        )
+        OutboundEmail.objects.filter(status=OutboundEmail.Status.PENDING).update(
+            created_at=timezone.now() - timedelta(minutes=5)
+        )
+
+        collector = EmailQueueCollector(refresh_interval=60)
+        families = {family.name: family for family in collector.collect()}
+
+        depth = {
+            s.labels["status"]: s.value for s in families["email_queue_depth"].samples
+        }
+        assert depth == {"PENDING": 2, "SENT": 0, "FAILED": 1}
+        oldest = families["email_queue_oldest_pending_seconds"].samples[0].value
+        assert oldest >= 300
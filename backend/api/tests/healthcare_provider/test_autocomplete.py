@@ -0,0 +1,95 @@
+import pytest
+from django.db import connection
+from django.urls import reverse
+from rest_framework import status
+
+from api.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def patient_client(authenticated_patient_client):
+    client, _ = authenticated_patient_client()
+    return client
+
+
+@pytest.fixture
+def providers(provider_factory, speciality_factory):
+    cardio = speciality_factory(name="Cardiology")
+
+    def make(first_name, last_name, **kwargs):
+        return provider_factory(
+            user__first_name=first_name,
+            user__last_name=last_name,
+            speciality=cardio,
+            **kwargs,
+        )
+
+    return {
+        "jonathan": make("Jonathan", "Reyes"),
+        "joan": make("Joan", "Smith"),
+        "carl": make("Carl", "Johnson"),
+        "removed": make("Jonas", "Hidden", is_removed=True),
+        "other": make("Maria", "Lopez"),
+    }
+
+
+def autocomplete(client, q, **params):
+    response = client.get(reverse("provider-autocomplete"), {"q": q, **params})
+    assert response.status_code == status.HTTP_200_OK
+    return [row["name"] for row in response.data]
+
+
+class TestProviderAutocomplete:
+    def test_prefix_matches_first_or_last_name(self, patient_client, providers):
+        names = autocomplete(patient_client, "jo")
+
+        assert sorted(names) == ["Carl Johnson", "Joan Smith", "Jonathan Reyes"]
+
+    def test_every_word_must_match(self, patient_client, providers):
+        assert autocomplete(patient_client, "jo sm") == ["Joan Smith"]
+
+    def test_fuzzy_matches_typos(self, patient_client, providers):
+        assert autocomplete(patient_client, "Jonatan")[0] == "Jonathan Reyes"
+        assert autocomplete(patient_client, "lopes") == ["Maria Lopez"]
+
+    def test_prefix_matches_rank_first(self, patient_client, providers):
+        assert autocomplete(patient_client, "joan")[0] == "Joan Smith"
+
+    def test_limit_and_shape(self, patient_client, providers):
+        response = patient_client.get(
+            reverse("provider-autocomplete"), {"q": "jo", "limit": 1}
+        )
+
+        assert len(response.data) == 1
+        assert set(response.data[0]) == {"id", "name", "speciality"}
+        assert response.data[0]["speciality"] == "Cardiology"
+        assert autocomplete(patient_client, "") == []
+
+    def test_short_prefixes_are_cached(
+        self, patient_client, providers, django_assert_num_queries
+    ):
+        first = autocomplete(patient_client, "jo")
+        with django_assert_num_queries(0):
+            assert autocomplete(patient_client, "JO") == first
+
+        providers["joan"].user.first_name = "Zoe"
+        providers["joan"].user.save()
+
+        assert "Joan Smith" not in autocomplete(patient_client, "jo")
+
+    @pytest.mark.parametrize(
+        "lookup, index",
+        [
+            ("icontains", "user_last_name_trgm_idx"),
+            ("istartswith", "user_last_name_prefix_idx"),
+        ],
+    )
+    def test_name_lookups_use_an_index(self, lookup, index):
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+        plan = User.objects.filter(**{f"last_name__{lookup}": "eye"}).explain()
+
+        assert index in plan
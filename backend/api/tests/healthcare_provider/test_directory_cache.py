@@ -0,0 +1,125 @@
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+
+from ...models import ProviderHospitalAssignment
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def patient_client(authenticated_patient_client):
+    client, _ = authenticated_patient_client()
+    return client
+
+
+@pytest.fixture
+def providers(provider_factory, speciality_factory):
+    cardio = speciality_factory(name="Cardiology")
+    derm = speciality_factory(name="Dermatology")
+    return [
+        provider_factory(speciality=cardio),
+        provider_factory(speciality=cardio),
+        provider_factory(speciality=derm),
+    ]
+
+
+def list_providers(client, **params):
+    response = client.get(reverse("provider-list"), params)
+    assert response.status_code == status.HTTP_200_OK
+    return response.data
+
+
+class TestProviderDirectoryCache:
+    def test_repeated_page_served_from_cache(
+        self, patient_client, providers, django_assert_num_queries
+    ):
+        first = list_providers(patient_client)
+        assert len(first) == 3
+
+        with django_assert_num_queries(0):
+            assert list_providers(patient_client) == first
+
+    def test_pages_are_keyed_by_filter(self, patient_client, providers):
+        speciality = providers[0].speciality
+
+        assert len(list_providers(patient_client)) == 3
+        assert len(list_providers(patient_client, speciality=speciality.id)) == 2
+        assert len(list_providers(patient_client, search="Dermatology")) == 1
+
+    def test_unused_params_share_the_page(
+        self, patient_client, providers, django_assert_num_queries
+    ):
+        first = list_providers(patient_client)
+
+        with django_assert_num_queries(0):
+            assert list_providers(patient_client, ordering="-id", page_size=1) == first
+
+    def test_provider_change_invalidates(self, patient_client, providers):
+        list_providers(patient_client)
+
+        providers[0].is_removed = True
+        providers[0].save()
+
+        assert len(list_providers(patient_client)) == 2
+
+    def test_user_change_invalidates(self, patient_client, providers):
+        list_providers(patient_client)
+
+        user = providers[0].user
+        user.first_name = "Renamed"
+        user.save()
+
+        names = [p["firstName"] for p in list_providers(patient_client)]
+        assert "Renamed" in names
+
+    def test_speciality_change_invalidates(self, patient_client, providers):
+        list_providers(patient_client)
+
+        speciality = providers[2].speciality
+        speciality.name = "Skin"
+        speciality.save()
+
+        names = {p["specialityName"] for p in list_providers(patient_client)}
+        assert names == {"Cardiology", "Skin"}
+
+    def test_assignment_change_invalidates(
+        self, patient_client, providers, hospital_factory, django_assert_num_queries
+    ):
+        list_providers(patient_client)
+        provider = providers[0]
+
+        ProviderHospitalAssignment.objects.create(
+            healthcare_provider=provider,
+            hospital=hospital_factory(),
+            created_by=provider.user,
+            updated_by=provider.user,
+        )
+
+        # Rendered again
+        with django_assert_num_queries(1):
+            list_providers(patient_client)
+
+    def test_login_does_not_invalidate(
+        self, patient_client, providers, django_assert_num_queries
+    ):
+        list_providers(patient_client)
+
+        user = providers[0].user
+        user.save(update_fields=["last_login"])
+
+        with django_assert_num_queries(0):
+            list_providers(patient_client)
+
+
+class TestWarmProviderDirectory:
+    def test_warm_renders_top_specialities(
+        self, patient_client, providers, django_assert_num_queries
+    ):
+        call_command("warm_provider_directory", "--host=testserver", "--insecure")
+
+        speciality = providers[0].speciality
+        with django_assert_num_queries(0):
+            assert len(list_providers(patient_client)) == 3
+            assert len(list_providers(patient_client, speciality=speciality.id)) == 2
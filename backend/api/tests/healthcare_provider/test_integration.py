@@ -343,17 +343,17 @@ class TestHealthcareProviderFlow:
         appointment_url = reverse("appointment-list")
         response = provider_client.get(appointment_url)
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 2
+        assert len(response.data["results"]) == 2
 
-        appointment_ids = [a["id"] for a in response.data]
+        appointment_ids = [a["id"] for a in response.data["results"]]
         assert past_appointment.id in appointment_ids
         assert future_appointment.id in appointment_ids
         assert other_provider_appointment.id not in appointment_ids
 
         # Filter by status
         response = provider_client.get(appointment_url, {"status": "COMPLETED"})
-        assert len(response.data) == 1
-        assert response.data[0]["id"] == past_appointment.id
+        assert len(response.data["results"]) == 1
+        assert response.data["results"][0]["id"] == past_appointment.id
 
     def test_provider_onboard_existing_user(
         self,
@@ -0,0 +1,133 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from api.models import MedicalRecord
+from api.serializers import MedicalRecordDetailSerializer
+
+from ..conftest import rendered
+
+pytestmark = pytest.mark.django_db
+
+
+def retrieve(client, record):
+    response = client.get(reverse("medical_record-detail", args=[record.pk]))
+    assert response.status_code == 200
+    return json.loads(response.content)
+
+
+class TestMedicalRecordDetail:
+    def test_retrieve_is_the_serializer_output(
+        self, provider_client, medical_record_factory
+    ):
+        record = medical_record_factory()
+
+        assert retrieve(provider_client, record) == rendered(
+            record, MedicalRecordDetailSerializer
+        )
+
+    def test_retrieve_reads_one_row(self, provider_client, medical_record_factory):
+        record = medical_record_factory()
+
+        with CaptureQueriesContext(connection) as queries:
+            retrieve(provider_client, record)
+
+        record_queries = [q["sql"] for q in queries if "api_medicalrecord" in q["sql"]]
+        assert len(record_queries) == 1
+        assert "JOIN" not in record_queries[0]
+
+    def test_follows_related_changes(self, provider_client, medical_record_factory):
+        record = medical_record_factory()
+
+        record.patient.allergies = "Penicillin"
+        record.patient.save()
+        record.patient.user.first_name = "Alicia"
+        record.patient.user.save()
+        record.healthcare_provider.speciality.name = "Neurology"
+        record.healthcare_provider.speciality.save()
+        record.hospital.name = "Riverside Clinic"
+        record.hospital.save()
+        record.appointment.reason = "Follow up"
+        record.appointment.save()
+
+        data = retrieve(provider_client, record)
+
+        assert data == rendered(record, MedicalRecordDetailSerializer)
+        assert data["patientDetails"]["allergies"] == "Penicillin"
+        assert data["patientDetails"]["fullName"].startswith("Alicia")
+        assert data["providerDetails"]["specialityName"] == "Neurology"
+        assert data["hospitalDetails"]["name"] == "Riverside Clinic"
+        assert data["appointmentDetails"]["reason"] == "Follow up"
+
+    def test_soft_delete_is_captured(
+        self, authenticated_provider_client, medical_record_factory
+    ):
+        client, provider = authenticated_provider_client()
+        record = medical_record_factory(healthcare_provider=provider)
+
+        client.delete(reverse("medical_record-detail", args=[record.pk]))
+
+        record.refresh_from_db()
+        assert record.detail["isRemoved"] is True
+        assert (
+            record.detail["updatedAt"]
+            == rendered(record, MedicalRecordDetailSerializer)["updatedAt"]
+        )
+
+    def test_missing_payload_is_rendered_on_read(
+        self, provider_client, medical_record_factory
+    ):
+        record = medical_record_factory()
+        MedicalRecord.objects.filter(pk=record.pk).update(detail=None)
+
+        assert retrieve(provider_client, record) == rendered(
+            record, MedicalRecordDetailSerializer
+        )
+        record.refresh_from_db()
+        assert record.detail is None
+
+    def test_shared_change_refreshes_up_to_the_limit(
+        self,
+        provider_client,
+        medical_record_factory,
+        hospital_factory,
+        settings,
+        django_capture_on_commit_callbacks,
+    ):
+        settings.MEDICAL_RECORD_DETAIL_REFRESH_LIMIT = 2
+        hospital = hospital_factory()
+        records = [medical_record_factory(hospital=hospital) for _ in range(3)]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            hospital.name = "Riverside Clinic"
+            hospital.save()
+
+        stored = MedicalRecord.objects.filter(hospital=hospital, detail__isnull=False)
+        assert stored.count() == 2
+        for record in records:
+            data = retrieve(provider_client, record)
+            assert data == rendered(record, MedicalRecordDetailSerializer)
+            assert data["hospitalDetails"]["name"] == "Riverside Clinic"
+
+        call_command("refresh_record_details", stdout=StringIO())
+
+        assert stored.count() == 3
+
+    def test_appointment_filter_lists_payloads(
+        self, provider_client, medical_record_factory
+    ):
+        record = medical_record_factory()
+        medical_record_factory()
+
+        response = provider_client.get(
+            reverse("medical_record-list"), {"appointment": record.appointment_id}
+        )
+
+        assert json.loads(response.content)["results"] == [
+            rendered(record, MedicalRecordDetailSerializer)
+        ]
@@ -0,0 +1,97 @@
+import csv
+import io
+import json
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from api.serializers import MedicalRecordExportSerializer
+
+from ..conftest import rendered
+
+pytestmark = pytest.mark.django_db
+
+
+def export(client, **params):
+    response = client.get(reverse("medical_record-export"), params)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.streaming
+    return response, b"".join(response.streaming_content).decode()
+
+
+class TestMedicalRecordExport:
+    def test_csv_has_only_the_patients_records(
+        self, authenticated_patient_client, medical_record_factory
+    ):
+        client, patient = authenticated_patient_client()
+        records = [medical_record_factory(patient=patient) for _ in range(3)]
+        medical_record_factory()
+
+        response, body = export(client)
+
+        assert response["Content-Type"].startswith("text/csv")
+        assert "medical-records.csv" in response["Content-Disposition"]
+        rows = list(csv.DictReader(io.StringIO(body)))
+        assert [int(row["id"]) for row in rows] == [r.pk for r in records]
+        expected = rendered(records[0], MedicalRecordExportSerializer)
+        assert rows[0] == {key: str(value) for key, value in expected.items()}
+
+    def test_ndjson_follows_filters_in_chunks(
+        self, authenticated_provider_client, medical_record_factory, settings
+    ):
+        settings.MEDICAL_RECORD_EXPORT_CHUNK_SIZE = 2
+        client, _ = authenticated_provider_client()
+        record = medical_record_factory()
+        others = [medical_record_factory(patient=record.patient) for _ in range(4)]
+        medical_record_factory()
+        medical_record_factory(patient=record.patient, is_removed=True)
+
+        response, body = export(client, type="ndjson", patient=record.patient_id)
+
+        assert response["Content-Type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in body.splitlines()]
+        assert [line["id"] for line in lines] == [r.pk for r in [record, *others]]
+        assert lines[0] == rendered(record, MedicalRecordExportSerializer)
+
+    def test_csv_cells_are_never_formulas(
+        self, authenticated_patient_client, medical_record_factory
+    ):
+        client, patient = authenticated_patient_client()
+        medical_record_factory(
+            patient=patient,
+            diagnosis='=HYPERLINK("http://example.com")',
+            notes="+1 dose, -2 later",
+            prescriptions="@SUM(A1)",
+        )
+
+        _, body = export(client)
+
+        (row,) = csv.DictReader(io.StringIO(body))
+        assert row["diagnosis"] == '\'=HYPERLINK("http://example.com")'
+        assert row["notes"] == "'+1 dose, -2 later"
+        assert row["prescriptions"] == "'@SUM(A1)"
+
+    def test_ndjson_text_is_unchanged(
+        self, authenticated_patient_client, medical_record_factory
+    ):
+        client, patient = authenticated_patient_client()
+        medical_record_factory(patient=patient, diagnosis="-Negative")
+
+        _, body = export(client, type="ndjson")
+
+        assert json.loads(body)["diagnosis"] == "-Negative"
+
+    def test_unknown_type(self, authenticated_provider_client):
+        client, _ = authenticated_provider_client()
+
+        response = client.get(reverse("medical_record-export"), {"type": "xml"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_users_without_records_role(self, authenticated_admin_client):
+        client, _ = authenticated_admin_client()
+
+        response = client.get(reverse("medical_record-export"))
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -87,7 +87,7 @@ class TestMedicalRecordFlow:
         response = patient_client.get(list_url)
         assert response.status_code == status.HTTP_200_OK
 
-        record_ids = [r["id"] for r in response.data]
+        record_ids = [r["id"] for r in response.data["results"]]
         assert record1.id in record_ids
         assert record2.id in record_ids
         assert other_patient_record.id not in record_ids
@@ -181,7 +181,7 @@ class TestMedicalRecordFlow:
         # Record no longer appears in list
         list_url = reverse("medical_record-list")
         response = provider_client.get(list_url)
-        assert medical_record.id not in [r["id"] for r in response.data]
+        assert medical_record.id not in [r["id"] for r in response.data["results"]]
 
     def test_admin_can_view_soft_deleted_records(
         self, authenticated_admin_client, medical_record_factory
@@ -194,7 +194,7 @@ class TestMedicalRecordFlow:
         removed_url = reverse("medical_record-removed")
         response = admin_client.get(removed_url)
         assert response.status_code == status.HTTP_200_OK
-        assert medical_record.id in [r["id"] for r in response.data]
+        assert medical_record.id in [r["id"] for r in response.data["results"]]
 
         # Admin restores the record
         restore_url = reverse("medical_record-restore", args=[medical_record.id])
@@ -283,25 +283,25 @@ class TestMedicalRecordFlow:
 
         # Filter by patient
         response = provider_client.get(list_url, {"patient": patient1.user_id})
-        assert len(response.data) == 2
-        record_ids = [r["id"] for r in response.data]
+        assert len(response.data["results"]) == 2
+        record_ids = [r["id"] for r in response.data["results"]]
         assert record1.id in record_ids
         assert record3.id in record_ids
         assert record2.id not in record_ids
 
         # Filter by hospital
         response = provider_client.get(list_url, {"hospital": hospital1.id})
-        assert len(response.data) == 2
-        assert record1.id in [r["id"] for r in response.data]
-        assert record2.id in [r["id"] for r in response.data]
+        assert len(response.data["results"]) == 2
+        assert record1.id in [r["id"] for r in response.data["results"]]
+        assert record2.id in [r["id"] for r in response.data["results"]]
 
         # Search by diagnosis
         response = provider_client.get(list_url, {"search": "diabetes"})
-        assert len(response.data) == 1
-        assert response.data[0]["id"] == record1.id
+        assert len(response.data["results"]) == 1
+        assert response.data["results"][0]["id"] == record1.id
 
         # Search by patient name
         response = provider_client.get(list_url, {"search": "Alice"})
-        assert len(response.data) == 2
-        assert record1.id in [r["id"] for r in response.data]
-        assert record3.id in [r["id"] for r in response.data]
+        assert len(response.data["results"]) == 2
+        assert record1.id in [r["id"] for r in response.data["results"]]
+        assert record3.id in [r["id"] for r in response.data["results"]]
@@ -0,0 +1,96 @@
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.request import Request
+
+from api.models import MedicalRecord
+from api.pagination import MedicalRecordPagination
+
+from ..conftest import walk
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def make_records(medical_record_factory):
+    def make(*minutes: int, **kwargs):
+        # created_at is set on insert, so backdate it afterwards
+        now = timezone.now()
+        records = []
+        for offset in minutes:
+            record = medical_record_factory(**kwargs)
+            MedicalRecord.objects.filter(pk=record.pk).update(
+                created_at=now - timedelta(minutes=offset)
+            )
+            records.append(record.pk)
+        return records
+
+    return make
+
+
+class TestMedicalRecordPagination:
+    def test_list_pages_newest_first_with_ties(
+        self, authenticated_provider_client, make_records
+    ):
+        client, _ = authenticated_provider_client()
+        newest, *tied, oldest = make_records(1, 5, 5, 5, 9)
+
+        pages = walk(client, reverse("medical_record-list"), {"page_size": 2})
+
+        assert pages == [[newest, max(tied)], sorted(tied, reverse=True)[1:], [oldest]]
+
+    def test_single_page_count_is_exact(
+        self, authenticated_patient_client, make_records
+    ):
+        client, patient = authenticated_patient_client()
+        make_records(1, 2, 3, patient=patient)
+        make_records(4)
+
+        response = client.get(reverse("medical_record-list"))
+
+        assert response.data["estimated_count"] == 3
+        assert response.data["next"] is None
+
+    def test_estimate_comes_from_the_planner(
+        self, authenticated_provider_client, make_records
+    ):
+        client, _ = authenticated_provider_client()
+        make_records(1, 2, 3)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(reverse("medical_record-list"), {"page_size": 1})
+
+        assert isinstance(response.data["estimated_count"], int)
+        sql = [query["sql"] for query in queries]
+        assert any(statement.startswith("EXPLAIN") for statement in sql)
+        assert not any("COUNT(" in statement for statement in sql)
+
+    def test_estimate_unavailable(self, monkeypatch, rf, make_records):
+        make_records(1, 2)
+
+        def explain(self, **options):
+            raise ValueError("Unknown format")
+
+        monkeypatch.setattr(type(MedicalRecord.objects.all()), "explain", explain)
+        paginator = MedicalRecordPagination()
+        request = Request(rf.get("/", {"page_size": 1}))
+        paginator.paginate_queryset(MedicalRecord.objects.all(), request)
+
+        assert paginator.get_estimated_count() is None
+
+    def test_mine_and_removed_are_paginated(
+        self, authenticated_admin_client, authenticated_patient_client, make_records
+    ):
+        patient_client, patient = authenticated_patient_client()
+        admin_client, _ = authenticated_admin_client()
+        live = make_records(1, 2, 3, patient=patient)
+        removed = make_records(4, 5, 6, is_removed=True)
+
+        mine = walk(patient_client, reverse("medical_record-mine"), {"page_size": 2})
+        assert mine == [live[:2], live[2:]]
+        gone = walk(admin_client, reverse("medical_record-removed"), {"page_size": 2})
+        assert gone == [removed[:2], removed[2:]]
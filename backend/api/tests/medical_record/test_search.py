@@ -0,0 +1,68 @@
+import pytest
+from django.urls import reverse
+
+from api.models import MedicalRecord
+from api.services.search import search_query
+
+pytestmark = pytest.mark.django_db
+
+
+def search(client, text, **params):
+    response = client.get(reverse("medical_record-list"), {"search": text, **params})
+    assert response.status_code == 200
+    return [row["id"] for row in response.data["results"]]
+
+
+class TestMedicalRecordSearch:
+    def test_vector_is_written_on_save(self, medical_record_factory):
+        record = medical_record_factory(diagnosis="Migraine")
+
+        assert MedicalRecord.objects.filter(
+            pk=record.pk, search_vector=search_query(["migraine"])
+        ).exists()
+
+    def test_ranked_by_field_weight(self, provider_client, medical_record_factory):
+        in_notes = medical_record_factory(notes="Possible asthma, monitor")
+        in_diagnosis = medical_record_factory(diagnosis="Asthma")
+        medical_record_factory(diagnosis="Eczema", notes="Dry skin")
+
+        assert search(provider_client, "asthma") == [in_diagnosis.pk, in_notes.pk]
+
+    def test_prefix_and_every_word(self, provider_client, medical_record_factory):
+        record = medical_record_factory(
+            diagnosis="Hypertension", prescriptions="Lisinopril 10mg"
+        )
+        medical_record_factory(diagnosis="Hypertension", prescriptions="Amlodipine")
+
+        assert search(provider_client, "hyperten lisino") == [record.pk]
+        assert search(provider_client, "!!") == search(provider_client, "")
+
+    def test_follows_renames(
+        self, provider_client, medical_record_factory, patient_factory
+    ):
+        patient = patient_factory(user__first_name="Margaret")
+        record = medical_record_factory(patient=patient)
+
+        patient.user.first_name = "Alicia"
+        patient.user.save()
+        record.hospital.name = "Riverside Clinic"
+        record.hospital.save()
+
+        assert search(provider_client, "alicia") == [record.pk]
+        assert search(provider_client, "riverside") == [record.pk]
+        assert search(provider_client, "margaret") == []
+
+    def test_ranked_results_page_by_cursor(
+        self, provider_client, medical_record_factory
+    ):
+        records = [medical_record_factory(notes="Asthma follow up") for _ in range(3)]
+        best = medical_record_factory(diagnosis="Asthma")
+
+        first = provider_client.get(
+            reverse("medical_record-list"), {"search": "asthma", "page_size": 2}
+        ).data
+        second = provider_client.get(first["next"]).data
+
+        ids = [row["id"] for row in first["results"] + second["results"]]
+        assert ids == [best.pk] + sorted((r.pk for r in records), reverse=True)
+        assert second["next"] is None
@@ -1033,7 +1033,7 @@ class TestMedicalRecordDetailSerializer:
         assert patient_details["height"] == 175
         assert patient_details["fullName"] == record.patient.user.get_full_name()
         assert patient_details["dateOfBirth"].strftime("%Y-%m-%d") == "1980-01-01"
-        assert patient_details["image"] == "profile.jpg"
+        assert patient_details["image"] == record.patient.user.image.url
         assert appointment_details["reason"] == "test"
         assert appointment_details["status"] == "REQUESTED"
 
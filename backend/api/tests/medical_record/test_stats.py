@@ -0,0 +1,130 @@
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+from api.models import MedicalRecord, MedicalRecordCount
+from api.models.medical import record_month
+from api.services.record_counts import rebuild_counts
+
+pytestmark = pytest.mark.django_db
+
+
+def stats(client):
+    response = client.get(reverse("medical_record-stats"))
+    assert response.status_code == 200
+    return response.data
+
+
+def counts():
+    return sorted(
+        MedicalRecordCount.objects.filter(records__gt=0).values_list(
+            "patient_id", "healthcare_provider_id", "hospital_id", "month", "records"
+        ),
+        key=str,
+    )
+
+
+@pytest.fixture
+def provider_records(authenticated_provider_client, medical_record_factory):
+    client, provider = authenticated_provider_client()
+    first = medical_record_factory(healthcare_provider=provider)
+    medical_record_factory(healthcare_provider=provider, hospital=first.hospital)
+    old = medical_record_factory(
+        healthcare_provider=provider, created_at=timezone.now() - timedelta(days=45)
+    )
+    medical_record_factory(healthcare_provider=provider, is_removed=True)
+    medical_record_factory()
+    return client, provider, first, old
+
+
+class TestMedicalRecordStats:
+    def test_provider_breakdowns(self, provider_records):
+        client, _, first, old = provider_records
+
+        data = stats(client)
+
+        assert data["role"] == "provider"
+        assert data["total_records"] == 3
+        assert data["recent_records"] == 2
+        assert data["by_hospital"] == [
+            {
+                "hospital_id": first.hospital_id,
+                "hospital_name": first.hospital.name,
+                "records": 2,
+            },
+            {
+                "hospital_id": old.hospital_id,
+                "hospital_name": old.hospital.name,
+                "records": 1,
+            },
+        ]
+        months = {m["month"]: m["records"] for m in data["by_month"]}
+        assert sum(months.values()) == 3
+        assert months[record_month(old.created_at).strftime("%Y-%m")] >= 1
+
+    def test_counters_match_a_recount(self, provider_records, settings):
+        client, *_ = provider_records
+        counted = stats(client)
+
+        settings.MEDICAL_RECORD_COUNTERS = False
+        assert stats(client) == counted
+        maintained = counts()
+        rebuild_counts()
+        assert counts() == maintained
+
+    def test_counters_follow_soft_delete_and_restore(self, provider_records):
+        client, _, first, _ = provider_records
+
+        client.delete(reverse("medical_record-detail", args=[first.pk]))
+        assert stats(client)["total_records"] == 2
+
+        client.post(reverse("medical_record-restore", args=[first.pk]))
+        assert stats(client)["total_records"] == 3
+
+        maintained = counts()
+        rebuild_counts()
+        assert counts() == maintained
+
+    def test_stale_copies_are_counted_once(self, provider_records):
+        client, _, first, _ = provider_records
+        # Two requests that loaded the record before either saved it
+        copies = [MedicalRecord.objects.get(pk=first.pk) for _ in range(2)]
+
+        for copy in copies:
+            copy.is_removed = True
+            copy.save()
+        assert stats(client)["total_records"] == 2
+
+        for copy in copies:
+            copy.is_removed = False
+            copy.save()
+        assert stats(client)["total_records"] == 3
+
+        maintained = counts()
+        rebuild_counts()
+        assert counts() == maintained
+
+    def test_hospital_change_moves_the_record(self, provider_records, hospital_factory):
+        client, _, first, _ = provider_records
+        before = first.hospital_id
+
+        first.hospital = hospital_factory()
+        first.save()
+
+        data = stats(client)
+        by_hospital = {h["hospital_id"]: h["records"] for h in data["by_hospital"]}
+        assert by_hospital[first.hospital_id] == 1
+        assert by_hospital[before] == 1
+
+    def test_patient_stats(self, authenticated_patient_client, medical_record_factory):
+        client, patient = authenticated_patient_client()
+        for _ in range(3):
+            medical_record_factory(patient=patient)
+        medical_record_factory()
+
+        data = stats(client)
+
+        assert data["role"] == "patient"
+        assert data["total_records"] == 3
@@ -0,0 +1,188 @@
+import pytest
+from datetime import timedelta
+from django.db import DatabaseError, connection
+from django.utils import timezone
+
+from api.collectors import OTHER, BusinessGaugesCollector, ProviderStatsCollector
+from api.models import Appointment, Slot
+from api.metrics import provider_appointments_total
+from api.services.events import BOOKING_CREATED, emit_booking_event, BookingEvent
+
+
+pytestmark = pytest.mark.django_db
+
+
+def samples(families, name):
+    """Map label tuples to values for one metric family"""
+    for family in families:
+        if family.name == name:
+            return {tuple(s.labels.values()): s.value for s in family.samples}
+    return {}
+
+
+@pytest.fixture
+def appointments(provider_factory, appointment_factory):
+    """Three providers with 3, 2 and 1 appointments"""
+    providers = [provider_factory() for _ in range(3)]
+    for count, provider in zip((3, 2, 1), providers):
+        for _ in range(count):
+            appointment_factory(
+                healthcare_provider=provider, location=provider.primary_hospital
+            )
+    return providers
+
+
+class TestProviderStatsCollector:
+    def test_top_k_with_other_bucket(self, appointments):
+        collector = ProviderStatsCollector(refresh_interval=60, top_k=1)
+        top = appointments[0]
+
+        providers = samples(collector.collect(), "provider_appointment_count")
+        assert providers == {
+            (str(top.pk), top.speciality.name): 3,
+            (OTHER, OTHER): 3,
+        }
+
+        hospitals = samples(collector.collect(), "hospital_appointment_count")
+        hospital = top.primary_hospital
+        assert hospitals[(str(hospital.id), hospital.city, hospital.state)] == 3
+        assert hospitals[(OTHER, OTHER, OTHER)] == 3
+
+    def test_scrapes_within_interval_are_cached(
+        self, appointments, appointment_factory, django_assert_num_queries
+    ):
+        collector = ProviderStatsCollector(refresh_interval=60, top_k=5)
+        first = collector.collect()
+
+        appointment_factory(healthcare_provider=appointments[2])
+        with django_assert_num_queries(0):
+            assert collector.collect() == first
+
+    def test_refresh_after_interval(self, appointments, appointment_factory):
+        collector = ProviderStatsCollector(refresh_interval=0, top_k=5)
+        provider = appointments[2]
+        key = (str(provider.pk), provider.speciality.name)
+        assert samples(collector.collect(), "provider_appointment_count")[key] == 1
+
+        appointment_factory(healthcare_provider=provider)
+        assert samples(collector.collect(), "provider_appointment_count")[key] == 2
+
+    def test_describe_does_not_query(self, django_assert_num_queries):
+        collector = ProviderStatsCollector()
+        with django_assert_num_queries(0):
+            names = [family.name for family in collector.describe()]
+        assert names == ["provider_appointment_count", "hospital_appointment_count"]
+
+
+class TestBusinessGaugesCollector:
+    @pytest.fixture
+    def upcoming_slots(self, provider_factory, slot_factory):
+        """One provider with 3 free and 1 booked slot tomorrow, 1 free next month"""
+        provider = provider_factory()
+        start = timezone.now() + timedelta(days=1)
+        for offset, slot_status in enumerate(
+            [Slot.Status.FREE] * 3 + [Slot.Status.BOOKED]
+        ):
+            slot_start = start + timedelta(hours=offset)
+            slot_factory(
+                healthcare_provider=provider,
+                hospital=provider.primary_hospital,
+                start=slot_start,
+                end=slot_start + timedelta(minutes=30),
+                status=slot_status,
+                appointment=None,
+            )
+        later = timezone.now() + timedelta(days=30)
+        slot_factory(
+            healthcare_provider=provider,
+            hospital=provider.primary_hospital,
+            start=later,
+            end=later + timedelta(minutes=30),
+            status=Slot.Status.FREE,
+            appointment=None,
+        )
+        return provider
+
+    def test_open_requested(self, appointment_factory):
+        appointment_factory(status=Appointment.Status.REQUESTED)
+        appointment_factory(status=Appointment.Status.REQUESTED)
+        appointment_factory(status=Appointment.Status.CONFIRMED)
+
+        collector = BusinessGaugesCollector(refresh_interval=60)
+        assert samples(collector.collect(), "appointments_open_requested") == {(): 2}
+
+    def test_free_capacity_and_utilization(self, upcoming_slots):
+        collector = BusinessGaugesCollector(refresh_interval=60)
+        families = collector.collect()
+
+        hospital_id = str(upcoming_slots.primary_hospital.id)
+        assert samples(families, "slots_free_next_7d")[(hospital_id,)] == 3
+        assert samples(families, "speciality_utilization_ratio") == {
+            (upcoming_slots.speciality.name,): 0.25
+        }
+
+    def test_fully_booked_hospital_reports_zero(
+        self, upcoming_slots, hospital_factory, slot_factory
+    ):
+        booked = upcoming_slots.slots.get(status=Slot.Status.BOOKED)
+        full = hospital_factory()
+        slot_factory(
+            healthcare_provider=upcoming_slots,
+            hospital=full,
+            start=booked.start + timedelta(hours=4),
+            end=booked.end + timedelta(hours=4),
+            status=Slot.Status.BOOKED,
+            appointment=None,
+        )
+        empty = hospital_factory()
+
+        collector = BusinessGaugesCollector(refresh_interval=60)
+        free_slots = samples(collector.collect(), "slots_free_next_7d")
+
+        assert free_slots[(str(full.id),)] == 0
+        assert free_slots[(str(empty.id),)] == 0
+
+    def test_bounded_number_of_queries(
+        self, upcoming_slots, settings, django_assert_max_num_queries
+    ):
+        settings.METRICS_SCRAPE_BUDGET_MS = 0
+        collector = BusinessGaugesCollector(refresh_interval=60)
+        # Three aggregates plus the savepoint around them
+        with django_assert_max_num_queries(5):
+            collector.collect()
+
+    def test_serves_stale_families_when_over_budget(self, upcoming_slots, monkeypatch):
+        collector = BusinessGaugesCollector(refresh_interval=0)
+        first = collector.collect()
+
+        def timed_out():
+            raise DatabaseError("canceling statement due to statement timeout")
+
+        monkeypatch.setattr(collector, "build", timed_out)
+        assert collector.collect() == first
+
+    def test_statement_timeout_does_not_leak(self, settings):
+        settings.METRICS_SCRAPE_BUDGET_MS = 250
+        BusinessGaugesCollector(refresh_interval=0).collect()
+
+        with connection.cursor() as cursor:
+            cursor.execute("SHOW statement_timeout")
+            assert cursor.fetchone()[0] == "0"
+
+
+class TestRawProviderCounters:
+    def _emit(self, appointment):
+        emit_booking_event(BookingEvent.capture(BOOKING_CREATED, appointment))
+        labels = {
+            "provider_id": str(appointment.healthcare_provider_id),
+            "speciality_name": appointment.healthcare_provider.speciality.name,
+            "hospital_id": str(appointment.location_id),
+        }
+        return provider_appointments_total.labels(**labels)._value.get()
+
+    def test_disabled_by_default(self, appointment_factory):
+        assert self._emit(appointment_factory()) == 0
+
+    def test_enabled_by_setting(self, appointment_factory, settings):
+        settings.METRICS_RAW_PROVIDER_COUNTERS = True
+        assert self._emit(appointment_factory()) == 1
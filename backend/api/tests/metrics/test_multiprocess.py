@@ -0,0 +1,123 @@
+import os
+import runpy
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from django.urls import reverse
+
+BACKEND_DIR = Path(__file__).resolve().parents[3]
+
+WORKER_SCRIPT = """
+from api.metrics import appointments_created_total
+appointments_created_total.labels(
+    status="REQUESTED", speciality_id="1", hospital_id="1"
+).inc()
+"""
+
+
+@pytest.fixture
+def multiproc_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def gunicorn_config():
+    return runpy.run_path(str(BACKEND_DIR / "gunicorn.conf.py"))
+
+
+def run_worker(path):
+    """Run a separate interpreter that records a sample like a gunicorn worker"""
+    env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(path)}
+    subprocess.run(
+        [sys.executable, "-c", WORKER_SCRIPT],
+        cwd=BACKEND_DIR,
+        env=env,
+        check=True,
+    )
+
+
+@pytest.mark.django_db
+class TestMultiprocessMetrics:
+    def test_metrics_aggregated_across_workers(self, client, multiproc_dir):
+        for _ in range(3):
+            run_worker(multiproc_dir)
+
+        assert len(list(multiproc_dir.glob("counter_*.db"))) == 3
+
+        response = client.get(reverse("prometheus-django-metrics"))
+        assert response.status_code == 200
+        body = response.content.decode()
+        assert (
+            'appointments_created_total{hospital_id="1",speciality_id="1",'
+            'status="REQUESTED"} 3.0'
+        ) in body
+
+    def test_single_process_uses_default_registry(self, client, monkeypatch):
+        monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+        monkeypatch.delenv("prometheus_multiproc_dir", raising=False)
+
+        response = client.get(reverse("prometheus-django-metrics"))
+        assert response.status_code == 200
+        assert response["Content-Type"].startswith("text/plain")
+
+
+class TestGunicornHooks:
+    def test_on_starting_clears_stale_files(self, gunicorn_config, multiproc_dir):
+        stale = multiproc_dir / "counter_999.db"
+        stale.write_bytes(b"")
+
+        gunicorn_config["on_starting"](SimpleNamespace())
+
+        assert multiproc_dir.is_dir()
+        assert not stale.exists()
+
+    def test_runs_the_email_sender(self, gunicorn_config, monkeypatch):
+        monkeypatch.delenv("EMAIL_WORKER", raising=False)
+        started = []
+
+        class FakeProcess:
+            def __init__(self, args, cwd):
+                started.append((args, cwd))
+                self.terminated = False
+
+            def terminate(self):
+                self.terminated = True
+
+            def wait(self, timeout):
+                return 0
+
+        monkeypatch.setattr(subprocess, "Popen", FakeProcess)
+        server = SimpleNamespace()
+
+        gunicorn_config["when_ready"](server)
+        gunicorn_config["on_exit"](server)
+
+        [(args, cwd)] = started
+        assert args[1:] == ["manage.py", "send_queued_email"]
+        assert Path(cwd) == BACKEND_DIR
+        assert server.email_worker.terminated
+
+    def test_email_sender_can_run_elsewhere(self, gunicorn_config, monkeypatch):
+        monkeypatch.setenv("EMAIL_WORKER", "0")
+        server = SimpleNamespace()
+
+        gunicorn_config["when_ready"](server)
+        gunicorn_config["on_exit"](server)
+
+        assert not hasattr(server, "email_worker")
+
+    def test_child_exit_marks_worker_dead(self, gunicorn_config, multiproc_dir):
+        live_gauge = multiproc_dir / "gauge_livesum_4242.db"
+        live_gauge.write_bytes(b"")
+        counter = multiproc_dir / "counter_4242.db"
+        counter.write_bytes(b"")
+
+        gunicorn_config["child_exit"](SimpleNamespace(), SimpleNamespace(pid=4242))
+
+        assert not live_gauge.exists()
+        # Counters of dead workers still count towards the totals
+        assert counter.exists()
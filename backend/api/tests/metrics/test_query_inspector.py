@@ -0,0 +1,104 @@
+import logging
+
+import pytest
+from django.urls import reverse
+
+from api.models import Speciality
+from api.utils.queries import fingerprint, inspect_queries
+
+
+pytestmark = pytest.mark.django_db
+
+
+class TestFingerprint:
+    def test_literals_are_removed(self):
+        assert fingerprint(
+            "SELECT * FROM t WHERE id = 42 AND name = 'O''Brien'  LIMIT 21"
+        ) == fingerprint("SELECT * FROM t WHERE id = 7 AND name = 'x' LIMIT 1")
+
+    def test_in_lists_collapse(self):
+        assert fingerprint("SELECT * FROM t WHERE id IN (%s, %s, %s)") == (
+            "SELECT * FROM t WHERE id IN (...)"
+        )
+
+    def test_identifiers_are_kept(self):
+        assert fingerprint('SELECT "t1"."id" FROM "t1"') != fingerprint(
+            'SELECT "t2"."id" FROM "t2"'
+        )
+
+
+class TestQueryInspector:
+    def test_flags_repeated_shapes_with_stack(self, speciality_factory):
+        ids = [speciality_factory().id for _ in range(3)]
+
+        with inspect_queries(threshold=2, slow_ms=0) as inspector:
+            for pk in ids:
+                Speciality.objects.get(pk=pk)
+
+        [repeated] = inspector.repeated
+        assert repeated.count == 3
+        assert '"api_speciality"' in repeated.fingerprint
+        assert __file__ in "".join(repeated.stack)
+
+    def test_below_threshold_is_not_flagged(self, speciality_factory):
+        ids = [speciality_factory().id for _ in range(2)]
+
+        with inspect_queries(threshold=2, slow_ms=0) as inspector:
+            for pk in ids:
+                Speciality.objects.get(pk=pk)
+
+        assert inspector.repeated == []
+        assert inspector.report() == ""
+
+    def test_logs_slow_queries(self, caplog):
+        with caplog.at_level(logging.WARNING, logger="api.utils.queries"):
+            with inspect_queries(slow_ms=0.000001):
+                Speciality.objects.count()
+
+        assert "Slow query" in caplog.text
+        assert "api_speciality" in caplog.text
+
+
+class TestAssertNoNPlusOne:
+    def test_fails_on_repeated_queries(self, assert_no_n_plus_one, speciality_factory):
+        ids = [speciality_factory().id for _ in range(3)]
+
+        with pytest.raises(pytest.fail.Exception, match="Repeated queries"):
+            with assert_no_n_plus_one():
+                for pk in ids:
+                    Speciality.objects.get(pk=pk)
+
+    def test_appointment_list(
+        self, authenticated_patient_client, appointment_factory, assert_no_n_plus_one
+    ):
+        client, patient = authenticated_patient_client()
+        for _ in range(5):
+            appointment_factory(patient=patient)
+
+        with assert_no_n_plus_one():
+            response = client.get(reverse("appointment-list"))
+        assert len(response.data["results"]) == 5
+
+
+class TestQueryInspectorMiddleware:
+    def test_logs_repeated_queries(
+        self, authenticated_patient_client, settings, caplog
+    ):
+        settings.QUERY_INSPECTOR_ENABLED = True
+        settings.QUERY_INSPECTOR_THRESHOLD = 0
+        client, _ = authenticated_patient_client()
+
+        with caplog.at_level(logging.WARNING, logger="api.middleware"):
+            client.get(reverse("appointment-list"))
+
+        assert "Repeated queries in GET /api/appointment/" in caplog.text
+
+    def test_disabled(self, authenticated_patient_client, settings, caplog):
+        settings.QUERY_INSPECTOR_ENABLED = False
+        settings.QUERY_INSPECTOR_THRESHOLD = 0
+        client, _ = authenticated_patient_client()
+
+        with caplog.at_level(logging.WARNING, logger="api.middleware"):
+            client.get(reverse("appointment-list"))
+
+        assert "Repeated queries" not in caplog.text
@@ -0,0 +1,95 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from api.metrics import request_db_queries, request_serializer_seconds
+from api.serializers import SpecialitySerializer
+from api.utils.profiling import profile_request
+
+
+pytestmark = pytest.mark.django_db
+
+
+def histogram_sample(metric, suffix, **labels):
+    """Read the _count or _sum sample of a labelled histogram"""
+    for family in metric.collect():
+        for sample in family.samples:
+            if sample.name.endswith(suffix) and sample.labels == labels:
+                return sample.value
+    return 0.0
+
+
+class TestRequestProfilingMiddleware:
+    def test_records_per_route_and_action(
+        self, authenticated_patient_client, appointment_factory
+    ):
+        client, patient = authenticated_patient_client()
+        appointment_factory(patient=patient)
+        labels = {"view": "appointment-list", "action": "list"}
+        count_before = histogram_sample(request_db_queries, "_count", **labels)
+        sum_before = histogram_sample(request_db_queries, "_sum", **labels)
+
+        response = client.get(reverse("appointment-list"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert histogram_sample(request_db_queries, "_count", **labels) == (
+            count_before + 1
+        )
+        assert histogram_sample(request_db_queries, "_sum", **labels) > sum_before
+        assert histogram_sample(request_serializer_seconds, "_count", **labels) == (
+            count_before + 1
+        )
+
+    def test_detail_action_label(
+        self, authenticated_patient_client, appointment_factory
+    ):
+        client, patient = authenticated_patient_client()
+        appointment = appointment_factory(patient=patient)
+        labels = {"view": "appointment-detail", "action": "retrieve"}
+        before = histogram_sample(request_db_queries, "_count", **labels)
+
+        client.get(reverse("appointment-detail", args=[appointment.id]))
+
+        assert histogram_sample(request_db_queries, "_count", **labels) == before + 1
+
+    def test_server_timing_header(self, authenticated_patient_client, settings):
+        client, _ = authenticated_patient_client()
+
+        response = client.get(reverse("appointment-list"))
+        assert "Server-Timing" not in response
+
+        settings.METRICS_SERVER_TIMING_HEADER = True
+        response = client.get(reverse("appointment-list"))
+        timing = response["Server-Timing"]
+        assert timing.startswith("db;dur=")
+        assert "serialize;dur=" in timing
+        assert "camelcase;dur=" in timing
+
+    def test_disabled_by_setting(self, authenticated_patient_client, settings):
+        settings.METRICS_REQUEST_PROFILING = False
+        settings.METRICS_SERVER_TIMING_HEADER = True
+        client, _ = authenticated_patient_client()
+        labels = {"view": "appointment-list", "action": "list"}
+        before = histogram_sample(request_db_queries, "_count", **labels)
+
+        response = client.get(reverse("appointment-list"))
+
+        assert "Server-Timing" not in response
+        assert histogram_sample(request_db_queries, "_count", **labels) == before
+
+
+class TestRequestProfile:
+    def test_times_serialization_and_case_conversion(self, speciality_factory):
+        specialities = [speciality_factory() for _ in range(3)]
+
+        with profile_request() as profile:
+            data = SpecialitySerializer(specialities, many=True).data
+
+        assert len(data) == 3
+        assert profile.serializer_time > 0
+        assert profile.case_conversion_time > 0
+
+    def test_no_profile_outside_requests(self, speciality_factory):
+        # Serializers keep working without an active profile
+        data = SpecialitySerializer(speciality_factory()).data
+        assert "name" in data
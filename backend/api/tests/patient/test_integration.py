@@ -1,6 +1,7 @@
 import pytest
 from datetime import timedelta, datetime, time
 from django.utils import timezone
+from django.core.management import call_command
 from django.urls import reverse
 from django.test import override_settings
 from rest_framework import status
@@ -50,6 +51,7 @@ class TestPatientRegistrationFlow:
         assert user.last_name == "Doe"
 
         # Verify verification email sent
+        call_command("send_queued_email", once=True)
         assert len(mailoutbox) == 1
         email = mailoutbox[0]
         assert email.to == ["new.patient@example.com"]
@@ -260,8 +262,8 @@ class TestPatientAppointmentFlow:
         assert response.status_code == status.HTTP_200_OK
 
         # Should only see own appointments
-        assert len(response.data) == 2
-        appointment_ids = [app["id"] for app in response.data]
+        assert len(response.data["results"]) == 2
+        appointment_ids = [app["id"] for app in response.data["results"]]
         assert app1.id in appointment_ids
         assert app2.id in appointment_ids
 
@@ -480,8 +482,8 @@ class TestPatientMedicalRecordFlow:
         assert response.status_code == status.HTTP_200_OK
 
         # Should only see own records
-        assert len(response.data) == 2
-        record_ids = [r["id"] for r in response.data]
+        assert len(response.data["results"]) == 2
+        record_ids = [r["id"] for r in response.data["results"]]
         assert record1.id in record_ids
         assert record2.id in record_ids
 
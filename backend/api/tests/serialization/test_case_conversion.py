@@ -0,0 +1,90 @@
+import pytest
+from rest_framework import serializers
+
+from api.mixin import CamelCaseMixin
+from api.serializers import AppointmentListSerializer
+from api.utils.case import (
+    KEY_CACHE_SIZE,
+    camelcase_key,
+    to_camelcase,
+    to_camelcase_data,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+def legacy_camelcase_data(data):
+    """Regex conversion of every key, as before the key maps"""
+    if isinstance(data, dict):
+        return {to_camelcase(k): legacy_camelcase_data(v) for k, v in data.items()}
+    if isinstance(data, list):
+        return [legacy_camelcase_data(datum) for datum in data]
+    return data
+
+
+class InnerSerializer(CamelCaseMixin, serializers.Serializer):
+    inner_value = serializers.IntegerField()
+
+
+class OuterSerializer(CamelCaseMixin, serializers.Serializer):
+    first_name = serializers.CharField()
+    inner_rows = InnerSerializer(many=True)
+    extra_data = serializers.SerializerMethodField()
+
+    def get_extra_data(self, obj):
+        return {"nested_key": [{"deep_key": 1}]}
+
+
+class TestCamelCaseMixin:
+    def test_matches_regex_conversion(self, appointment_factory):
+        appointments = [appointment_factory() for _ in range(3)]
+        serializer = AppointmentListSerializer(appointments, many=True)
+
+        expected = [
+            legacy_camelcase_data(
+                super(CamelCaseMixin, serializer.child).to_representation(obj)
+            )
+            for obj in appointments
+        ]
+
+        assert serializer.data == expected
+        assert "appointmentStartDatetimeUtc" in serializer.data[0]
+        assert "addressLine1" in serializer.data[0]["hospital"]
+
+    def test_converts_nested_and_dynamic_keys(self):
+        data = OuterSerializer(
+            {"first_name": "Ann", "inner_rows": [{"inner_value": 1}]}
+        ).data
+
+        assert data == {
+            "firstName": "Ann",
+            "innerRows": [{"innerValue": 1}],
+            "extraData": {"nestedKey": [{"deepKey": 1}]},
+        }
+
+    def test_nested_serializer_output_is_not_walked_again(self, monkeypatch):
+        walked = []
+
+        def spy(data, keys=None):
+            walked.append(data)
+            return to_camelcase_data(data, keys)
+
+        monkeypatch.setattr("api.mixin.to_camelcase_data", spy)
+
+        OuterSerializer({"first_name": "Ann", "inner_rows": [{"inner_value": 1}]}).data
+
+        # The inner serializer converts its own values, the outer one skips
+        # the inner_rows list
+        assert walked == [1, "Ann", {"nested_key": [{"deep_key": 1}]}]
+
+    def test_input_is_converted_to_snake_case(self):
+        serializer = OuterSerializer(
+            data={"firstName": "Ann", "innerRows": [{"innerValue": 2}]}
+        )
+
+        assert serializer.is_valid(), serializer.errors
+        assert serializer.validated_data["first_name"] == "Ann"
+        assert serializer.validated_data["inner_rows"][0]["inner_value"] == 2
+
+    def test_dynamic_key_memo_is_bounded(self):
+        assert camelcase_key.cache_info().maxsize == KEY_CACHE_SIZE
@@ -0,0 +1,69 @@
+import io
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from api.parsers import FastJSONParser
+from api.renderers import FastJSONRenderer
+
+PAYLOAD = {
+    "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+    "start": datetime(2026, 1, 5, 9, 30, tzinfo=timezone.utc),
+    "day": date(2026, 1, 5),
+    "fee": Decimal("12.50"),
+    "duration": timedelta(minutes=30),
+    "detail": _("Not found."),
+    "name": "Zo\u00eb\u2028\u2029",
+    "rows": [{"count": 1, "ratio": 0.5, "flag": True, "empty": None}],
+    7: "int key",
+}
+
+
+class TestFastJSONRenderer:
+    def test_matches_json_renderer(self):
+        assert FastJSONRenderer().render(PAYLOAD) == JSONRenderer().render(PAYLOAD)
+
+    def test_falls_back_when_disabled(self, settings, monkeypatch):
+        settings.FAST_JSON = False
+        monkeypatch.setattr("api.renderers.orjson.dumps", None)
+
+        assert FastJSONRenderer().render(PAYLOAD) == JSONRenderer().render(PAYLOAD)
+
+    def test_indent_uses_json_renderer(self):
+        rendered = FastJSONRenderer().render({"a": 1}, "application/json; indent=2", {})
+
+        assert rendered == b'{\n  "a": 1\n}'
+
+    def test_wide_integers_fall_back(self):
+        assert FastJSONRenderer().render({"n": 2**70}) == b'{"n":%d}' % 2**70
+
+    def test_none_renders_empty_body(self):
+        assert FastJSONRenderer().render(None) == b""
+
+
+class TestFastJSONParser:
+    def parse(self, body: bytes, encoding: str = "utf-8"):
+        return FastJSONParser().parse(io.BytesIO(body), None, {"encoding": encoding})
+
+    def test_parses_like_json_parser(self):
+        body = '{"name": "Zoë", "n": [1, 2.5, null, true]}'.encode()
+
+        assert self.parse(body) == JSONParser().parse(io.BytesIO(body))
+
+    def test_invalid_json_raises_parse_error(self):
+        with pytest.raises(ParseError, match="JSON parse error"):
+            self.parse(b'{"name": ')
+
+    def test_wide_integers_fall_back(self):
+        assert self.parse(b'{"n": %d}' % 2**70) == {"n": 2**70}
+
+    def test_other_charsets_use_json_parser(self):
+        assert self.parse('{"name": "Zoë"}'.encode("latin-1"), "latin-1") == {
+            "name": "Zoë"
+        }
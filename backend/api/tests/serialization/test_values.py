@@ -0,0 +1,50 @@
+import pytest
+from rest_framework.test import APIRequestFactory
+
+from api.models import Appointment, MedicalRecord, User
+from api.serializers import (
+    AppointmentListSerializer,
+    AppointmentListValuesSerializer,
+    MedicalRecordListSerializer,
+    MedicalRecordListValuesSerializer,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def context():
+    return {"request": APIRequestFactory().get("/")}
+
+
+class TestValuesSerializers:
+    def test_appointment_list_matches_model_serializer(
+        self, appointment_factory, context, django_assert_num_queries
+    ):
+        appointments = [appointment_factory() for _ in range(3)]
+        User.objects.filter(pk=appointments[0].healthcare_provider_id).update(
+            image="users_images/provider.png"
+        )
+        queryset = Appointment.objects.order_by("id")
+
+        expected = AppointmentListSerializer(queryset, many=True, context=context).data
+        with django_assert_num_queries(1):
+            data = AppointmentListValuesSerializer(queryset, context=context).data
+
+        assert data == expected
+        assert data[0]["providerImage"].startswith("http://testserver/")
+
+    def test_medical_record_list_matches_model_serializer(
+        self, medical_record_factory, context, django_assert_num_queries
+    ):
+        for _ in range(3):
+            medical_record_factory()
+        queryset = MedicalRecord.objects.order_by("id")
+
+        expected = MedicalRecordListSerializer(
+            queryset, many=True, context=context
+        ).data
+        with django_assert_num_queries(1):
+            data = MedicalRecordListValuesSerializer(queryset, context=context).data
+
+        assert data == expected
@@ -0,0 +1,136 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.exceptions import ValidationError
+
+from ...models import ProviderHospitalAssignment
+from ...serializers.hospital import CachedHospitalField
+from ...services.reference import ReferenceCache, reference_cache
+from ...services.speciality import SpecialityService
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def committed(django_capture_on_commit_callbacks):
+    """Run the block's on_commit callbacks, as if its writes were committed"""
+    return lambda: django_capture_on_commit_callbacks(execute=True)
+
+
+class TestReferenceCache:
+    def test_reads_are_cached(
+        self, committed, speciality_factory, django_assert_num_queries
+    ):
+        with committed():
+            speciality = speciality_factory(name="Cardiology")
+        reference_cache.snapshot()
+
+        with django_assert_num_queries(0):
+            assert reference_cache.speciality(speciality.id).name == "Cardiology"
+            assert [s.name for s in SpecialityService.get_all_specialities()] == [
+                "Cardiology"
+            ]
+
+    def test_views_read_the_cache(
+        self, committed, speciality_factory, authenticated_patient_client
+    ):
+        client, _ = authenticated_patient_client()
+        with committed():
+            speciality = speciality_factory(name="Cardiology")
+            speciality_factory(name="Anesthesiology", is_removed=True)
+        reference_cache.snapshot()
+
+        with CaptureQueriesContext(connection) as queries:
+            listed = client.get(reverse("speciality-list"))
+            retrieved = client.get(reverse("speciality-detail", args=[speciality.id]))
+
+        assert [s["name"] for s in listed.data] == ["Cardiology"]
+        assert retrieved.data["name"] == "Cardiology"
+        assert not [q for q in queries if "api_speciality" in q["sql"]]
+
+    def test_write_is_visible_before_commit(self, committed, speciality_factory):
+        with committed():
+            speciality = speciality_factory(name="Cardiology")
+        reference_cache.snapshot()
+
+        speciality.name = "Cardiac Surgery"
+        speciality.save()
+
+        assert reference_cache.speciality(speciality.id).name == "Cardiac Surgery"
+
+    def test_soft_delete_hides_speciality(self, committed, speciality_factory):
+        with committed():
+            speciality = speciality_factory()
+        assert SpecialityService.get_speciality_by_id(speciality.id) is not None
+
+        with committed():
+            SpecialityService.soft_delete_speciality(speciality)
+
+        assert SpecialityService.get_speciality_by_id(speciality.id) is None
+        assert SpecialityService.get_all_specialities() == []
+        assert SpecialityService.get_all_specialities(active_only=False)[0].is_removed
+
+    def test_other_processes_follow_the_shared_version(
+        self, committed, settings, hospital_factory, django_assert_num_queries
+    ):
+        settings.REFERENCE_CACHE_CHECK_SECONDS = 0
+        with committed():
+            hospital = hospital_factory(name="General")
+        other_worker = ReferenceCache()
+        assert other_worker.hospital(hospital.id).name == "General"
+
+        with committed():
+            hospital.name = "St. Mary"
+            hospital.save()
+        # This process stored the new snapshot, the other one only reads it
+        reference_cache.snapshot()
+
+        with django_assert_num_queries(0):
+            assert other_worker.hospital(hospital.id).name == "St. Mary"
+
+    def test_affiliation_follows_assignments(self, committed, provider_factory):
+        with committed():
+            provider = provider_factory()
+        hospital_id = provider.primary_hospital_id
+        assert reference_cache.is_affiliated(provider.pk, hospital_id)
+
+        with committed():
+            ProviderHospitalAssignment.objects.get(
+                healthcare_provider=provider, hospital_id=hospital_id
+            ).delete()
+
+        assert not reference_cache.is_affiliated(provider.pk, hospital_id)
+
+    def test_works_without_shared_cache(self, committed, monkeypatch, hospital_factory):
+        def unavailable(*args, **kwargs):
+            raise ConnectionError("redis down")
+
+        for method in ("get", "add", "set", "incr"):
+            monkeypatch.setattr(cache, method, unavailable)
+
+        with committed():
+            hospital = hospital_factory(name="General")
+
+        assert reference_cache.hospital(hospital.id).name == "General"
+
+
+class TestCachedHospitalField:
+    def test_resolves_hospital(self, hospital_factory):
+        hospital = hospital_factory()
+        assert CachedHospitalField().to_internal_value(str(hospital.id)) == hospital
+
+    def test_unknown_hospital(self):
+        with pytest.raises(ValidationError, match="does not exist"):
+            CachedHospitalField().to_internal_value(999999)
+
+    def test_removed_hospital(self, hospital_factory):
+        hospital = hospital_factory(is_removed=True)
+        assert CachedHospitalField().to_internal_value(hospital.id) == hospital
+        with pytest.raises(ValidationError, match="does not exist"):
+            CachedHospitalField(active_only=True).to_internal_value(hospital.id)
+
+    def test_incorrect_type(self):
+        with pytest.raises(ValidationError, match="Incorrect type"):
+            CachedHospitalField().to_internal_value(True)
@@ -1,4 +1,5 @@
 import pytest
+from django.core.management import call_command
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -34,6 +35,7 @@ class TestUserRegistrationFlow:
         assert not hasattr(user, "provider")
 
         # Verify email sent
+        call_command("send_queued_email", once=True)
         assert len(mailoutbox) == 1
 
 
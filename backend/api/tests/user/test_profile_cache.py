@@ -0,0 +1,87 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from api.models import Patient
+from api.services import user_profile
+from api.services.user_profile import profile_queryset, render_profile
+
+pytestmark = pytest.mark.django_db
+
+
+class TestProfilePayload:
+    def test_rendered_with_one_query(
+        self, admin_staff_factory, django_assert_num_queries
+    ):
+        admin = admin_staff_factory()
+
+        with django_assert_num_queries(1):
+            profile = render_profile(admin.user_id)
+
+        assert profile["userRole"] == "admin_staff"
+        assert profile["hasAdminStaffProfile"]
+        assert not profile["hasPatientProfile"]
+
+    def test_annotated_flags(self, provider_factory):
+        provider = provider_factory()
+        Patient.objects.create(user=provider.user)
+
+        user = profile_queryset().get(pk=provider.user_id)
+
+        assert user.has_patient_profile and user.has_provider_profile
+        assert not user.has_system_admin_profile
+
+
+class TestMeEndpoint:
+    def test_cached_between_requests(
+        self, authenticated_patient_client, django_assert_num_queries
+    ):
+        client, patient = authenticated_patient_client()
+        url = reverse("users-me")
+        first = client.get(url)
+
+        with django_assert_num_queries(0):
+            second = client.get(url)
+
+        assert second.status_code == status.HTTP_200_OK
+        assert second.data == first.data
+        assert second.data["userRole"] == "patient"
+
+    def test_update_invalidates(self, authenticated_user_client):
+        client, user = authenticated_user_client()
+        url = reverse("users-me")
+        client.get(url)
+
+        client.patch(url, {"first_name": "Updated"}, format="json")
+
+        assert client.get(url).data["firstName"] == "Updated"
+
+    def test_role_change_invalidates(self, authenticated_user_client):
+        client, user = authenticated_user_client()
+        url = reverse("users-me")
+        assert client.get(url).data["userRole"] == "unassigned"
+
+        Patient.objects.create(user=user)
+
+        response = client.get(url)
+        assert response.data["userRole"] == "patient"
+        assert response.data["hasPatientProfile"]
+
+    def test_login_uses_cached_payload(self, patient_factory, monkeypatch):
+        patient = patient_factory(user__is_active=True)
+        client = APIClient()
+        credentials = {"email": patient.user.email, "password": "complex123!"}
+        first = client.post(reverse("login"), credentials, format="json")
+
+        rendered = []
+        monkeypatch.setattr(
+            user_profile,
+            "render_profile",
+            lambda user_id: rendered.append(user_id) or render_profile(user_id),
+        )
+        second = client.post(reverse("login"), credentials, format="json")
+
+        assert rendered == []
+        assert first.data["user"] == second.data["user"]
+        assert second.data["user"]["userRole"] == "patient"
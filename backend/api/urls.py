@@ -37,6 +37,7 @@ from .views import (
     SlotViewSet,
     MedicalRecordViewSet,
     health_check,
+    metrics_view,
     trigger_slot_management,
 )
 
@@ -64,7 +65,7 @@ urlpatterns: List[Union[URLPattern, URLResolver]] = [
     path("api/", include(router.urls)),
     path("api/health/", health_check, name="health_check"),
     path("api/trigger-slots/", trigger_slot_management, name="trigger_slots"),
-    path("", include("django_prometheus.urls")),
+    path("metrics", metrics_view, name="prometheus-django-metrics"),
 ]
 
 urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
@@ -0,0 +1,268 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional, TypeVar, cast
+
+from django.core.cache import caches
+
+from ..metrics import cache_load_seconds, cache_requests_total, cache_shared_seconds
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+MISSING = object()
+
+
+class LocalLRU:
+    """
+    Bounded, thread-safe in-process cache with per-entry expiry.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISSING
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return MISSING
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class TieredCache:
+    """
+    Cache facade with a per-process LRU in front of the shared Django cache.
+
+    Keys live in a namespace whose version is stored in the shared cache.
+    ``invalidate`` bumps the version, which every process picks up within
+    ``check_interval`` seconds, so all of their entries are dropped at once.
+    Deleting a single key only clears other processes' local copies when
+    their ``local_ttl`` runs out.
+
+    ``get_or_set`` coalesces concurrent misses: threads of one process share
+    a lock per key, and across processes a lock key in the shared cache lets
+    a single worker run the loader while the others wait for its result.
+
+    Errors from the shared cache are logged and treated as misses. None is
+    not cached.
+    """
+
+    # Per-key locks are striped over a fixed number of locks
+    LOCK_STRIPES = 64
+
+    def __init__(
+        self,
+        namespace: str,
+        timeout: int = 300,
+        local_max_entries: int = 1024,
+        local_ttl: float = 30,
+        check_interval: float = 5,
+        lock_timeout: float = 10,
+        poll_interval: float = 0.05,
+        alias: str = "default",
+    ) -> None:
+        self.namespace = namespace
+        self.timeout = timeout
+        self.local_ttl = local_ttl
+        self.check_interval = check_interval
+        self.lock_timeout = lock_timeout
+        self.poll_interval = poll_interval
+        self.alias = alias
+        self.local = LocalLRU(local_max_entries)
+        self._version: Optional[int] = None
+        self._checked_at = 0.0
+        self._version_lock = threading.Lock()
+        self._key_locks = [threading.Lock() for _ in range(self.LOCK_STRIPES)]
+
+    @property
+    def shared(self):
+        return caches[self.alias]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        full_key = self.make_key(key)
+        value = self.local.get(full_key)
+        if value is not MISSING:
+            self._count("local", "hit")
+            return value
+        self._count("local", "miss")
+
+        value = self._shared_call("get", full_key, MISSING)
+        if value is None or value is MISSING:
+            self._count("shared", "miss")
+            return default
+        self._count("shared", "hit")
+        self.local.set(full_key, value, self._local_ttl(self.timeout))
+        return value
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> None:
+        if value is None:
+            # Reads can't tell a cached None from a miss, so drop the key
+            self.delete(key)
+            return
+        timeout = self.timeout if timeout is None else timeout
+        full_key = self.make_key(key)
+        self.local.set(full_key, value, self._local_ttl(timeout))
+        self._shared_call("set", full_key, value, timeout)
+
+    def delete(self, key: str) -> None:
+        full_key = self.make_key(key)
+        self.local.delete(full_key)
+        self._shared_call("delete", full_key)
+
+    def get_or_set(
+        self, key: str, loader: Callable[[], T], timeout: Optional[int] = None
+    ) -> T:
+        """
+        Return the cached value for ``key``, calling ``loader`` on a miss.
+
+        Only one caller loads a missing key at a time, the others receive
+        its result.
+        """
+        value = self.get(key, MISSING)
+        if value is not MISSING:
+            return cast(T, value)
+
+        with self._key_locks[hash(key) % self.LOCK_STRIPES]:
+            # Another thread may have loaded it while we waited
+            value = self.get(key, MISSING)
+            if value is not MISSING:
+                return cast(T, value)
+            return self._load_once(key, loader, timeout)
+
+    def invalidate(self) -> None:
+        """Drop every key of the namespace, in all processes"""
+        version_key = self._version_key()
+        try:
+            version = self.shared.incr(version_key)
+        except ValueError:
+            version = time.time_ns()
+            self._shared_call("set", version_key, version, None)
+        except Exception as exc:
+            logger.warning("Failed to invalidate cache %s: %s", self.namespace, exc)
+            version = None
+
+        self.local.clear()
+        with self._version_lock:
+            self._version = version
+            self._checked_at = time.monotonic()
+
+    def clear_local(self) -> None:
+        """Forget the process-local tier and namespace version"""
+        self.local.clear()
+        with self._version_lock:
+            self._version = None
+            self._checked_at = 0.0
+
+    def make_key(self, key: str) -> str:
+        return f"{self.namespace}:{self._current_version()}:{key}"
+
+    def _load_once(
+        self, key: str, loader: Callable[[], T], timeout: Optional[int]
+    ) -> T:
+        lock_key = f"{self.make_key(key)}:lock"
+        acquired = self._shared_call("add", lock_key, 1, self.lock_timeout)
+        if acquired is False:
+            value = self._wait_for(key)
+            if value is not MISSING:
+                return cast(T, value)
+
+        try:
+            return self._load(key, loader, timeout)
+        finally:
+            if acquired:
+                self._shared_call("delete", lock_key)
+
+    def _wait_for(self, key: str) -> Any:
+        """Wait for the worker holding the load lock to store the value"""
+        full_key = self.make_key(key)
+        deadline = time.monotonic() + self.lock_timeout
+        while time.monotonic() < deadline:
+            time.sleep(self.poll_interval)
+            value = self._shared_call("get", full_key, MISSING)
+            if value is not MISSING and value is not None:
+                self._count("shared", "hit")
+                self.local.set(full_key, value, self._local_ttl(self.timeout))
+                return value
+        return MISSING
+
+    def _load(self, key: str, loader: Callable[[], T], timeout: Optional[int]) -> T:
+        started = time.perf_counter()
+        value = loader()
+        cache_load_seconds.labels(cache=self.namespace).observe(
+            time.perf_counter() - started
+        )
+        self.set(key, value, timeout)
+        return value
+
+    def _current_version(self) -> Optional[int]:
+        if (
+            self._checked_at
+            and time.monotonic() - self._checked_at < self.check_interval
+        ):
+            return self._version
+
+        with self._version_lock:
+            version_key = self._version_key()
+            version: Optional[int] = self._shared_call("get", version_key, None)
+            if version is None:
+                self._shared_call("add", version_key, time.time_ns(), None)
+                version = self._shared_call("get", version_key, None)
+            if version != self._version:
+                self.local.clear()
+            self._version = version
+            self._checked_at = time.monotonic()
+            return version
+
+    def _version_key(self) -> str:
+        return f"{self.namespace}:version"
+
+    def _local_ttl(self, timeout: Optional[int]) -> float:
+        if timeout is None:
+            return self.local_ttl
+        return min(self.local_ttl, timeout)
+
+    def _shared_call(self, operation: str, *args: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            return getattr(self.shared, operation)(*args)
+        except Exception as exc:
+            logger.warning(
+                "Shared cache %s failed for %s: %s", operation, self.namespace, exc
+            )
+            return None
+        finally:
+            cache_shared_seconds.labels(
+                cache=self.namespace, operation=operation
+            ).observe(time.perf_counter() - started)
+
+    def _count(self, tier: str, result: str) -> None:
+        cache_requests_total.labels(
+            cache=self.namespace, tier=tier, result=result
+        ).inc()
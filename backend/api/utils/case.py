@@ -1,9 +1,14 @@
 import re
-from typing import Any, List, Union
+from functools import lru_cache
+from typing import Any, List, Mapping, Optional, Union
 
 CAMEL_REGEX = re.compile("(?<=.)_(\\w)")
 SNAKE_REGEX = re.compile("(?<=[a-z])([A-Z])")
 
+# Keys outside of the declared serializer fields (JSON fields, method
+# fields, request bodies) are memoized up to this many distinct keys
+KEY_CACHE_SIZE = 2048
+
 
 def match_upper(match: Any) -> Any:
     return match.group(1).upper()
@@ -21,21 +26,44 @@ def to_snake_case(text: Any) -> Any:
     return SNAKE_REGEX.sub(match_snake, text)
 
 
+camelcase_key = lru_cache(maxsize=KEY_CACHE_SIZE)(to_camelcase)
+snake_case_key = lru_cache(maxsize=KEY_CACHE_SIZE)(to_snake_case)
+
+
 JsonValue = Union[None, str, int, float, bool, List[Any], dict[str, Any]]
 
 
-def to_camelcase_data(data: JsonValue) -> JsonValue:
+def to_camelcase_data(
+    data: JsonValue, keys: Optional[Mapping[str, str]] = None
+) -> JsonValue:
+    """
+    Convert the keys of ``data`` to camelCase, recursively.
+
+    ``keys`` maps known top level keys to their converted form, any other key
+    goes through the memoized ``camelcase_key``.
+    """
     if isinstance(data, dict):
-        return {to_camelcase(k): to_camelcase_data(v) for k, v in data.items()}
+        keys = keys or {}
+        return {
+            keys.get(k) or camelcase_key(k): to_camelcase_data(v)
+            for k, v in data.items()
+        }
     elif isinstance(data, list):
         return [to_camelcase_data(datum) for datum in data]
     else:
         return data
 
 
-def to_snake_case_data(data: JsonValue) -> JsonValue:
+def to_snake_case_data(
+    data: JsonValue, keys: Optional[Mapping[str, str]] = None
+) -> JsonValue:
+    """Convert the keys of ``data`` to snake_case, see ``to_camelcase_data``"""
     if isinstance(data, dict):
-        return {to_snake_case(k): to_snake_case_data(v) for k, v in data.items()}
+        keys = keys or {}
+        return {
+            keys.get(k) or snake_case_key(k): to_snake_case_data(v)
+            for k, v in data.items()
+        }
     elif isinstance(data, list):
         return [to_snake_case_data(datum) for datum in data]
     else:
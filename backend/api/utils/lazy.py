@@ -0,0 +1,85 @@
+from typing import Any, Callable, Optional
+
+from django.db import models
+from django.utils.functional import LazyObject, empty
+
+
+class LazyInstance(LazyObject):
+    """
+    Stand-in for a model instance of which only a few attributes are known,
+    e.g. from token claims.
+
+    Known attributes, the primary key and ``_meta`` are answered without a
+    query. Touching anything else loads the instance once with ``loader``
+    and proxies to it. The stand-in passes ``isinstance`` checks for the
+    model and can be used in ORM lookups and equality checks by primary key.
+    """
+
+    def __init__(
+        self,
+        model: type[models.Model],
+        pk: Any,
+        known: Optional[dict[str, Any]] = None,
+        loader: Optional[Callable[[], models.Model]] = None,
+    ) -> None:
+        attrs = {
+            "pk": pk,
+            model._meta.pk.attname: pk,
+            "_meta": model._meta,
+            "_is_pk_set": lambda: pk is not None,
+        }
+        attrs.update(known or {})
+        self.__dict__["_model"] = model
+        self.__dict__["_known"] = attrs
+        self.__dict__["_loader"] = loader or (lambda: model._default_manager.get(pk=pk))
+        super().__init__()
+
+    _model: type[models.Model]
+
+    # Attributes model instances have that their class does not
+    _instance_attrs = frozenset({"_state"})
+
+    def _setup(self) -> None:
+        self._wrapped = self._loader()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._wrapped is not empty
+
+    def __getattr__(self, name: str) -> Any:
+        known = self.__dict__["_known"]
+        if name in known:
+            return known[name]
+        if self._wrapped is empty:
+            # Answer hasattr() probes, e.g. by the ORM, without loading
+            if name not in self._instance_attrs and not hasattr(self._model, name):
+                raise AttributeError(name)
+            self._setup()
+        return getattr(self._wrapped, name)
+
+    def set_known(self, name: str, value: Any) -> None:
+        self._known[name] = value
+
+    @property  # type: ignore[misc]
+    def __class__(self) -> type[models.Model]:  # type: ignore[override]
+        return self._model
+
+    def __bool__(self) -> bool:
+        return True
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, models.Model):
+            return NotImplemented
+        if self._meta.concrete_model != other._meta.concrete_model:
+            return False
+        return bool(self.pk == other.pk)
+
+    def __ne__(self, other: Any) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __hash__(self) -> int:
+        return hash(self.pk)
+
+    def __repr__(self) -> str:
+        return f"<LazyInstance {self._model.__name__}: {self.pk}>"
@@ -0,0 +1,101 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Optional
+
+_current_profile: ContextVar[Optional["RequestProfile"]] = ContextVar(
+    "request_profile", default=None
+)
+
+
+@dataclass
+class RequestProfile:
+    """
+    Where the time of a single request went.
+
+    Durations are in seconds. DB time also includes queries triggered lazily
+    while serializing, so the parts may overlap.
+    """
+
+    queries: int = 0
+    db_time: float = 0.0
+    serializer_time: float = 0.0
+    case_conversion_time: float = 0.0
+    _serializer_depth: int = 0
+
+    def record_query(
+        self,
+        execute: Callable[..., Any],
+        sql: str,
+        params: Any,
+        many: bool,
+        context: dict[str, Any],
+    ) -> Any:
+        """Database execute wrapper counting queries and their duration"""
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.db_time += time.perf_counter() - started
+
+    @contextmanager
+    def serializing(self) -> Iterator[None]:
+        """
+        Time a serializer's to_representation.
+
+        Nested serializers run inside their parent, so only the outermost one
+        is timed. Case conversion done meanwhile is reported on its own.
+        """
+        self._serializer_depth += 1
+        if self._serializer_depth > 1:
+            try:
+                yield
+            finally:
+                self._serializer_depth -= 1
+            return
+
+        started = time.perf_counter()
+        conversion_before = self.case_conversion_time
+        try:
+            yield
+        finally:
+            self._serializer_depth -= 1
+            elapsed = time.perf_counter() - started
+            self.serializer_time += elapsed - (
+                self.case_conversion_time - conversion_before
+            )
+
+    @contextmanager
+    def converting_case(self) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.case_conversion_time += time.perf_counter() - started
+
+    def server_timing(self) -> str:
+        """Value for the Server-Timing response header"""
+        return ", ".join(
+            [
+                f'db;dur={self.db_time * 1000:.1f};desc="{self.queries} queries"',
+                f"serialize;dur={self.serializer_time * 1000:.1f}",
+                f"camelcase;dur={self.case_conversion_time * 1000:.1f}",
+            ]
+        )
+
+
+def current_profile() -> Optional[RequestProfile]:
+    """Profile of the request being handled, if profiling is enabled"""
+    return _current_profile.get()
+
+
+@contextmanager
+def profile_request() -> Iterator[RequestProfile]:
+    profile = RequestProfile()
+    token = _current_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _current_profile.reset(token)
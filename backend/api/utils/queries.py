@@ -0,0 +1,129 @@
+import logging
+import re
+import time
+import traceback
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Optional
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+PLACEHOLDER = re.compile(r"%s")
+IN_LIST = re.compile(r"\bIN \([^()]*\)", re.IGNORECASE)
+WHITESPACE = re.compile(r"\s+")
+
+# Frames shown for each flagged query
+STACK_DEPTH = 8
+
+
+def fingerprint(sql: str) -> str:
+    """
+    Shape of a SQL statement with its literal values removed.
+
+    Queries that only differ in their parameters, like the same lookup run for
+    every row of a list, share a fingerprint.
+    """
+    sql = STRING_LITERAL.sub("?", sql)
+    sql = NUMBER.sub("?", sql)
+    sql = PLACEHOLDER.sub("?", sql)
+    sql = IN_LIST.sub("IN (...)", sql)
+    return WHITESPACE.sub(" ", sql).strip()
+
+
+def project_stack() -> list[str]:
+    """Innermost frames of the current stack that belong to this project"""
+    base_dir = str(settings.BASE_DIR)
+    frames = [
+        frame
+        for frame in traceback.extract_stack()
+        if frame.filename.startswith(base_dir)
+        and "site-packages" not in frame.filename
+        and frame.filename != __file__
+    ]
+    return traceback.format_list(frames[-STACK_DEPTH:])
+
+
+@dataclass
+class RepeatedQuery:
+    fingerprint: str
+    count: int
+    stack: list[str]
+
+    def __str__(self) -> str:
+        return f"{self.count}x {self.fingerprint}\n{''.join(self.stack)}"
+
+
+class QueryInspector:
+    """
+    Database execute wrapper that looks for N+1 patterns and slow queries.
+
+    Every query is fingerprinted, and shapes executed more than ``threshold``
+    times are reported with the stack that first issued them. Queries slower
+    than ``slow_ms`` are logged as they happen.
+    """
+
+    def __init__(
+        self, threshold: Optional[int] = None, slow_ms: Optional[float] = None
+    ) -> None:
+        self.threshold = (
+            threshold if threshold is not None else settings.QUERY_INSPECTOR_THRESHOLD
+        )
+        self.slow_ms = (
+            slow_ms if slow_ms is not None else settings.QUERY_INSPECTOR_SLOW_MS
+        )
+        self.counts: Counter[str] = Counter()
+        self.stacks: dict[str, list[str]] = {}
+
+    def __call__(
+        self,
+        execute: Callable[..., Any],
+        sql: str,
+        params: Any,
+        many: bool,
+        context: dict[str, Any],
+    ) -> Any:
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            shape = fingerprint(sql)
+            self.counts[shape] += 1
+            if shape not in self.stacks:
+                self.stacks[shape] = project_stack()
+            if self.slow_ms and elapsed_ms > self.slow_ms:
+                logger.warning(
+                    "Slow query (%.1fms): %s\n%s",
+                    elapsed_ms,
+                    sql,
+                    "".join(project_stack()),
+                )
+
+    @property
+    def repeated(self) -> list[RepeatedQuery]:
+        return [
+            RepeatedQuery(shape, count, self.stacks[shape])
+            for shape, count in self.counts.most_common()
+            if count > self.threshold
+        ]
+
+    def report(self) -> str:
+        return "\n".join(str(query) for query in self.repeated)
+
+
+@contextmanager
+def inspect_queries(
+    threshold: Optional[int] = None, slow_ms: Optional[float] = None
+) -> Iterator[QueryInspector]:
+    """Run a block with a QueryInspector installed on every connection"""
+    inspector = QueryInspector(threshold=threshold, slow_ms=slow_ms)
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(inspector))
+        yield inspector
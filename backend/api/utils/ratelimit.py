@@ -0,0 +1,177 @@
+import hashlib
+import logging
+import time
+import uuid
+from typing import Any, Optional
+
+from django.core.cache import caches
+
+logger = logging.getLogger(__name__)
+
+
+class SlidingWindowLimiter:
+    """
+    Counts events per key over the last ``window`` seconds.
+
+    With a Redis cache each key is a sorted set of events scored by time, so
+    the count is exact at any instant instead of resetting at fixed window
+    boundaries, and ``acquire`` checks and records in one transaction. Other
+    cache backends keep the events in a list, which is not atomic across
+    processes but good enough for development and tests.
+
+    Cache errors are logged and never limit: throttling must not lock every
+    user out when Redis is down.
+    """
+
+    def __init__(
+        self, name: str, limit: int, window: int, alias: str = "default"
+    ) -> None:
+        self.name = name
+        self.limit = limit
+        self.window = window
+        self.alias = alias
+
+    def is_limited(self, identifier: str) -> bool:
+        return self.count(identifier) >= self.limit
+
+    def count(self, identifier: str) -> int:
+        """Events recorded for ``identifier`` within the window"""
+        return int(self._call("count", identifier, 0))
+
+    def hit(self, identifier: str) -> int:
+        """Record an event, returning the count including it"""
+        return int(self._call("hit", identifier, 0, _event_id()))
+
+    def acquire(self, identifier: str) -> Optional[str]:
+        """
+        Record an event unless the limit is already reached.
+
+        Returns the id of the recorded event, for ``release``, or None when
+        limited. Concurrent callers cannot all pass a check made before the
+        event is recorded.
+        """
+        event = _event_id()
+        if self._call("acquire", identifier, True, event):
+            return event
+        return None
+
+    def release(self, identifier: str, event: str) -> None:
+        """Forget an event recorded by ``acquire``"""
+        self._call("release", identifier, None, event)
+
+    def retry_after(self, identifier: str) -> Optional[int]:
+        """Seconds until the oldest event in the window expires"""
+        seconds: Optional[int] = self._call("retry_after", identifier, None)
+        return seconds
+
+    def reset(self, identifier: str) -> None:
+        self._call("reset", identifier, None)
+
+    def key(self, identifier: str) -> str:
+        # Identifiers are user input, keep keys short and safe
+        digest = hashlib.sha256(identifier.encode()).hexdigest()[:32]
+        return f"ratelimit:{self.name}:{digest}"
+
+    def _call(self, operation: str, identifier: str, default: Any, *args: Any) -> Any:
+        key = self.key(identifier)
+        try:
+            redis = self._redis()
+            if redis is not None:
+                return getattr(self, f"_redis_{operation}")(redis, key, *args)
+            return getattr(self, f"_cache_{operation}")(key, *args)
+        except Exception as exc:
+            logger.warning("Rate limiter %s %s failed: %s", self.name, operation, exc)
+            return default
+
+    def _redis(self) -> Any:
+        try:
+            from django_redis import get_redis_connection
+        except ImportError:
+            return None
+        try:
+            return get_redis_connection(self.alias)
+        except NotImplementedError:
+            # Not a django-redis cache
+            return None
+
+    # Redis sorted set of event ids, scored by event time in milliseconds.
+    # Pipelines run as MULTI/EXEC transactions.
+
+    def _redis_count(self, redis: Any, key: str) -> int:
+        now = _now_ms()
+        pipe = redis.pipeline()
+        pipe.zremrangebyscore(key, 0, now - self.window * 1000)
+        pipe.zcard(key)
+        return int(pipe.execute()[1])
+
+    def _redis_hit(self, redis: Any, key: str, event: str) -> int:
+        now = _now_ms()
+        pipe = redis.pipeline()
+        pipe.zremrangebyscore(key, 0, now - self.window * 1000)
+        pipe.zadd(key, {event: now})
+        pipe.zcard(key)
+        pipe.pexpire(key, self.window * 1000)
+        return int(pipe.execute()[2])
+
+    def _redis_acquire(self, redis: Any, key: str, event: str) -> bool:
+        # Record first and count in the same transaction, then take the
+        # event back if it went over the limit
+        if self._redis_hit(redis, key, event) <= self.limit:
+            return True
+        redis.zrem(key, event)
+        return False
+
+    def _redis_release(self, redis: Any, key: str, event: str) -> None:
+        redis.zrem(key, event)
+
+    def _redis_retry_after(self, redis: Any, key: str) -> Optional[int]:
+        oldest = redis.zrange(key, 0, 0, withscores=True)
+        if not oldest:
+            return None
+        return _seconds_left(oldest[0][1], self.window)
+
+    def _redis_reset(self, redis: Any, key: str) -> None:
+        redis.delete(key)
+
+    # Django cache fallback, a list of (time in milliseconds, event id)
+
+    def _events(self, key: str) -> list[tuple[int, str]]:
+        cutoff = _now_ms() - self.window * 1000
+        return [e for e in caches[self.alias].get(key, []) if e[0] > cutoff]
+
+    def _cache_count(self, key: str) -> int:
+        return len(self._events(key))
+
+    def _cache_hit(self, key: str, event: str) -> int:
+        events = self._events(key) + [(_now_ms(), event)]
+        caches[self.alias].set(key, events, self.window)
+        return len(events)
+
+    def _cache_acquire(self, key: str, event: str) -> bool:
+        if self._cache_count(key) >= self.limit:
+            return False
+        self._cache_hit(key, event)
+        return True
+
+    def _cache_release(self, key: str, event: str) -> None:
+        events = [e for e in self._events(key) if e[1] != event]
+        caches[self.alias].set(key, events, self.window)
+
+    def _cache_retry_after(self, key: str) -> Optional[int]:
+        events = self._events(key)
+        return _seconds_left(events[0][0], self.window) if events else None
+
+    def _cache_reset(self, key: str) -> None:
+        caches[self.alias].delete(key)
+
+
+def _event_id() -> str:
+    return uuid.uuid4().hex
+
+
+def _now_ms() -> int:
+    return time.time_ns() // 1_000_000
+
+
+def _seconds_left(oldest_ms: float, window: int) -> int:
+    return max(1, int((oldest_ms + window * 1000 - _now_ms()) // 1000) + 1)
@@ -11,6 +11,7 @@ from .speciality import SpecialityViewSet
 from .appointment import AppointmentViewSet, SlotViewSet
 from .medical_record import MedicalRecordViewSet
 from .health import health_check
+from .metrics import metrics_view
 from .slot import trigger_slot_management
 
 __all__ = [
@@ -26,5 +27,6 @@ __all__ = [
     "SlotViewSet",
     "MedicalRecordViewSet",
     "health_check",
+    "metrics_view",
     "trigger_slot_management",
 ]
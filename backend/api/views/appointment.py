@@ -12,24 +12,15 @@ from rest_framework.exceptions import PermissionDenied
 from ..models import Appointment, Slot, HealthcareProvider
 from ..serializers import (
     AppointmentListSerializer,
+    AppointmentListValuesSerializer,
     AppointmentDetailSerializer,
     AppointmentCreateSerializer,
     SlotSerializer,
 )
+from ..pagination import AppointmentPagination
 from ..services.appointment import generate_daily_slots
-from ..metrics import (
-    appointments_created_total,
-    appointments_confirmed_total,
-    appointment_duration_minutes,
-    appointment_lead_time_hours,
-    provider_appointments_total,
-    appointments_cancelled_total,
-    appointments_completed_total,
-    appointments_rescheduled_total,
-    hospital_appointments_total,
-    revenue_generated,
-    cancellation_lead_time_hours,
-)
+from ..services.events import BOOKING_CREATED, record_booking_event
+from ..roles import get_roles
 
 
 class AppointmentViewSet(viewsets.ModelViewSet):
@@ -38,8 +29,8 @@ class AppointmentViewSet(viewsets.ModelViewSet):
     )
     filterset_fields = ["status", "patient", "healthcare_provider"]
     search_fields = ["reason", "patient__user__first_name", "patient__user__last_name"]
-    ordering_fields = ["appointment_start_datetime_utc", "created_at"]
-    ordering = ["-appointment_start_datetime_utc"]
+    # Newest first, ordered on (start, id) by the paginator
+    pagination_class = AppointmentPagination
 
     def get_serializer_class(self):
         if self.action == "list":
@@ -50,24 +41,33 @@ class AppointmentViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Users can only see their own appointments"""
-        user = self.request.user
-        if hasattr(user, "patient"):
-            return self.queryset.filter(patient=user.patient)
-        if hasattr(user, "provider"):
-            return self.queryset.filter(healthcare_provider=user.provider)
+        roles = get_roles(self.request.user)
+        if roles.is_patient:
+            return self.queryset.filter(patient=roles.patient)
+        if roles.is_provider:
+            return self.queryset.filter(healthcare_provider=roles.provider)
         # staff / admin see everything
         return self.queryset.all()
 
+    def list(self, request, *args, **kwargs):
+        # Rendered from values(), see AppointmentListValuesSerializer
+        queryset = self.filter_queryset(self.get_queryset())
+        serializer = AppointmentListValuesSerializer(
+            queryset, context=self.get_serializer_context()
+        )
+        page = self.paginate_queryset(serializer.rows())
+        return self.get_paginated_response(serializer.render(page))
+
     def get_permissions(self):
         return [permissions.IsAuthenticated()]
 
     def perform_create(self, serializer):
-        user = self.request.user
+        roles = get_roles(self.request.user)
 
         with transaction.atomic():
-            if hasattr(user, "patient"):
-                appointment = serializer.save(patient=user.patient)
-            elif hasattr(user, "provider"):
+            if roles.is_patient:
+                appointment = serializer.save(patient=roles.patient)
+            elif roles.is_provider:
                 if not serializer.validated_data.get("patient"):
                     raise serializers.ValidationError(
                         {"patient": "Required when booking appointment for patient."}
@@ -96,41 +96,12 @@ class AppointmentViewSet(viewsets.ModelViewSet):
                     {"detail": "No available slot for the requested time."}
                 )
 
-        slot.appointment = appointment
-        slot.status = Slot.Status.BOOKED
-        slot.save(update_fields=["appointment", "status"])
-
-        # Track appointment creation metrics
-        appointments_created_total.labels(
-            status=appointment.status,
-            speciality_id=str(appointment.healthcare_provider.speciality.id),
-            hospital_id=str(appointment.location.id),
-        ).inc()
-
-        duration_minutes = (
-            appointment.appointment_end_datetime_utc
-            - appointment.appointment_start_datetime_utc
-        ).total_seconds() / 60
-        appointment_duration_minutes.labels(
-            speciality_name=appointment.healthcare_provider.speciality.name
-        ).observe(duration_minutes)
-
-        lead_time = (
-            appointment.appointment_start_datetime_utc - appointment.created_at
-        ).total_seconds() / 3600
-        appointment_lead_time_hours.labels(status=appointment.status).observe(lead_time)
-
-        provider_appointments_total.labels(
-            provider_id=str(appointment.healthcare_provider.user.id),
-            speciality_name=appointment.healthcare_provider.speciality.name,
-            hospital_id=str(appointment.location.id),
-        ).inc()
-
-        hospital_appointments_total.labels(
-            hospital_id=str(appointment.location.id),
-            city=appointment.location.city,
-            state=appointment.location.state,
-        ).inc()
+            slot.appointment = appointment
+            slot.status = Slot.Status.BOOKED
+            slot.save(update_fields=["appointment", "status"])
+
+            # Metrics are emitted only once the booking has committed
+            record_booking_event(BOOKING_CREATED, appointment)
 
         return appointment
 
@@ -267,54 +238,25 @@ class AppointmentViewSet(viewsets.ModelViewSet):
 
             appointment.save(update_fields=update_fields)
 
-        user = request.user
-        cancelled_by = None
-
-        if hasattr(user, "patient") and user.patient == appointment.patient:
-            cancelled_by = "patient"
-        elif (
-            hasattr(user, "provider")
-            and user.provider == appointment.healthcare_provider
-        ):
-            cancelled_by = "provider"
-        elif user.is_staff:
-            cancelled_by = "staff"
-        else:
-            cancelled_by = "unknown"
-
-        # Track appointment status change data
-        if new_status == Appointment.Status.CANCELLED:
-            appointments_cancelled_total.labels(
-                cancellation_person=cancelled_by,
-                speciality_id=str(appointment.healthcare_provider.speciality.id),
-            ).inc()
-
-            lead_time = (
-                appointment.appointment_start_datetime_utc - timezone.now()
-            ).total_seconds() / 3600
-            cancellation_lead_time_hours.observe(lead_time)
-        elif new_status == Appointment.Status.CONFIRMED:
-            appointments_confirmed_total.labels(
-                speciality_id=str(appointment.healthcare_provider.speciality.id),
-                hospital_id=str(appointment.location.id),
-            ).inc()
-        elif new_status == Appointment.Status.COMPLETED:
-            appointments_completed_total.labels(
-                speciality_id=str(appointment.healthcare_provider.speciality.id),
-                hospital_id=str(appointment.location.id),
-            ).inc()
-
-            revenue_generated.labels(
-                speciality_name=appointment.healthcare_provider.speciality.name,
-                hospital_id=str(appointment.location.id),
-            ).inc(float(appointment.healthcare_provider.fees))
-        elif new_status == Appointment.Status.RESCHEDULED:
-            appointments_rescheduled_total.labels(
-                speciality_id=str(appointment.healthcare_provider.speciality.id)
-            ).inc()
+            cancelled_by = None
+            if new_status == Appointment.Status.CANCELLED:
+                cancelled_by = self._cancelled_by(request.user, appointment)
+
+            record_booking_event(new_status, appointment, cancelled_by=cancelled_by)
 
         return Response({"detail": f"Appointment {new_status.lower()}."})
 
+    @staticmethod
+    def _cancelled_by(user, appointment: Appointment) -> str:
+        roles = get_roles(user)
+        if roles.is_patient and appointment.patient_id == user.pk:
+            return "patient"
+        if roles.is_provider and appointment.healthcare_provider_id == user.pk:
+            return "provider"
+        if user.is_staff:
+            return "staff"
+        return "unknown"
+
 
 class SlotViewSet(viewsets.ModelViewSet):
     queryset = Slot.objects.select_related(
@@ -324,9 +266,9 @@ class SlotViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Providers see only their own slots; staff sees all."""
-        user = self.request.user
-        if hasattr(user, "provider"):
-            return self.queryset.filter(healthcare_provider=user.provider)
+        roles = get_roles(self.request.user)
+        if roles.is_provider:
+            return self.queryset.filter(healthcare_provider=roles.provider)
         return self.queryset.all()
 
     def get_permissions(self):
@@ -334,9 +276,9 @@ class SlotViewSet(viewsets.ModelViewSet):
 
     def perform_create(self, serializer):
         """Force the slot to belong to the calling provider (or allow staff to pick)."""
-        user = self.request.user
-        if hasattr(user, "provider"):
-            serializer.save(healthcare_provider=user.provider)
+        roles = get_roles(self.request.user)
+        if roles.is_provider:
+            serializer.save(healthcare_provider=roles.provider)
         else:
             # staff/admin must supply provider in payload
             serializer.save()
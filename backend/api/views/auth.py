@@ -1,25 +1,33 @@
 import logging
 from rest_framework.views import APIView
 from django.utils import timezone
-from rest_framework import status, generics
+from rest_framework import status, generics, exceptions
 from rest_framework.response import Response
-from rest_framework_simplejwt.tokens import RefreshToken
-from django.contrib.auth import authenticate
 from rest_framework.permissions import IsAuthenticated
 from django.shortcuts import get_object_or_404
 from rest_framework.authentication import BaseAuthentication
 from rest_framework.permissions import BasePermission
+from rest_framework.throttling import BaseThrottle
 
+from ..authentication import BlacklistRefreshToken, access_token_for
 from ..models import User
-from ..serializers import UserSerializer
-from ..services.auth import send_verification_email
+from ..metrics import login_attempts_total
+from ..services.auth import LoginAttempt, check_credentials, send_verification_email
+from ..services.user_profile import get_profile
 from ..utils.tokens import check_verification_jwt
 
 logger = logging.getLogger(__name__)
 
 
-# @method_decorator(ratelimit(key="ip", rate="15/h", method="POST"), name='post')
 class LoginView(APIView):
+    """
+    Password login, throttled per client IP and per email.
+
+    Failed attempts are counted in a sliding window, and throttled clients
+    are rejected before the password is hashed. The password is hashed once
+    per attempt, known email or not.
+    """
+
     authentication_classes: list[type[BaseAuthentication]] = []
     permission_classes: list[type[BasePermission]] = []
 
@@ -33,38 +41,39 @@ class LoginView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        try:
-            # check if user exist
-            user = User.objects.get(email=email)
-        except User.DoesNotExist:
-            user = None
-
-        # Try to authenticate the user
-        authenticated_user = authenticate(username=email, password=password)
-
-        if authenticated_user is None:
-            # If authentication failed, check if it's because user is inactive
-            if (
-                user is not None
-                and user.check_password(password)
-                and not user.is_active
-            ):
-                return Response(
-                    {"detail": "E-mail not verified"}, status=status.HTTP_403_FORBIDDEN
-                )
+        # X-Forwarded-For is only trusted for REST_FRAMEWORK["NUM_PROXIES"]
+        attempt = LoginAttempt(BaseThrottle().get_ident(request), email)
+        wait = attempt.start()
+        if wait is not None:
+            login_attempts_total.labels(result="throttled").inc()
+            raise exceptions.Throttled(wait=wait)
+
+        authenticated_user, valid = check_credentials(email, password)
+
+        if not valid:
+            login_attempts_total.labels(result="invalid").inc()
             return Response(
                 {"detail": "Invalid credentials"}, status=status.HTTP_401_UNAUTHORIZED
             )
 
-        refresh = RefreshToken.for_user(authenticated_user)
-        user_data = UserSerializer(authenticated_user).data
+        if not authenticated_user.is_active:
+            attempt.cancel()
+            login_attempts_total.labels(result="inactive").inc()
+            return Response(
+                {"detail": "E-mail not verified"}, status=status.HTTP_403_FORBIDDEN
+            )
+
+        attempt.succeeded()
+        login_attempts_total.labels(result="success").inc()
+        refresh = BlacklistRefreshToken.for_user(authenticated_user)
+        user_data = get_profile(authenticated_user.pk)
 
         # remove None / blank optional fields
         user_data = {k: v for k, v in user_data.items() if v not in (None, "", [])}
         return Response(
             {
                 "refresh": str(refresh),
-                "access": str(refresh.access_token),
+                "access": str(access_token_for(refresh, authenticated_user)),
                 "user": user_data,
             }
         )
@@ -136,7 +145,7 @@ class LogoutView(APIView):
     def post(self, request):
         try:
             refresh_token = request.data["refresh"]
-            token = RefreshToken(refresh_token)
+            token = BlacklistRefreshToken(refresh_token)
             token.blacklist()
             return Response(status=status.HTTP_205_RESET_CONTENT)
         except Exception:
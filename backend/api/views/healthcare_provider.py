@@ -1,6 +1,8 @@
+from django.conf import settings
 from django.utils import timezone
 from rest_framework import exceptions
-from rest_framework import mixins, viewsets, permissions, status
+from rest_framework import filters, mixins, viewsets, permissions, status
+from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.pagination import PageNumberPagination
@@ -12,6 +14,8 @@ from ..serializers import (
     HealthcareProviderListSerializer,
 )
 from ..permissions import IsStaffOrAdmin
+from ..roles import get_roles
+from ..services.provider_directory import autocomplete_providers, get_directory_page
 
 
 class HealthcareProviderViewSet(
@@ -33,6 +37,8 @@ class HealthcareProviderViewSet(
         is_removed=False, user__is_active=True
     ).select_related("user", "speciality", "primary_hospital")
     pagination_class = PageNumberPagination
+    # No ordering parameter, the cached list pages are keyed on DIRECTORY_PARAMS
+    filter_backends = [DjangoFilterBackend, filters.SearchFilter]
     filterset_fields = ["speciality"]
     search_fields = ["user__first_name", "user__last_name", "speciality__name"]
 
@@ -61,23 +67,47 @@ class HealthcareProviderViewSet(
             return [IsStaffOrAdmin()]
         return [permissions.IsAuthenticated()]
 
+    def list(self, request, *args, **kwargs):
+        # The directory is the same for every user, serve it from the page cache
+        data = get_directory_page(
+            request,
+            lambda: super(HealthcareProviderViewSet, self)
+            .list(request, *args, **kwargs)
+            .data,
+        )
+        return Response(data)
+
+    @action(detail=False, methods=["get"], url_path="autocomplete")
+    def autocomplete(self, request):
+        """Top ``limit`` providers whose names match ``q`` as typed"""
+        max_results = settings.PROVIDER_AUTOCOMPLETE_MAX_RESULTS
+        try:
+            limit = int(request.query_params.get("limit", 10))
+        except ValueError:
+            raise exceptions.ValidationError({"limit": "Must be an integer."})
+        limit = min(max(limit, 1), max_results)
+        return Response(
+            autocomplete_providers(request.query_params.get("q", ""), limit)
+        )
+
     def get_object(self):
         if "pk" in self.kwargs:
             # Staff or the provider themselves accessing via ID
             return HealthcareProvider.objects.get(user_id=self.kwargs["pk"])
-        return self.request.user.provider
+        return get_roles(self.request.user).provider
 
     @action(detail=False, methods=["get", "patch", "put"], url_path="me")
     def me(self, request):
-        if not hasattr(request.user, "provider"):
+        provider = get_roles(request.user).provider
+        if provider is None:
             raise exceptions.NotFound("Provider profile not found.")
 
         if request.method == "GET":
-            serializer = self.get_serializer(request.user.provider)
+            serializer = self.get_serializer(provider)
             return Response(serializer.data)
         else:  # PATCH/PUT
             serializer = self.get_serializer(
-                request.user.provider,
+                provider,
                 data=request.data,
                 partial=(request.method == "PATCH"),
             )
@@ -100,15 +130,16 @@ class HealthcareProviderViewSet(
 
     def perform_update(self, serializer):
         user = self.request.user
+        roles = get_roles(user)
         instance = self.get_object()
         can_update = False
 
-        if user.is_staff or hasattr(user, "system_admin"):
+        if user.is_staff or roles.is_system_admin:
             can_update = True
-        elif hasattr(user, "admin_staff"):
+        elif roles.is_admin_staff:
             if (
-                instance.primary_hospital
-                and instance.primary_hospital == user.admin_staff.hospital
+                instance.primary_hospital_id
+                and instance.primary_hospital_id == roles.admin_staff.hospital_id
             ):
                 can_update = True
 
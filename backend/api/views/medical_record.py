@@ -1,8 +1,10 @@
-from rest_framework import viewsets, status, filters
+from rest_framework import exceptions, viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.generics import get_object_or_404
 from django_filters.rest_framework import DjangoFilterBackend
+from django.http import StreamingHttpResponse
 from django.utils import timezone
 
 from ..models import MedicalRecord
@@ -10,9 +12,23 @@ from ..serializers import (
     MedicalRecordCreateSerializer,
     MedicalRecordUpdateSerializer,
     MedicalRecordListSerializer,
+    MedicalRecordListValuesSerializer,
+    MedicalRecordExportValuesSerializer,
     MedicalRecordDetailSerializer,
 )
+from ..filters import RankedSearchFilter
+from ..pagination import MedicalRecordPagination
 from ..permissions import IsHealthcareProvider, IsPatientOrProvider, IsStaffOrAdmin
+from ..roles import get_roles
+from ..services.record_counts import record_stats
+from ..services.record_detail import stored_details
+from ..services.record_export import csv_lines, export_rows, ndjson_lines
+
+# ?type= of the export action: content type and body
+EXPORT_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
 
 
 class MedicalRecordViewSet(viewsets.ModelViewSet):
@@ -30,24 +46,13 @@ class MedicalRecordViewSet(viewsets.ModelViewSet):
 
     queryset = MedicalRecord.objects.all()
     permission_classes = [IsAuthenticated]
-    filter_backends = [
-        DjangoFilterBackend,
-        filters.SearchFilter,
-        filters.OrderingFilter,
-    ]
+    filter_backends = [DjangoFilterBackend, RankedSearchFilter]
     filterset_fields = ["patient", "healthcare_provider", "hospital", "appointment"]
-    search_fields = [
-        "diagnosis",
-        "notes",
-        "prescriptions",
-        "patient__user__first_name",
-        "patient__user__last_name",
-        "healthcare_provider__user__first_name",
-        "healthcare_provider__user__last_name",
-        "hospital__name",
-    ]
-    ordering_fields = ["created_at", "updated_at"]
-    ordering = ["-created_at"]
+    # ?search= matches diagnosis, names, prescriptions, hospital and notes,
+    # weighted in that order (see api.services.search)
+    search_vector_field = "search_vector"
+    # Newest first, ordered on (created_at, id) by the paginator
+    pagination_class = MedicalRecordPagination
 
     def get_serializer_class(self):
         """Return appropriate serializer based on action"""
@@ -79,7 +84,7 @@ class MedicalRecordViewSet(viewsets.ModelViewSet):
                 IsAuthenticated,
                 IsHealthcareProvider | IsStaffOrAdmin,
             ]
-        elif self.action == "list":
+        elif self.action in ["list", "export"]:
             permission_classes = [IsAuthenticated, IsPatientOrProvider]
         else:  # retrieve
             permission_classes = [IsAuthenticated, IsPatientOrProvider]
@@ -94,12 +99,14 @@ class MedicalRecordViewSet(viewsets.ModelViewSet):
         else:
             queryset = MedicalRecord.objects.filter(is_removed=False)
 
+        roles = get_roles(user)
+
         # Patients can only see their own records
-        if hasattr(user, "patient"):
-            queryset = queryset.filter(patient=user.patient)
+        if roles.is_patient:
+            queryset = queryset.filter(patient=roles.patient)
 
         # Providers can see all records
-        elif hasattr(user, "provider") or hasattr(user, "admin_staff") or user.is_staff:
+        elif roles.is_provider or roles.is_admin_staff or user.is_staff:
             pass
 
         else:
@@ -115,6 +122,27 @@ class MedicalRecordViewSet(viewsets.ModelViewSet):
             "updated_by",
         )
 
+    def retrieve(self, request, *args, **kwargs):
+        # The stored detail payload, see api.services.record_detail
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        row = get_object_or_404(
+            self.filter_queryset(self.get_queryset()).values("id", "detail"),
+            **{self.lookup_field: self.kwargs[lookup_url_kwarg]},
+        )
+        return Response(stored_details([row])[0])
+
+    def list(self, request, *args, **kwargs):
+        if self.get_serializer_class() is MedicalRecordDetailSerializer:
+            return self.detail_page(self.filter_queryset(self.get_queryset()))
+
+        # Rendered from values(), see MedicalRecordListValuesSerializer
+        queryset = self.filter_queryset(self.get_queryset())
+        serializer = MedicalRecordListValuesSerializer(
+            queryset, context=self.get_serializer_context()
+        )
+        page = self.paginate_queryset(serializer.rows())
+        return self.get_paginated_response(serializer.render(page))
+
     def perform_destroy(self, instance):
         """Soft delete instead of hard delete"""
         instance.is_removed = True
@@ -129,27 +157,19 @@ class MedicalRecordViewSet(viewsets.ModelViewSet):
         - Providers: records they created
         - Patients: their own records
         """
-        queryset = self.get_queryset()
-
-        # Apply additional filtering if needed
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        return self.detail_page(self.get_queryset())
 
     @action(detail=False, methods=["get"], permission_classes=[IsAuthenticated])
     def removed(self, request):
-        removed_records = MedicalRecord.objects.filter(is_removed=True)
-        page = self.paginate_queryset(removed_records)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
+        return self.detail_page(MedicalRecord.objects.filter(is_removed=True))
 
-        serializer = self.get_serializer(removed_records, many=True)
-        return Response(serializer.data)
+    def detail_page(self, queryset):
+        """A page of stored detail payloads, keyed by the paginator's ordering"""
+        rows = queryset.values(
+            "id", "created_at", "detail", *queryset.query.annotations
+        )
+        page = self.paginate_queryset(rows)
+        return self.get_paginated_response(stored_details(page))
 
     @action(detail=True, methods=["post"], permission_classes=[IsAuthenticated])
     def restore(self, request, pk=None):
@@ -168,37 +188,50 @@ class MedicalRecordViewSet(viewsets.ModelViewSet):
             {"detail": "Record restored successfully."}, status=status.HTTP_200_OK
         )
 
-    @action(detail=False, methods=["get"], permission_classes=[IsAuthenticated])
-    def stats(self, request):
-        """Get statistics about medical records"""
-        user = request.user
+    @action(detail=False, methods=["get"])
+    def export(self, request):
+        """
+        Stream the records the user can list, with the same filters, as CSV
+        or NDJSON (?type=), oldest first.
+        """
+        export_type = request.query_params.get("type", "csv")
+        if export_type not in EXPORT_TYPES:
+            raise exceptions.ValidationError(
+                {"type": f"Must be one of: {', '.join(EXPORT_TYPES)}."}
+            )
 
-        if hasattr(user, "provider"):
-            # Provider stats
-            total_records = MedicalRecord.objects.filter(
-                healthcare_provider=user.provider, is_removed=False
-            ).count()
+        queryset = self.filter_queryset(self.get_queryset()).order_by(
+            "created_at", "id"
+        )
+        serializer = MedicalRecordExportValuesSerializer(
+            queryset, context=self.get_serializer_context()
+        )
+        rows = export_rows(serializer)
+        if export_type == "csv":
+            body = csv_lines(rows, serializer.keys)
+        else:
+            body = ndjson_lines(rows)
 
-            recent_records = MedicalRecord.objects.filter(
-                healthcare_provider=user.provider,
-                created_at__gte=timezone.now() - timezone.timedelta(days=30),
-                is_removed=False,
-            ).count()
+        response = StreamingHttpResponse(body, content_type=EXPORT_TYPES[export_type])
+        response["Content-Disposition"] = (
+            f'attachment; filename="medical-records.{export_type}"'
+        )
+        return response
 
-            return Response(
-                {
-                    "total_records": total_records,
-                    "recent_records": recent_records,
-                    "role": "provider",
-                }
-            )
+    @action(detail=False, methods=["get"], permission_classes=[IsAuthenticated])
+    def stats(self, request):
+        """
+        Live record totals of the provider or patient, with the last 30 days
+        and breakdowns by hospital and month (see api.services.record_counts)
+        """
+        roles = get_roles(request.user)
 
-        elif hasattr(user, "patient"):
-            # Patient stats
-            total_records = MedicalRecord.objects.filter(
-                patient=user.patient, is_removed=False
-            ).count()
+        if roles.is_provider:
+            stats = record_stats(healthcare_provider=roles.provider)
+            return Response({**stats, "role": "provider"})
 
-            return Response({"total_records": total_records, "role": "patient"})
+        elif roles.is_patient:
+            stats = record_stats(patient=roles.patient)
+            return Response({**stats, "role": "patient"})
 
         return Response({"role": "other", "total_records": 0})
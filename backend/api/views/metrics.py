@@ -0,0 +1,13 @@
+from django.http import HttpResponse
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+from ..metrics import get_registry
+
+
+def metrics_view(request):
+    """
+    Prometheus scrape endpoint aggregating the samples of every worker.
+    """
+    return HttpResponse(
+        generate_latest(get_registry()), content_type=CONTENT_TYPE_LATEST
+    )
@@ -10,6 +10,7 @@ from ..serializers import (
 )
 from ..services.auth import send_verification_email
 from ..metrics import patients_registered_total
+from ..roles import get_roles, role_related
 
 
 class PatientViewSet(
@@ -27,7 +28,7 @@ class PatientViewSet(
         - Staff can list all patients
     """
 
-    queryset = Patient.objects.select_related("user")
+    queryset = Patient.objects.select_related("user", *role_related("user"))
     pagination_class = PageNumberPagination
 
     def get_serializer_class(self):
@@ -48,15 +49,16 @@ class PatientViewSet(
 
     @action(detail=False, methods=["get", "patch", "put"], url_path="me")
     def me(self, request):
-        if not hasattr(request.user, "patient"):
+        patient = get_roles(request.user).patient
+        if patient is None:
             raise exceptions.NotFound("Patient profile not found.")
 
         if request.method == "GET":
-            serializer = self.get_serializer(request.user.patient)
+            serializer = self.get_serializer(patient)
             return Response(serializer.data)
         else:  # PATCH/PUT
             serializer = self.get_serializer(
-                request.user.patient,
+                patient,
                 data=request.data,
                 partial=(request.method == "PATCH"),
             )
@@ -86,7 +88,7 @@ class PatientViewSet(
 
     @action(detail=False, methods=["post"], url_path="onboard")
     def on_board(self, request):
-        if hasattr(request.user, "patient"):
+        if get_roles(request.user).is_patient:
             return Response(
                 {"detail": "Patient profile already exists."},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -99,10 +101,7 @@ class PatientViewSet(
         )
 
     def list(self, request, *args, **kwargs):
-        if not (
-            request.user.is_staff
-            or hasattr(request.user, "admin_staff")
-            or hasattr(request.user, "system_admin")
-        ):
+        roles = get_roles(request.user)
+        if not (request.user.is_staff or roles.is_admin_staff or roles.is_system_admin):
             return Response(status=status.HTTP_403_FORBIDDEN)
         return super().list(request, *args, **kwargs)
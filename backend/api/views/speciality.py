@@ -3,6 +3,7 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from django.utils import timezone
 from django.core.exceptions import ObjectDoesNotExist
+from django.http import Http404
 from django_filters.rest_framework import DjangoFilterBackend
 
 from ..models import Speciality
@@ -12,6 +13,7 @@ from ..serializers import (
     SpecialityCreateSerializer,
 )
 from ..permissions import IsStaffOrAdmin
+from ..services.speciality import SpecialityService
 
 
 class SpecialityViewSet(
@@ -24,6 +26,7 @@ class SpecialityViewSet(
     """
     Features:
         - Authenticated user can view specialities
+        - Unfiltered lists and retrieves are served from the reference cache
     """
 
     queryset = Speciality.objects.filter(is_removed=False)
@@ -42,6 +45,22 @@ class SpecialityViewSet(
             return [IsStaffOrAdmin()]
         return [permissions.IsAuthenticated()]
 
+    def list(self, request, *args, **kwargs):
+        if self.request.query_params.get(filters.SearchFilter.search_param):
+            return super().list(request, *args, **kwargs)
+        specialities = SpecialityService.get_all_specialities()
+        return Response(self.get_serializer(specialities, many=True).data)
+
+    def retrieve(self, request, *args, **kwargs):
+        try:
+            speciality_id = int(self.kwargs["pk"])
+        except ValueError:
+            raise Http404
+        speciality = SpecialityService.get_speciality_by_id(speciality_id)
+        if speciality is None:
+            raise Http404
+        return Response(self.get_serializer(speciality).data)
+
     def perform_create(self, serializer):
         return serializer.save(
             created_by=self.request.user,
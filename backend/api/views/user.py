@@ -9,6 +9,7 @@ from ..serializers import (
     ChangePasswordSerializer,
 )
 from ..services.auth import send_verification_email
+from ..services.user_profile import get_profile
 
 User = get_user_model()
 
@@ -59,8 +60,7 @@ class UserViewSet(
         user = request.user
 
         if request.method == "GET":
-            serializer = self.get_serializer(user)
-            return Response(serializer.data)
+            return Response(get_profile(user.pk, request))
 
         elif request.method in ["PUT", "PATCH"]:
             partial = request.method == "PATCH"
@@ -0,0 +1,82 @@
+"""
+camelCase conversion of a 500 row appointment list: the previous regex per
+key walk of every row against the per-class key maps of CamelCaseMixin.
+
+Only the conversion step is measured, on representations built in memory,
+so no database is needed.
+
+    python -m benchmarks.case_conversion [--rows N] [--repeat N]
+"""
+
+import argparse
+
+from .harness import measure, report, setup_django
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from api.serializers import AppointmentListSerializer
+    from api.utils.case import to_camelcase
+
+    def legacy_camelcase_data(data):
+        if isinstance(data, dict):
+            return {to_camelcase(k): legacy_camelcase_data(v) for k, v in data.items()}
+        if isinstance(data, list):
+            return [legacy_camelcase_data(datum) for datum in data]
+        return data
+
+    # What AppointmentListSerializer.to_representation builds before the
+    # conversion, the nested hospital is converted by its own serializer
+    rows = [
+        {
+            "id": i,
+            "patient_id": f"patient-{i}",
+            "provider_id": f"provider-{i}",
+            "patient_name": "Jane Doe",
+            "provider_name": "John Smith",
+            "provider_image": None,
+            "appointment_start_datetime_utc": "2026-01-01T09:00:00Z",
+            "appointment_end_datetime_utc": "2026-01-01T09:30:00Z",
+            "hospital": {
+                "id": 1,
+                "name": "General",
+                "addressLine1": "1 Main St",
+                "addressLine2": "",
+                "timezone": "UTC",
+            },
+            "reason": "Checkup",
+            "status": "CONFIRMED",
+        }
+        for i in range(args.rows)
+    ]
+    # The child is shared by every row of a many=True list
+    child = AppointmentListSerializer(many=True).child
+
+    def legacy() -> None:
+        for row in rows:
+            legacy_camelcase_data(row)
+
+    def key_maps() -> None:
+        for row in rows:
+            child._to_camelcase(row)
+
+    assert [child._to_camelcase(row) for row in rows] == [
+        legacy_camelcase_data(row) for row in rows
+    ]
+    report(
+        f"camelCase conversion of {args.rows} appointment rows",
+        {
+            "regex per key": measure(legacy, args.repeat),
+            "key maps": measure(key_maps, args.repeat),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Helpers for the benchmark scripts in this directory.
+
+Run a benchmark from the backend directory, e.g.::
+
+    python -m benchmarks.login_cpu
+
+Benchmarks run against the test database (created if missing, kept
+afterwards) inside a transaction that is rolled back, so they never touch
+development data.
+"""
+
+import os
+import statistics
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+
+def setup_django(settings_module: str = "api.settings.development") -> None:
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", settings_module)
+
+    import django
+
+    django.setup()
+
+
+@contextmanager
+def test_database() -> Iterator[None]:
+    """Test database with every change rolled back on exit"""
+    from django.db import connection, transaction
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    setup_test_environment()
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0, keepdb=True)
+    try:
+        with transaction.atomic():
+            yield
+            transaction.set_rollback(True)
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=True)
+        teardown_test_environment()
+
+
+def measure(fn: Callable[[], Any], repeat: int) -> dict[str, float]:
+    """CPU and wall time per call of ``fn``, in milliseconds"""
+    cpu, wall = [], []
+    for _ in range(repeat):
+        cpu_start, wall_start = time.process_time(), time.perf_counter()
+        fn()
+        cpu.append((time.process_time() - cpu_start) * 1000)
+        wall.append((time.perf_counter() - wall_start) * 1000)
+    return {
+        "cpu_ms": statistics.mean(cpu),
+        "wall_ms": statistics.mean(wall),
+        "wall_p95_ms": sorted(wall)[int(len(wall) * 0.95) - 1],
+    }
+
+
+def report(title: str, rows: dict[str, dict[str, float]]) -> None:
+    print(title)
+    width = max(len(name) for name in rows)
+    columns = list(next(iter(rows.values())))
+    print(" " * width + "".join(f"{column:>14}" for column in columns))
+    for name, values in rows.items():
+        print(name.ljust(width) + "".join(f"{values[c]:>14.3f}" for c in columns))
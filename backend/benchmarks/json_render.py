@@ -0,0 +1,86 @@
+"""
+Render time of large /slot/range and /medical-record payloads with DRF's
+JSONRenderer against FastJSONRenderer.
+
+The payloads are built in memory with the shapes the views return: range
+groups ``.values()`` rows with raw datetimes by day, medical records are
+serializer output.
+
+    python -m benchmarks.json_render [--rows N] [--repeat N]
+"""
+
+import argparse
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from .harness import measure, report, setup_django
+
+
+def range_payload(rows: int) -> dict:
+    start = datetime(2026, 1, 5, 8, tzinfo=timezone.utc)
+    grouped: dict[str, list] = {}
+    for i in range(rows):
+        slot_start = start + timedelta(minutes=15 * i)
+        grouped.setdefault(slot_start.date().isoformat(), []).append(
+            {
+                "id": i,
+                "start": slot_start,
+                "end": slot_start + timedelta(minutes=15),
+                "status": "FREE",
+                "hospitalId": 1,
+                "hospitalName": "General Hospital",
+                "hospitalTimezone": "America/New_York",
+            }
+        )
+    return grouped
+
+
+def medical_record_payload(rows: int) -> list:
+    return [
+        {
+            "id": i,
+            "patientId": str(uuid.uuid4()),
+            "providerId": str(uuid.uuid4()),
+            "hospitalId": 1,
+            "appointmentId": i,
+            "diagnosis": "Seasonal allergic rhinitis",
+            "notes": "Patient reports sneezing and itchy eyes for two weeks. " * 4,
+            "prescriptions": "Cetirizine 10mg once daily",
+            "createdAt": "2026-01-05T09:30:00.123Z",
+            "updatedAt": "2026-01-05T09:30:00.123Z",
+        }
+        for i in range(rows)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from rest_framework.renderers import JSONRenderer
+
+    from api.renderers import FastJSONRenderer
+
+    payloads = {
+        "range": range_payload(args.rows),
+        "medical-record": medical_record_payload(args.rows),
+    }
+    rows = {}
+    for name, payload in payloads.items():
+        for label, renderer in (
+            ("JSONRenderer", JSONRenderer()),
+            ("FastJSONRenderer", FastJSONRenderer()),
+        ):
+            rows[f"{name} {label}"] = measure(
+                lambda: renderer.render(payload), args.repeat
+            )
+
+    report(f"Render time of {args.rows} rows", rows)
+
+
+if __name__ == "__main__":
+    main()
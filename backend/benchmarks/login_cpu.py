@@ -0,0 +1,94 @@
+"""
+CPU per failed login: the previous authenticate() + check_password() flow
+against the current single-hash login, and a throttled attempt.
+
+    python -m benchmarks.login_cpu [--repeat N]
+"""
+
+import argparse
+import logging
+
+from .harness import measure, report, setup_django, test_database
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    setup_django()
+    # Throttled attempts are logged as warnings
+    logging.getLogger("django.request").setLevel(logging.ERROR)
+
+    from django.contrib.auth import authenticate
+    from django.core.cache import cache
+    from django.test import override_settings
+    from django.urls import reverse
+    from rest_framework.test import APIClient
+
+    from api.models import User
+    from api.services.auth import login_email_limiter, login_ip_limiter
+
+    locmem = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+    with override_settings(CACHES=locmem), test_database():
+        cache.clear()
+        user = User.objects.create_user(
+            username="bench",
+            email="bench@example.com",
+            password="Complex123!",
+            first_name="Bench",
+            last_name="User",
+        )
+        client = APIClient()
+        url = reverse("login")
+        counter = iter(range(10**9))
+
+        def legacy_failed_login() -> None:
+            # LoginView before the single-hash flow
+            existing = User.objects.filter(email=user.email).first()
+            if authenticate(username=user.email, password="wrong") is None:
+                if existing is not None and existing.check_password("wrong"):
+                    pass
+
+        def failed_login() -> None:
+            # A new client IP each time so the attempt is not throttled
+            client.post(
+                url,
+                {"email": f"bench{next(counter)}@example.com", "password": "wrong"},
+                format="json",
+                REMOTE_ADDR="10.0.0.1",
+            )
+
+        def failed_login_known_email() -> None:
+            login_email_limiter.reset(user.email)
+            login_ip_limiter.reset("10.0.0.2")
+            client.post(
+                url,
+                {"email": user.email, "password": "wrong"},
+                format="json",
+                REMOTE_ADDR="10.0.0.2",
+            )
+
+        def throttled_login() -> None:
+            client.post(
+                url,
+                {"email": user.email, "password": "wrong"},
+                format="json",
+                REMOTE_ADDR="10.0.0.3",
+            )
+
+        rows = {
+            "legacy flow (known email)": measure(legacy_failed_login, args.repeat),
+        }
+        login_ip_limiter.limit = 10**9
+        rows["login (unknown email)"] = measure(failed_login, args.repeat)
+        rows["login (known email)"] = measure(failed_login_known_email, args.repeat)
+        login_ip_limiter.limit = 0
+        rows["throttled login"] = measure(throttled_login, args.repeat)
+
+    report("CPU per failed login", rows)
+
+
+if __name__ == "__main__":
+    main()
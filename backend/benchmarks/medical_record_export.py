@@ -0,0 +1,179 @@
+"""
+Throughput and memory of the streamed /medical-record/export, against
+rendering the same rows into one response body.
+
+Loads ``--records`` medical records (each with its appointment). One
+provider holds 1% of them and another 10%, so the export runs over three
+sizes. Memory is the peak traced Python allocation while consuming the
+response, measured in a separate pass because tracing slows it down.
+The default million records take about half an hour to load and export;
+everything is rolled back afterwards.
+
+    python -m benchmarks.medical_record_export [--records N]
+"""
+
+import argparse
+import itertools
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+from .harness import report, setup_django, test_database
+
+NOTES = "Patient reports sneezing and itchy eyes for two weeks. " * 4
+
+
+def load(records: int, batch_size: int = 10_000) -> list:
+    from api.models import (
+        Appointment,
+        HealthcareProvider,
+        Hospital,
+        MedicalRecord,
+        Patient,
+        User,
+    )
+
+    def users(prefix: str, count: int) -> list:
+        return User.objects.bulk_create(
+            User(
+                username=f"bench-{prefix}{n}",
+                email=f"bench-{prefix}{n}@example.com",
+                password="!",
+                first_name="Ada",
+                last_name=f"Lovelace{n}",
+            )
+            for n in range(count)
+        )
+
+    [staff] = users("staff", 1)
+    [hospital] = Hospital.objects.bulk_create(
+        [Hospital(name="General Hospital", created_by=staff, updated_by=staff)]
+    )
+    providers = HealthcareProvider.objects.bulk_create(
+        HealthcareProvider(
+            user=user,
+            about="",
+            fees=100,
+            address_line1="1 Main St",
+            city="Springfield",
+            state="IL",
+            zip_code="62701",
+            license_number="LIC123456",
+            primary_hospital=hospital,
+        )
+        for user in users("provider", 3)
+    )
+    patients = Patient.objects.bulk_create(
+        Patient(user=user) for user in users("patient", 100)
+    )
+
+    def provider_of(n: int):
+        # 1% to the first provider, 10% to the second, the rest to the third
+        return providers[0 if n % 100 == 0 else 1 if n % 10 == 1 else 2]
+
+    start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    counter = itertools.count()
+    while True:
+        numbers = [n for n in itertools.islice(counter, batch_size) if n < records]
+        if not numbers:
+            break
+        appointments = Appointment.objects.bulk_create(
+            Appointment(
+                patient=patients[n % len(patients)],
+                healthcare_provider=provider_of(n),
+                appointment_start_datetime_utc=start + timedelta(minutes=n),
+                appointment_end_datetime_utc=start + timedelta(minutes=n + 30),
+                location=hospital,
+                reason="Check-up",
+                status=Appointment.Status.COMPLETED,
+            )
+            for n in numbers
+        )
+        MedicalRecord.objects.bulk_create(
+            MedicalRecord(
+                patient=appointment.patient,
+                healthcare_provider=appointment.healthcare_provider,
+                hospital=hospital,
+                appointment=appointment,
+                diagnosis="Seasonal allergic rhinitis",
+                notes=NOTES,
+                prescriptions="Cetirizine 10mg once daily",
+                created_by=staff,
+                updated_by=staff,
+            )
+            for appointment in appointments
+        )
+    return providers
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.db import connection
+    from django.urls import reverse
+    from rest_framework.renderers import JSONRenderer
+    from rest_framework.test import APIClient
+
+    from api.models import MedicalRecord
+    from api.serializers import MedicalRecordExportValuesSerializer
+
+    def stream(client, params: dict) -> tuple[int, int]:
+        response = client.get(reverse("medical_record-export"), params)
+        size = lines = 0
+        for chunk in response.streaming_content:
+            size += len(chunk)
+            lines += chunk.count(b"\n")
+        return lines, size
+
+    def buffered(provider) -> tuple[int, int]:
+        queryset = MedicalRecord.objects.filter(
+            is_removed=False, healthcare_provider=provider
+        ).order_by("created_at", "id")
+        data = MedicalRecordExportValuesSerializer(queryset).data
+        return len(data), len(JSONRenderer().render(data))
+
+    def run(fn) -> dict[str, float]:
+        start = time.perf_counter()
+        lines, size = fn()
+        wall = time.perf_counter() - start
+        tracemalloc.start()
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return {
+            "rows": lines,
+            "wall_s": wall,
+            "rows_per_s": lines / wall,
+            "mb_per_s": size / wall / 1e6,
+            "peak_mb": peak / 1e6,
+        }
+
+    with test_database():
+        providers = load(args.records)
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE api_medicalrecord")
+        client = APIClient()
+        client.force_authenticate(providers[0].user)
+
+        rows = {}
+        for label, provider in (("1%", providers[0]), ("10%", providers[1])):
+            rows[f"buffered json, {label}"] = run(lambda: buffered(provider))
+            for export_type in ("ndjson", "csv"):
+                params = {"type": export_type, "healthcare_provider": provider.pk}
+                rows[f"streamed {export_type}, {label}"] = run(
+                    lambda: stream(client, params)
+                )
+        for export_type in ("ndjson", "csv"):
+            rows[f"streamed {export_type}, all"] = run(
+                lambda: stream(client, {"type": export_type})
+            )
+
+    report(f"Medical record export of {args.records} records", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+Provider name lookups over a large user table: the directory's icontains
+search and the autocomplete, with and without the trigram name indexes.
+
+Half the names are common ones and half are made up from syllables, so
+prefixes range from very common to selective. Every ``--provider-every``-th
+user is a listed provider. Loading the default million users takes a few
+minutes; everything is rolled back afterwards.
+
+    python -m benchmarks.provider_autocomplete [--users N] [--repeat N]
+"""
+
+import argparse
+import itertools
+import random
+from typing import Sequence
+
+from .harness import measure, report, setup_django, test_database
+
+FIRST_NAMES = (
+    "James Mary John Patricia Robert Jennifer Michael Linda William Elizabeth "
+    "David Barbara Richard Susan Joseph Jessica Thomas Sarah Charles Karen "
+    "Christopher Nancy Daniel Lisa Matthew Betty Anthony Margaret Mark Sandra "
+    "Donald Ashley Steven Kimberly Paul Emily Andrew Donna Joshua Michelle"
+).split()
+LAST_NAMES = (
+    "Smith Johnson Williams Brown Jones Garcia Miller Davis Rodriguez Martinez "
+    "Hernandez Lopez Gonzalez Wilson Anderson Thomas Taylor Moore Jackson Martin "
+    "Lee Perez Thompson White Harris Sanchez Clark Ramirez Lewis Robinson"
+).split()
+SUFFIXES = ("", "", "", "son", "ez", "ski", "ton", "ley", "berg", "field")
+SYLLABLES = "ka ri mo na el so ta li ve ra do mi sa an be lu ma to ha ge fi".split()
+
+# Every index of migration 0006, dropped for the unindexed runs
+NAME_INDEXES = (
+    "user_first_name_trgm_idx",
+    "user_last_name_trgm_idx",
+    "user_first_name_prefix_idx",
+    "user_last_name_prefix_idx",
+    "user_full_name_trgm_idx",
+)
+
+QUERIES = {
+    "common prefix": "marg",
+    "rare prefix": "kariso",
+    "two letters": "jo",
+    "typo": "Wiliams",
+    "two words": "ma lo",
+}
+
+
+def name(rng: random.Random, common: Sequence[str]) -> str:
+    if rng.random() < 0.5:
+        return rng.choice(common)
+    syllables = rng.choices(SYLLABLES, k=rng.randint(2, 4))
+    return "".join(syllables).capitalize()
+
+
+def load(users: int, provider_every: int, batch_size: int = 5000) -> None:
+    from django.db import connection
+
+    from api.models import HealthcareProvider, User
+
+    rng = random.Random(7)
+    last_names = [last + suffix for last in LAST_NAMES for suffix in SUFFIXES]
+    counter = itertools.count()
+    while True:
+        batch = [
+            User(
+                username=f"bench{n}",
+                email=f"bench{n}@example.com",
+                password="!",
+                first_name=name(rng, FIRST_NAMES),
+                last_name=name(rng, last_names),
+            )
+            for n in itertools.islice(counter, batch_size)
+            if n < users
+        ]
+        if not batch:
+            break
+        User.objects.bulk_create(batch)
+        HealthcareProvider.objects.bulk_create(
+            HealthcareProvider(
+                user=user,
+                about="",
+                fees=100,
+                address_line1="1 Main St",
+                city="Springfield",
+                state="IL",
+                zip_code="62701",
+                license_number="LIC123456",
+            )
+            for user in batch[::provider_every]
+        )
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE api_user")
+        cursor.execute("ANALYZE api_healthcareprovider")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--provider-every", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.core.cache import cache
+    from django.db import connection
+    from django.db.models import Q
+    from django.test import override_settings
+
+    from api.models import HealthcareProvider
+    from api.services.provider_directory import (
+        _autocomplete,
+        autocomplete_cache,
+        autocomplete_providers,
+    )
+
+    locmem = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+    def directory_search(text: str) -> None:
+        # SearchFilter over the provider list's search_fields
+        list(
+            HealthcareProvider.objects.filter(
+                Q(user__first_name__icontains=text)
+                | Q(user__last_name__icontains=text)
+                | Q(speciality__name__icontains=text),
+                is_removed=False,
+                user__is_active=True,
+            ).values("user_id")[:20]
+        )
+
+    def run(label: str, rows: dict) -> None:
+        rows[f"{label} search 'john'"] = measure(
+            lambda: directory_search("john"), args.repeat
+        )
+        for case, text in QUERIES.items():
+            rows[f"{label} autocomplete {case}"] = measure(
+                lambda: _autocomplete(text, 10), args.repeat
+            )
+
+    with override_settings(CACHES=locmem), test_database():
+        cache.clear()
+        autocomplete_cache.clear_local()
+        load(args.users, args.provider_every)
+
+        rows: dict = {}
+        run("indexed", rows)
+        autocomplete_providers("jo", 10)
+        rows["indexed autocomplete two letters, cached"] = measure(
+            lambda: autocomplete_providers("jo", 10), args.repeat
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP INDEX {', '.join(NAME_INDEXES)}")
+        run("unindexed", rows)
+
+    report(f"Provider name lookups over {args.users} users", rows)
+
+
+if __name__ == "__main__":
+    main()
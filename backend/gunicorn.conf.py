@@ -0,0 +1,62 @@
+"""
+Gunicorn configuration for the production image.
+
+Loaded automatically by ``gunicorn api.wsgi:application`` when started from
+the backend directory. When ``PROMETHEUS_MULTIPROC_DIR`` is set every worker
+writes its metrics to mmap files in that directory, and ``/metrics``
+aggregates them across workers.
+
+Unless ``EMAIL_WORKER=0``, the master also runs ``manage.py
+send_queued_email`` next to the web workers, so a single web service sends
+the queued emails. Deployments running the sender as a separate process set
+``EMAIL_WORKER=0``.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+
+from prometheus_client import multiprocess
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("GUNICORN_WORKERS", "3"))
+
+
+def on_starting(server):
+    """Start from an empty metrics directory so stale worker files are not summed."""
+    path = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if not path:
+        return
+
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+    os.makedirs(path, exist_ok=True)
+
+
+def child_exit(server, worker):
+    """Drop live gauge files of a dead worker, counters and histograms are kept."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(worker.pid)
+
+
+def when_ready(server):
+    """Start the queued email sender once the master is up."""
+    if os.environ.get("EMAIL_WORKER", "1") == "0":
+        return
+    server.email_worker = subprocess.Popen(
+        [sys.executable, "manage.py", "send_queued_email"],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
+
+
+def on_exit(server):
+    """Stop the queued email sender with the master."""
+    email_worker = getattr(server, "email_worker", None)
+    if email_worker is None:
+        return
+    email_worker.terminate()
+    try:
+        email_worker.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        email_worker.kill()
@@ -7,6 +7,7 @@ import {
   getPatientAppointments,
   updateAppointmentStatus,
 } from "../appointment";
+import { MAX_PAGES } from "../pagination";
 import type { AppointmentListItem } from "../../types/appointment";
 
 const SLOTS = {
@@ -79,17 +80,62 @@ describe("appointment API", () => {
   it("getProviderAppointments adds provider query", async () => {
     mock
       .onGet("/appointment/", { params: { provider: "2" } })
-      .reply(200, [APPT]);
+      .reply(200, { next: null, previous: null, results: [APPT] });
     const res = await getProviderAppointments("2");
-    expect(res).toEqual([APPT]);
+    expect(res).toEqual({ items: [APPT], next: null });
   });
 
   it("getPatientAppointments adds patient query", async () => {
     mock
       .onGet("/appointment/", { params: { patient: "1" } })
-      .reply(200, [APPT]);
+      .reply(200, { next: null, previous: null, results: [APPT] });
     const res = await getPatientAppointments("1");
-    expect(res).toEqual([APPT]);
+    expect(res).toEqual({ items: [APPT], next: null });
+  });
+
+  it("getPatientAppointments follows next links", async () => {
+    const next = "http://localhost/api/appointment/?cursor=abc&patient=1";
+    mock
+      .onGet("/appointment/", { params: { patient: "1" } })
+      .reply(200, { next, previous: null, results: [APPT] });
+    mock.onGet(next).reply(200, {
+      next: null,
+      previous: null,
+      results: [{ ...APPT, id: "2" }],
+    });
+    const res = await getPatientAppointments("1");
+    expect(res.items.map((a) => a.id)).toEqual([APPT.id, "2"]);
+    expect(res.next).toBeNull();
+  });
+
+  it("getPatientAppointments stops after MAX_PAGES pages", async () => {
+    const link = (n: number) =>
+      `http://localhost/api/appointment/?cursor=${n}&patient=1`;
+    mock
+      .onGet("/appointment/", { params: { patient: "1" } })
+      .reply(200, { next: link(1), previous: null, results: [APPT] });
+    for (let n = 1; n <= MAX_PAGES; n++) {
+      mock.onGet(link(n)).reply(200, {
+        next: link(n + 1),
+        previous: null,
+        results: [{ ...APPT, id: String(n) }],
+      });
+    }
+    const res = await getPatientAppointments("1");
+    expect(res.items).toHaveLength(MAX_PAGES);
+    expect(res.next).toBe(link(MAX_PAGES));
+    expect(mock.history.get).toHaveLength(MAX_PAGES);
+  });
+
+  it("getPatientAppointments continues from a next link", async () => {
+    const next = "http://localhost/api/appointment/?cursor=abc&patient=1";
+    mock.onGet(next).reply(200, {
+      next: null,
+      previous: null,
+      results: [{ ...APPT, id: "2" }],
+    });
+    const res = await getPatientAppointments("1", next);
+    expect(res).toEqual({ items: [{ ...APPT, id: "2" }], next: null });
   });
 
   it("updateAppointmentStatus POST /appointment/:id/set-status/", async () => {
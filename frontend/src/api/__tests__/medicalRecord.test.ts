@@ -73,7 +73,7 @@ describe("appointment API", () => {
   it("getMedicalRecordByAppointment GET /medical-record/", async () => {
     mock
       .onGet("/medical-record/", { params: { appointment: "1" } })
-      .reply(200, [mockRecord]);
+      .reply(200, { next: null, previous: null, results: [mockRecord] });
     const res = await getMedicalRecordByAppointment("1");
     expect(res).toEqual(mockRecord);
   });
@@ -81,7 +81,7 @@ describe("appointment API", () => {
   it("getMedicalRecordByAppointment GET /medical-record/ and returns null", async () => {
     mock
       .onGet("/medical-record/", { params: { appointment: "0" } })
-      .reply(200, []);
+      .reply(200, { next: null, previous: null, results: [] });
     const res = await getMedicalRecordByAppointment("0");
     expect(res).toEqual(null);
   });
@@ -1,4 +1,5 @@
 import { api } from "./axios";
+import { getPages } from "./pagination";
 import type {
   AppointmentListItem,
   AppointmentPayload,
@@ -19,23 +20,22 @@ export const getSlotsByRange = (payload: SlotRangePayload) =>
     >("/slot/range/", { params: { provider: payload.providerId, start_date: payload.startDate, end_date: payload.endDate } })
     .then((res) => res.data);
 
-export const getProviderAppointments = async (providerId: string) =>
-  api
-    .get<
-      AppointmentListItem[]
-    >("/appointment/", { params: { provider: providerId } })
-    .then((res) => res.data);
+// Newest first; pass the next link of the previous run to load older ones
+export const getProviderAppointments = async (
+  providerId: string,
+  next?: string | null,
+) =>
+  next
+    ? getPages<AppointmentListItem>(next)
+    : getPages<AppointmentListItem>("/appointment/", { provider: providerId });
 
-export const getPatientAppointments = async (patientId: string) => {
-  const params = new URLSearchParams();
-  params.set("patient", patientId);
-
-  return api
-    .get<AppointmentListItem[]>("/appointment/", {
-      params: { patient: patientId },
-    })
-    .then((res) => res.data);
-};
+export const getPatientAppointments = async (
+  patientId: string,
+  next?: string | null,
+) =>
+  next
+    ? getPages<AppointmentListItem>(next)
+    : getPages<AppointmentListItem>("/appointment/", { patient: patientId });
 
 export const updateAppointmentStatus = async (id: string, status: string) =>
   api
@@ -1,4 +1,5 @@
 import { api } from "./axios";
+import type { CursorPage } from "./pagination";
 
 import type {
   MedicalRecordDetail,
@@ -8,10 +9,10 @@ import type {
 
 export const getMedicalRecordByAppointment = (id: string) =>
   api
-    .get<MedicalRecordDetail[]>("/medical-record/", {
+    .get<CursorPage<MedicalRecordDetail>>("/medical-record/", {
       params: { appointment: id },
     })
-    .then((res) => (res.data && res.data.length > 0 ? res.data[0] : null)); // Filtering returns list even though the mapping is one-to-one
+    .then((res) => res.data.results[0] ?? null); // Filtering returns a page even though the mapping is one-to-one
 
 export const createMedicalRecord = (payload: MedicalRecordPayload) =>
   api
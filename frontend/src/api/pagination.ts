@@ -0,0 +1,37 @@
+import { api } from "./axios";
+
+export interface CursorPage<T> {
+  next: string | null;
+  previous: string | null;
+  results: T[];
+  estimated_count?: number | null;
+}
+
+// A run of up to MAX_PAGES pages of a keyset-paginated list. next continues
+// the list, and is null once it has been read to the end.
+export interface PageRun<T> {
+  items: T[];
+  next: string | null;
+}
+
+// Pages fetched per run, so a long history can't turn one load into an
+// unbounded run of requests; callers offer the rest through next
+export const MAX_PAGES = 5;
+
+// Follows the cursor links of a keyset-paginated list for up to maxPages
+// pages, from url with params or from the next link of an earlier run. Next
+// links already carry the query, so params only go with the first request.
+export const getPages = async <T>(
+  url: string,
+  params?: Record<string, unknown>,
+  maxPages = MAX_PAGES,
+): Promise<PageRun<T>> => {
+  const items: T[] = [];
+  let page = (await api.get<CursorPage<T>>(url, { params })).data;
+  items.push(...page.results);
+  for (let fetched = 1; page.next && fetched < maxPages; fetched++) {
+    page = (await api.get<CursorPage<T>>(page.next)).data;
+    items.push(...page.results);
+  }
+  return { items, next: page.next };
+};
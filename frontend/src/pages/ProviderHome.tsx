@@ -1,5 +1,5 @@
 import React, { useEffect, useState } from "react";
-import { useQuery } from "@tanstack/react-query";
+import { useInfiniteQuery } from "@tanstack/react-query";
 import { format } from "date-fns";
 import { toast } from "react-toastify";
 
@@ -23,18 +23,24 @@ const ProviderHome = (): React.JSX.Element => {
 
   /* ---------- appointments ---------- */
   const {
-    data: appointments = [],
+    data,
     isLoading,
     isError,
     error,
     refetch: refetchAppts,
-  } = useQuery({
+    hasNextPage,
+    fetchNextPage,
+    isFetchingNextPage,
+  } = useInfiniteQuery({
     queryKey: ["provider-appointments", providerId],
-    queryFn: () => getProviderAppointments(providerId!),
+    queryFn: ({ pageParam }) => getProviderAppointments(providerId!, pageParam),
+    initialPageParam: null as string | null,
+    getNextPageParam: (run) => run.next,
     enabled: !!providerId,
     staleTime: 3,
     refetchOnWindowFocus: true,
   });
+  const appointments = data?.pages.flatMap((run) => run.items) ?? [];
 
   useEffect(() => {
     if (isError && error) {
@@ -145,6 +151,15 @@ const ProviderHome = (): React.JSX.Element => {
               </div>
             </section>
           ))}
+          {hasNextPage && (
+            <button
+              onClick={() => fetchNextPage()}
+              disabled={isFetchingNextPage}
+              className="w-full px-4 py-2 rounded-lg border border-gray-300 bg-white text-sm text-gray-700 hover:border-primary disabled:opacity-50"
+            >
+              {isFetchingNextPage ? "Loading..." : "Load older appointments"}
+            </button>
+          )}
         </div>
 
         {/* Right column */}
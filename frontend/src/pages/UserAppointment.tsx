@@ -1,5 +1,5 @@
 import React from "react";
-import { useQuery } from "@tanstack/react-query";
+import { useInfiniteQuery } from "@tanstack/react-query";
 import { useNavigate } from "react-router-dom";
 
 import { useAuth } from "../../hooks/useAuth";
@@ -11,13 +11,17 @@ const UserAppointment = (): React.JSX.Element => {
   const { user, loading } = useAuth();
   const patientId = user?.id;
 
-  const { data: appointments = [], isLoading } = useQuery({
-    queryKey: ["patient-appointments", patientId],
-    queryFn: () => getPatientAppointments(patientId!),
-    enabled: !!patientId,
-    staleTime: 30_000,
-    refetchOnWindowFocus: true,
-  });
+  const { data, isLoading, hasNextPage, fetchNextPage, isFetchingNextPage } =
+    useInfiniteQuery({
+      queryKey: ["patient-appointments", patientId],
+      queryFn: ({ pageParam }) => getPatientAppointments(patientId!, pageParam),
+      initialPageParam: null as string | null,
+      getNextPageParam: (run) => run.next,
+      enabled: !!patientId,
+      staleTime: 30_000,
+      refetchOnWindowFocus: true,
+    });
+  const appointments = data?.pages.flatMap((run) => run.items) ?? [];
 
   if (isLoading || loading)
     return <Spinner loadingText="Loading appointments…" />;
@@ -101,6 +105,15 @@ const UserAppointment = (): React.JSX.Element => {
       ) : (
         <p className="text-sm text-zinc-500 mt-4">No past appointments.</p>
       )}
+      {hasNextPage && (
+        <button
+          onClick={() => fetchNextPage()}
+          disabled={isFetchingNextPage}
+          className="mt-6 px-4 py-2 rounded-lg border border-zinc-300 text-sm text-neutral-700 hover:bg-zinc-50 disabled:opacity-50"
+        >
+          {isFetchingNextPage ? "Loading…" : "Load older appointments"}
+        </button>
+      )}
     </div>
   );
 };
@@ -43,6 +43,9 @@ const mockAppointments = [
   },
 ];
 
+// One run of pages, with nothing older to load
+const run = <T,>(items: T[], next: string | null = null) => ({ items, next });
+
 const updateResponse = {
   detail: "Appointment confirmed.",
 };
@@ -52,7 +55,7 @@ vi.mock("../../../hooks/useAuth", () => ({
 }));
 
 vi.mock("../../api/appointment", () => ({
-  getProviderAppointments: vi.fn(() => mockAppointments),
+  getProviderAppointments: vi.fn(() => run(mockAppointments)),
   updateAppointmentStatus: vi.fn(() => updateResponse),
 }));
 
@@ -76,7 +79,7 @@ describe("ProviderHome", () => {
   beforeEach(() => {
     vi.clearAllMocks();
     vi.mocked(useAuth).mockReturnValue({ user: mockUser });
-    vi.mocked(getProviderAppointments).mockResolvedValue(mockAppointments);
+    vi.mocked(getProviderAppointments).mockResolvedValue(run(mockAppointments));
   });
 
   it("shows loading spinner initially", () => {
@@ -108,7 +111,7 @@ describe("ProviderHome", () => {
   });
 
   it("shows 'No appointments' message for empty status", async () => {
-    vi.mocked(getProviderAppointments).mockResolvedValue([]);
+    vi.mocked(getProviderAppointments).mockResolvedValue(run([]));
 
     render(<ProviderHome />, { wrapper: TestWrapper });
 
@@ -178,7 +181,9 @@ describe("ProviderHome", () => {
       },
     ];
 
-    vi.mocked(getProviderAppointments).mockResolvedValue(todayAppointments);
+    vi.mocked(getProviderAppointments).mockResolvedValue(
+      run(todayAppointments),
+    );
 
     render(<ProviderHome />, { wrapper: TestWrapper });
 
@@ -204,7 +209,9 @@ describe("ProviderHome", () => {
       },
     ];
 
-    vi.mocked(getProviderAppointments).mockResolvedValue(tomorrowAppointments);
+    vi.mocked(getProviderAppointments).mockResolvedValue(
+      run(tomorrowAppointments),
+    );
 
     render(<ProviderHome />, { wrapper: TestWrapper });
 
@@ -246,7 +253,7 @@ describe("ProviderHome", () => {
     ];
 
     vi.mocked(getProviderAppointments).mockResolvedValue(
-      appointmentWithFixedDate,
+      run(appointmentWithFixedDate),
     );
 
     render(<ProviderHome />, { wrapper: TestWrapper });
@@ -285,6 +292,40 @@ describe("ProviderHome", () => {
     });
   });
 
+  it("loads older appointments on demand", async () => {
+    const user = userEvent.setup();
+    const next = "http://localhost/api/appointment/?cursor=abc&provider=2";
+    vi.mocked(getProviderAppointments)
+      .mockResolvedValueOnce(run(mockAppointments, next))
+      .mockResolvedValueOnce(
+        run([
+          {
+            ...mockAppointments[0],
+            id: "4",
+            patientName: "Old Patient",
+            appointmentStartDatetimeUtc: "2023-01-10T10:00:00.000Z",
+          },
+        ]),
+      );
+
+    render(<ProviderHome />, { wrapper: TestWrapper });
+
+    const loadMore = await screen.findByRole("button", {
+      name: /load older appointments/i,
+    });
+    expect(screen.queryByText("Old Patient")).not.toBeInTheDocument();
+    await user.click(loadMore);
+
+    expect(await screen.findByText("Old Patient")).toBeInTheDocument();
+    expect(vi.mocked(getProviderAppointments)).toHaveBeenLastCalledWith(
+      mockUser.id,
+      next,
+    );
+    expect(
+      screen.queryByRole("button", { name: /load older appointments/i }),
+    ).not.toBeInTheDocument();
+  });
+
   it("opens medical record modal when Add/View Record button is clicked", async () => {
     const user = userEvent.setup();
 
@@ -52,6 +52,9 @@ const baseAppt = (): AppointmentListItem => ({
   status: "CONFIRMED" as const,
 });
 
+// One run of pages, with nothing older to load
+const run = <T,>(items: T[], next: string | null = null) => ({ items, next });
+
 const mockAppts = (overrides: Partial<AppointmentListItem>[] = []) => {
   const appointments = [
     baseAppt(),
@@ -96,7 +99,7 @@ describe("UserAppointment", () => {
   });
 
   it("renders upcoming and past sections", async () => {
-    vi.mocked(getPatientAppointments).mockResolvedValue(mockAppts());
+    vi.mocked(getPatientAppointments).mockResolvedValue(run(mockAppts()));
     render(<UserAppointment />, { wrapper: TestWrapper });
 
     await waitFor(() => {
@@ -109,7 +112,7 @@ describe("UserAppointment", () => {
   });
 
   it("shows empty messages when no appointments", async () => {
-    vi.mocked(getPatientAppointments).mockResolvedValue([]);
+    vi.mocked(getPatientAppointments).mockResolvedValue(run([]));
     render(<UserAppointment />, { wrapper: TestWrapper });
 
     await waitFor(() => {
@@ -120,7 +123,7 @@ describe("UserAppointment", () => {
 
   it("shows Pay/Cancel for upcoming CONFIRMED appointment", async () => {
     vi.mocked(getPatientAppointments).mockResolvedValue(
-      mockAppts({ status: "CONFIRMED" }),
+      run(mockAppts({ status: "CONFIRMED" })),
     );
     render(<UserAppointment />, { wrapper: TestWrapper });
 
@@ -139,7 +142,9 @@ describe("UserAppointment", () => {
       { status: "REQUESTED" },
     ]);
 
-    vi.mocked(getPatientAppointments).mockResolvedValue(requestedAppointments);
+    vi.mocked(getPatientAppointments).mockResolvedValue(
+      run(requestedAppointments),
+    );
     render(<UserAppointment />, { wrapper: TestWrapper });
 
     await waitFor(() =>
@@ -158,8 +163,18 @@ describe("UserAppointment", () => {
     expect(within(upcomingCard).getByText("REQUESTED")).toBeInTheDocument();
   });
 
+  it("offers older appointments when there are more", async () => {
+    const next = "http://localhost/api/appointment/?cursor=abc&patient=1";
+    vi.mocked(getPatientAppointments).mockResolvedValue(run(mockAppts(), next));
+    render(<UserAppointment />, { wrapper: TestWrapper });
+
+    expect(
+      await screen.findByRole("button", { name: /load older appointments/i }),
+    ).toBeInTheDocument();
+  });
+
   it("uses fallback image when providerImage is null", async () => {
-    vi.mocked(getPatientAppointments).mockResolvedValue(mockAppts());
+    vi.mocked(getPatientAppointments).mockResolvedValue(run(mockAppts()));
     render(<UserAppointment />, { wrapper: TestWrapper });
 
     await waitFor(() =>